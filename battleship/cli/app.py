@@ -4,13 +4,14 @@ import pydantic
 import typer
 
 from battleship import get_client_version, tui
-from battleship.cli import account, logging, play, settings
+from battleship.cli import account, logging, play, settings, tournament
 from battleship.tui import di
 
 app = typer.Typer(name="Battleship TUI")
 app.add_typer(account.app, name="account")
 app.add_typer(play.app, name="play")
 app.add_typer(settings.app, name="settings")
+app.command(name="tournament")(tournament.tournament)
 
 SENTRY_DSN = "https://e2b5c0eacebf1c8465e440575e4151d1@o579215.ingest.us.sentry.io/4507262636654592"
 
@@ -6,6 +6,7 @@ import typer
 from battleship import tui
 from battleship.cli.console import get_console
 from battleship.client import CredentialsProvider
+from battleship.engine.ai import Targeting
 from battleship.engine.domain import FiringOrder
 from battleship.shared.compat import StrEnum
 from battleship.tui.di import container
@@ -34,8 +35,13 @@ def single(
     no_adjacent_ships: Annotated[
         bool, typer.Option("--no-adjacent-ships", help="Forbid adjacent ships.")
     ] = False,
+    targeting: Annotated[
+        Targeting, typer.Option(help="Choose how the computer picks targets.")
+    ] = Targeting.HUNT,
 ) -> None:
-    tui_app = tui.BattleshipApp.singleplayer(roster, firing_order, salvo_mode, no_adjacent_ships)
+    tui_app = tui.BattleshipApp.singleplayer(
+        roster, firing_order, salvo_mode, no_adjacent_ships, targeting
+    )
 
     tui.run(tui_app, ctx.obj["debug"])
 
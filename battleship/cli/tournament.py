@@ -0,0 +1,98 @@
+from functools import partial
+from typing import Annotated, Optional
+
+import typer
+from rich.table import Table
+
+from battleship.cli.console import get_console
+from battleship.cli.play import Roster
+from battleship.engine import ai, simulation
+from battleship.engine.domain import FiringOrder
+
+console = get_console()
+
+
+def make_contender(targeting: ai.Targeting) -> simulation.Contender:
+    return simulation.Contender(name=targeting, caller=partial(ai.make_target_caller, targeting))
+
+
+def make_standings_table(report: simulation.TournamentReport) -> Table:
+    table = Table(caption=f"{report.games} games, {report.games_per_second:.0f} games/s")
+
+    table.add_column("Bot")
+    table.add_column("Games", justify="right")
+    table.add_column("Wins", justify="right")
+    table.add_column("Win rate (95% CI)", justify="right")
+    table.add_column("Shots to win (95% CI)", justify="right")
+
+    for name, score in report.standings().items():
+        win_low, win_high = score.win_rate_interval
+        shots_low, shots_high = score.mean_shots_to_win_interval
+        table.add_row(
+            name,
+            str(score.games),
+            str(score.wins),
+            f"{score.win_rate:.1%} ({win_low:.1%}-{win_high:.1%})",
+            f"{score.mean_shots_to_win:.2f} ({shots_low:.2f}-{shots_high:.2f})",
+        )
+
+    return table
+
+
+def tournament(
+    bots: Annotated[
+        Optional[list[ai.Targeting]],
+        typer.Option("--bot", help="Add a bot to the tournament (default: all bots)."),
+    ] = None,
+    games: Annotated[
+        int, typer.Option(min=1, help="Number of games each pair of bots plays per ruleset.")
+    ] = 1000,
+    roster: Annotated[
+        Roster, typer.Option(help="Choose ships that make up a fleet.")
+    ] = Roster.CLASSIC,
+    firing_order: Annotated[
+        FiringOrder, typer.Option(help="Choose firing order.")
+    ] = FiringOrder.ALTERNATELY,
+    salvo_mode: Annotated[bool, typer.Option("--salvo", help="Enable salvo mode.")] = False,
+    no_adjacent_ships: Annotated[
+        bool, typer.Option("--no-adjacent-ships", help="Forbid adjacent ships.")
+    ] = False,
+    all_rules: Annotated[
+        bool,
+        typer.Option("--all-rules", help="Play every combination of rosters and game options."),
+    ] = False,
+    seed: Annotated[int, typer.Option(help="Seed of the first game.")] = 0,
+    workers: Annotated[
+        Optional[int], typer.Option(min=1, help="Number of processes (default: all cores).")
+    ] = None,
+    shard_size: Annotated[
+        int, typer.Option(min=1, help="Number of games a process plays in one go.")
+    ] = 1000,
+) -> None:
+    """
+    Play a round-robin tournament between computer players, without the TUI.
+    """
+    # A bot passed twice plays the tournament once.
+    targetings: dict[ai.Targeting, None] = dict.fromkeys(bots or ai.Targeting)
+    contenders = [make_contender(targeting) for targeting in targetings]
+
+    if len(contenders) < 2:
+        console.error("A tournament needs at least two different bots.")
+        raise typer.Exit(1)
+
+    if all_rules:
+        rules = simulation.Rules.all()
+    else:
+        rules = [simulation.Rules(roster, firing_order, salvo_mode, no_adjacent_ships)]
+
+    with console.status(f"Playing {games * len(rules)} games per pair of bots..."):
+        report = simulation.run_tournament(
+            contenders,
+            rules,
+            games=games,
+            seed=seed,
+            workers=workers,
+            shard_size=shard_size,
+        )
+
+    console.print(make_standings_table(report))
@@ -21,6 +21,7 @@ from battleship.client.websocket import (
     ConnectionRejected,
     connect,
 )
+from battleship.shared import wire
 from battleship.shared.compat import StrEnum
 from battleship.shared.events import (
     AnyMessage,
@@ -33,6 +34,8 @@ from battleship.shared.events import (
 from battleship.shared.models import (
     Action,
     IDToken,
+    LeaderboardCategory,
+    LeaderboardPage,
     LoginData,
     PlayerCount,
     PlayerStatistics,
@@ -98,12 +101,16 @@ class Client:
         refresh_interval: int = 20,
         http_timeout: int = 20,
         ws_timeout: int = 15,
+        binary_protocol: bool = True,
     ) -> None:
         parsed_url = urlparse(server_url)
         self._netloc = parsed_url.netloc
         self._scheme = parsed_url.scheme
         self._ws: Optional[WebSocketClientProtocol] = None
         self._ws_timeout = ws_timeout
+        # Use the compact binary protocol if the server supports it.
+        self._subprotocols = [wire.SUBPROTOCOL] if binary_protocol else []
+        self._binary = False
         self._emitter = EventEmitter()
         self.credentials: Credentials | None = None
         self.auth = IDTokenAuth()
@@ -120,6 +127,8 @@ class Client:
         self._refresh_event = RefreshEvent()
         self._refresh_event.done()  # TODO: Replace with asyncio.Event?
         self._events_worker_task: Task[None] | None = None
+        # Last ETag and response body of resources the lobby polls.
+        self._etags: dict[str, tuple[str, Any]] = {}
         self._credentials_worker_task: Task[None] | None = None
 
     @property
@@ -262,16 +271,22 @@ class Client:
         await self._request("DELETE", f"/sessions/{session_id}")
 
     async def fetch_sessions(self) -> list[Session]:
-        response = await self._request("GET", "/sessions")
-        return [Session(**data) for data in response.json()]
+        return [Session(**data) for data in await self._get_json("/sessions")]
 
     async def fetch_statistics(self) -> PlayerStatistics:
         response = await self._request("GET", f"/statistics/{self.nickname}")
         return PlayerStatistics(**response.json())
 
+    async def fetch_leaderboard(
+        self, category: LeaderboardCategory, offset: int = 0, limit: int = 20
+    ) -> LeaderboardPage:
+        response = await self._request(
+            "GET", f"/leaderboard/{category}?offset={offset}&limit={limit}"
+        )
+        return LeaderboardPage(**response.json())
+
     async def fetch_players_online(self) -> PlayerCount:
-        response = await self._request("GET", "/players/online")
-        return PlayerCount(**response.json())
+        return PlayerCount(**await self._get_json("/players/online"))
 
     async def sessions_subscribe(self) -> SessionSubscription:
         def disconnect_update_listener() -> None:
@@ -367,6 +382,7 @@ class Client:
                     "X-Client-Version": get_client_version(),
                 },
                 timeout=self._ws_timeout,
+                subprotocols=self._subprotocols,
             ):
                 yield connection
         except ConnectionRejected:
@@ -383,12 +399,17 @@ class Client:
                 logger.debug("Acquired new WebSocket connection.")
                 self._emitter.emit_future(ConnectionEvent.CONNECTION_ESTABLISHED)
                 self._ws = connection
+                self._binary = connection.subprotocol == wire.SUBPROTOCOL
 
                 try:
                     async for ws_message in connection:
-                        message: Message[GameEvent] | Message[NotificationEvent] = Message.from_raw(
-                            ws_message
-                        )
+                        message: Message[GameEvent] | Message[NotificationEvent]
+
+                        if isinstance(ws_message, bytes):
+                            message = wire.decode(ws_message)  # type: ignore[assignment]
+                        else:
+                            message = Message.from_raw(ws_message)
+
                         logger.debug("Received WebSocket message: {message}.", message=message)
                         event: GameEvent | NotificationEvent = message.unwrap()
 
@@ -428,7 +449,10 @@ class Client:
             logger.warning("Trying to send a message, but connection is closed.")
             return
 
-        await self._ws.send(message.to_json())
+        if self._binary:
+            await self._ws.send(wire.encode(message))
+        else:
+            await self._ws.send(message.to_json())
 
     async def _request(
         self,
@@ -436,13 +460,14 @@ class Client:
         url: str,
         json: Any | None = None,
         ensure_not_refreshing: bool = True,
+        headers: dict[str, str] | None = None,
     ) -> Response:
         if ensure_not_refreshing:
             logger.debug("Ensure token refresh is not in process. Wait for event.")
             await self._refresh_event.wait()
 
         try:
-            response = await self._session.request(method, url, json=json)
+            response = await self._session.request(method, url, json=json, headers=headers)
             response.raise_for_status()
         except httpx.RequestError as exc:
             logger.warning("HTTP request error occured: {exc}", exc=repr(exc))
@@ -458,6 +483,25 @@ class Client:
         else:
             return response
 
+    async def _get_json(self, url: str) -> Any:
+        """
+        Fetches a resource tagged by the server with an ETag. If it hasn't
+        changed since the last request, the server doesn't send it again.
+        """
+        etag, data = self._etags.get(url, (None, None))
+        headers = {"If-None-Match": etag} if etag else None
+        response = await self._request("GET", url, headers=headers)
+
+        if response.status_code == 304:
+            return data
+
+        data = response.json()
+
+        if etag := response.headers.get("ETag"):
+            self._etags[url] = etag, data
+
+        return data
+
     async def _credentials_worker(self) -> None:
         logger.debug("Start credentials worker.")
 
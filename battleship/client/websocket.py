@@ -1,4 +1,4 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 import websockets
@@ -10,6 +10,7 @@ from tenacity import (
     stop_after_delay,
     wait_fixed,
 )
+from websockets.typing import Subprotocol
 
 
 class ConnectionRejected(RuntimeError):
@@ -34,7 +35,10 @@ def not_status_code_403(exc: BaseException) -> bool:
 
 
 async def connect(
-    url: str, extra_headers: dict[str, Any], timeout: float
+    url: str,
+    extra_headers: dict[str, Any],
+    timeout: float,
+    subprotocols: Sequence[str] = (),
 ) -> AsyncIterator[websockets.WebSocketClientProtocol]:
     while True:
         retrier = AsyncRetrying(
@@ -53,6 +57,7 @@ async def connect(
                     connection = await websockets.connect(
                         url,
                         extra_headers=extra_headers,
+                        subprotocols=[Subprotocol(protocol) for protocol in subprotocols] or None,
                         close_timeout=1,
                         ping_timeout=2,
                         ping_interval=5,
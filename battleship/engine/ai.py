@@ -1,11 +1,28 @@
+import abc
 import random
-from collections import deque
-from typing import Iterable
+from collections import Counter, deque
+from typing import Iterable, Iterator
 
-from battleship.engine import domain, errors, rosters
+from battleship.engine import domain, errors, geometry, rosters
+from battleship.shared.compat import StrEnum
 
 
-class TargetCaller:
+class Targeting(StrEnum):
+    HUNT = "hunt"
+    DENSITY = "density"
+
+
+class BaseTargetCaller(abc.ABC):
+    @abc.abstractmethod
+    def call_out(self, *, count: int = 1) -> list[str]:
+        pass
+
+    @abc.abstractmethod
+    def provide_feedback(self, shots: Iterable[domain.Shot]) -> None:
+        pass
+
+
+class TargetCaller(BaseTargetCaller):
     def __init__(self, board: domain.Board) -> None:
         self.board = board
         self.next_targets: deque[domain.Cell] = deque()
@@ -33,13 +50,20 @@ class TargetCaller:
             targets.append(next_target)
 
         if len(targets) != count:
-            random_targets = self._find_random_targets(count - len(targets))
+            random_targets = self._find_random_targets(count - len(targets), exclude=targets)
             targets.extend(random_targets)
 
         return targets
 
-    def _find_random_targets(self, count: int) -> list[domain.Cell]:
-        candidates = [cell for cell in self.board.cells if not cell.is_shot]
+    def _find_random_targets(
+        self, count: int, exclude: Iterable[domain.Cell] = ()
+    ) -> list[domain.Cell]:
+        excluded = {cell.coordinate for cell in exclude}
+        candidates = [
+            cell
+            for cell in self.board.cells
+            if not cell.is_shot and cell.coordinate not in excluded
+        ]
         return random.sample(candidates, k=min(len(candidates), count))
 
     def _find_neighbor_cells(self, cell: domain.Cell) -> list[domain.Cell]:
@@ -56,51 +80,320 @@ class TargetCaller:
         return cells
 
 
+class PlacementPool:
+    """
+    Placements of one ship length that are still legal on a board.
+    Blocking cells removes every placement that covers them, drawing
+    a uniformly random placement takes constant time.
+    """
+
+    def __init__(self, index: geometry.PlacementIndex) -> None:
+        self.index = index
+        self.blocked = 0
+        self._ids = list(range(len(index.placements)))
+        self._positions = list(range(len(index.placements)))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[geometry.Placement]:
+        return (self.index.placements[i] for i in self._ids)
+
+    def __contains__(self, placement_id: int) -> bool:
+        return self._positions[placement_id] != -1
+
+    def block(self, mask: int) -> list[geometry.Placement]:
+        """
+        Blocks given cells and returns placements that became illegal.
+        """
+        new_cells = mask & ~self.blocked
+        self.blocked |= mask
+        removed = []
+
+        while new_cells:
+            cell = new_cells & -new_cells
+            new_cells ^= cell
+
+            for placement_id in self.index.by_cell[cell.bit_length() - 1]:
+                if self._remove(placement_id):
+                    removed.append(self.index.placements[placement_id])
+
+        return removed
+
+    def choice(self) -> geometry.Placement:
+        return self.index.placements[random.choice(self._ids)]
+
+    def _remove(self, placement_id: int) -> bool:
+        position = self._positions[placement_id]
+
+        if position == -1:
+            return False
+
+        last_id = self._ids.pop()
+
+        if last_id != placement_id:
+            self._ids[position] = last_id
+            self._positions[last_id] = position
+
+        self._positions[placement_id] = -1
+        return True
+
+
+class DensityTargetCaller(BaseTargetCaller):
+    """
+    Calls out cells covered by the largest number of ship placements
+    that are still consistent with the feedback received so far.
+
+    While no wounded ship is known (hunt mode), every legal placement of
+    every ship still afloat counts once per covered cell. The counts are
+    kept up to date incrementally: a miss or a sunk ship only subtracts
+    the placements it rules out. Once a ship is hit (target mode), only
+    placements passing through unresolved hits are counted, weighted by
+    the number of hits they explain.
+    """
+
+    def __init__(
+        self,
+        board: domain.Board,
+        roster: rosters.Roster,
+        no_adjacent_ships: bool = False,
+    ) -> None:
+        self.board = board
+        self.no_adjacent_ships = no_adjacent_ships
+        self.geometry = geometry.get_geometry(board.size)
+        self.shot = 0
+        self.hits = 0
+        self.remaining = Counter(item.hp for item in roster)
+        self._pools = {
+            hp: PlacementPool(geometry.get_placement_index(board.size, hp)) for hp in self.remaining
+        }
+        # Legal placements of every ship length covering each cell. Sinking
+        # a ship then costs a pass over the cells, not over its placements.
+        self._coverage = {
+            hp: [len(placement_ids) for placement_ids in pool.index.by_cell]
+            for hp, pool in self._pools.items()
+        }
+        self.density = [
+            sum(self.remaining[hp] * coverage[i] for hp, coverage in self._coverage.items())
+            for i in range(board.size * board.size)
+        ]
+
+    def call_out(self, *, count: int = 1) -> list[str]:
+        """
+        Selects a salvo of `count` targets jointly. Targets are picked one by
+        one, each time assuming that the targets picked before missed, so a
+        salvo spreads over different candidate ship positions instead of
+        spending several shots on the same one.
+        """
+        density = self.density.copy()
+        focus = self._get_target_scores()
+        candidates = [i for i in range(len(density)) if not self.shot >> i & 1]
+        ruled_out: set[tuple[int, int]] = set()
+        targets = []
+
+        # Cells that can finish off a wounded ship go first, the hunt density
+        # breaks ties and takes over when there is nothing to finish.
+        for _ in range(min(count, len(candidates))):
+            best = max((focus[i], density[i]) for i in candidates)
+            target = random.choice([i for i in candidates if (focus[i], density[i]) == best])
+            candidates.remove(target)
+            targets.append(target)
+            self._assume_miss(target, density, focus, ruled_out)
+
+        coordinates = domain.get_coordinates(self.board.size)
+        return [coordinates[i].to_human() for i in targets]
+
+    def provide_feedback(self, shots: Iterable[domain.Shot]) -> None:
+        misses = 0
+        sunk: dict[int, domain.Ship] = {}
+
+        for shot in shots:
+            bit = self.board.get_mask([shot.coordinate])
+            self.shot |= bit
+
+            if not shot.hit:
+                misses |= bit
+            elif shot.ship is not None and shot.ship.destroyed:
+                sunk[id(shot.ship)] = shot.ship
+            else:
+                self.hits |= bit
+
+        if misses:
+            self._block(misses)
+
+        for ship in sunk.values():
+            self._sink(ship)
+
+    def _get_target_scores(self) -> list[int]:
+        scores = [0] * len(self.density)
+        hits = self.hits
+
+        if not hits:
+            return scores
+
+        for hp, pool in self._pools.items():
+            if not self.remaining[hp]:
+                continue
+
+            seen: set[int] = set()
+            cells = hits
+
+            while cells:
+                cell = cells & -cells
+                cells ^= cell
+
+                for placement_id in pool.index.by_cell[cell.bit_length() - 1]:
+                    if placement_id in seen or placement_id not in pool:
+                        continue
+
+                    seen.add(placement_id)
+                    placement = pool.index.placements[placement_id]
+                    weight = (placement.mask & hits).bit_count() * self.remaining[hp]
+
+                    for i in placement.cells:
+                        scores[i] += weight
+
+        return scores
+
+    def _assume_miss(
+        self,
+        cell: int,
+        density: list[int],
+        focus: list[int],
+        ruled_out: set[tuple[int, int]],
+    ) -> None:
+        for hp, pool in self._pools.items():
+            weight = self.remaining[hp]
+
+            if not weight:
+                continue
+
+            for placement_id in pool.index.by_cell[cell]:
+                if placement_id not in pool or (hp, placement_id) in ruled_out:
+                    continue
+
+                ruled_out.add((hp, placement_id))
+                placement = pool.index.placements[placement_id]
+                hit_weight = (placement.mask & self.hits).bit_count() * weight
+
+                for i in placement.cells:
+                    density[i] -= weight
+                    focus[i] -= hit_weight
+
+    def _sink(self, ship: domain.Ship) -> None:
+        mask = self.board.get_mask(ship.cells)
+        self.hits &= ~mask
+        self.shot |= mask
+        self._block(self.geometry.halo(mask) if self.no_adjacent_ships else mask)
+        hp = len(ship.cells)
+
+        if self.remaining[hp]:
+            self.remaining[hp] -= 1
+            density = self.density
+
+            for i, covered in enumerate(self._coverage[hp]):
+                density[i] -= covered
+
+    def _block(self, mask: int) -> None:
+        density = self.density
+
+        for hp, pool in self._pools.items():
+            weight = self.remaining[hp]
+            coverage = self._coverage[hp]
+
+            for placement in pool.block(mask):
+                for i in placement.cells:
+                    coverage[i] -= 1
+                    density[i] -= weight
+
+
+def make_target_caller(
+    targeting: Targeting,
+    board: domain.Board,
+    roster: rosters.Roster,
+    no_adjacent_ships: bool,
+) -> BaseTargetCaller:
+    if targeting == Targeting.DENSITY:
+        return DensityTargetCaller(board, roster, no_adjacent_ships)
+
+    return TargetCaller(board)
+
+
 class Autoplacer:
+    MAX_ATTEMPTS = 10_000
+
     def __init__(self, board: domain.Board, ship_suite: rosters.Roster, no_adjacent_ships: bool):
         self.board = board
+        self.ship_suite = ship_suite
         self.ship_hp_map: dict[rosters.ShipType, rosters.ShipHitpoints] = dict(
             (item.type, item.hp) for item in ship_suite
         )
         self.no_adjacent_ships = no_adjacent_ships
+        self._pools: dict[rosters.ShipHitpoints, PlacementPool] = {}
 
     def place(self, ship_type: rosters.ShipType) -> list[domain.Coordinate]:
+        """
+        Finds a uniformly random legal position for a ship of this type,
+        considering ships already placed on the board.
+        """
         ship_hp = self.ship_hp_map[ship_type]
-        position: list[domain.Coordinate] = []
-        empty_cells = [cell for cell in self.board.cells if cell.ship is None]
-        directions = list[domain.Direction](domain.Direction)
-        random.shuffle(empty_cells)
-        random.shuffle(directions)
-
-        for cell in empty_cells:  # Get next random cell.
-            for direction in directions:  # Get next random direction.
-                start_cell = cell  # For every direction, build from this random cell.
-
-                # Try to found enough empty cells to place the ship in this direction.
-                for _ in range(ship_hp):
-                    # Get the next cell in this direction.
-                    next_cell = self.board.get_adjacent_cell(start_cell, direction)
-
-                    # If there is no cell or the cell is taken,
-                    # clear the progress and try another direction.
-                    if next_cell is None or next_cell.ship is not None:
-                        position.clear()
-                        break
-
-                    # Otherwise, save the coordinate.
-                    position.append(next_cell.coordinate)
-
-                    # If there is enough cells to place the ship, return the position.
-                    if len(position) == ship_hp:
-                        # If there's a flag set, check for adjacent ships.
-                        if self.no_adjacent_ships and any(
-                            self.board.has_adjacent_ship(c) for c in position
-                        ):
-                            continue
-
-                        return position
-
-                    # Otherwise, move forward in this direction.
-                    start_cell = next_cell
-
-        raise errors.CannotPlaceShip(f"Cannot find suitable position for {ship_type}.")
+
+        if (pool := self._pools.get(ship_hp)) is None:
+            index = geometry.get_placement_index(self.board.size, ship_hp)
+            pool = self._pools[ship_hp] = PlacementPool(index)
+
+        pool.block(self._get_blocked(self.board.occupied))
+
+        if not len(pool):
+            raise errors.CannotPlaceShip(f"Cannot find suitable position for {ship_type}.")
+
+        return self._to_coordinates(pool.choice())
+
+    def place_fleet(self) -> dict[rosters.ShipId, list[domain.Coordinate]]:
+        """
+        Finds positions for the whole roster at once. If the random choice
+        for some ship leaves no room for the rest of the fleet, backtracks
+        and tries another one instead of giving up.
+        """
+        items = sorted(self.ship_suite, key=lambda item: item.hp, reverse=True)
+        attempts = self.MAX_ATTEMPTS
+
+        def arrange(item_index: int, blocked: int) -> list[geometry.Placement] | None:
+            nonlocal attempts
+
+            if item_index == len(items):
+                return []
+
+            index = geometry.get_placement_index(self.board.size, items[item_index].hp)
+            candidates = [p for p in index.placements if not p.mask & blocked]
+            random.shuffle(candidates)
+
+            for placement in candidates:
+                if attempts == 0:
+                    break
+
+                attempts -= 1
+                rest = arrange(item_index + 1, blocked | self._get_blocked(placement.mask))
+
+                if rest is not None:
+                    return [placement, *rest]
+
+            return None
+
+        placements = arrange(0, self._get_blocked(self.board.occupied))
+
+        if placements is None:
+            raise errors.CannotPlaceShip(f"Cannot find suitable position for {self.ship_suite}.")
+
+        positions = {item.id: self._to_coordinates(p) for item, p in zip(items, placements)}
+        return {item.id: positions[item.id] for item in self.ship_suite}
+
+    def _get_blocked(self, occupied: int) -> int:
+        if self.no_adjacent_ships:
+            return self.board.geometry.halo(occupied)
+
+        return occupied
+
+    def _to_coordinates(self, placement: geometry.Placement) -> list[domain.Coordinate]:
+        coordinates = domain.get_coordinates(self.board.size)
+        return [coordinates[cell] for cell in placement.cells]
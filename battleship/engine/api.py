@@ -1,6 +1,6 @@
 from typing import cast
 
-from battleship.engine.domain import FiringOrder, Game, Player
+from battleship.engine.domain import Board, FiringOrder, Game, Player
 from battleship.engine.rosters import Roster
 
 
@@ -15,6 +15,8 @@ def create_game(
     firing_order: str,
     salvo_mode: bool,
     no_adjacent_ships: bool,
+    board_type: type[Board] = Board,
+    sync_events: bool = False,
 ) -> Game:
     if not is_firing_order(firing_order):
         raise TypeError(f"Firing order {firing_order} is invalid.")
@@ -22,10 +24,11 @@ def create_game(
     firing_order = cast(FiringOrder, firing_order)
 
     return Game(
-        player_a=Player(player_a),
-        player_b=Player(player_b),
+        player_a=Player(player_a, board_type()),
+        player_b=Player(player_b, board_type()),
         roster=roster,
         firing_order=firing_order,
         salvo_mode=salvo_mode,
         no_adjacent_ships=no_adjacent_ships,
+        sync_events=sync_events,
     )
@@ -1,18 +1,22 @@
 import dataclasses
 import enum
+import inspect
 import itertools
 import random
+import struct
+from collections import Counter
 from collections.abc import Awaitable, Callable
-from functools import cached_property
-from itertools import cycle, pairwise
-from typing import Collection, Iterable, Iterator, TypeVar
+from functools import cache, cached_property
+from typing import Any, Collection, Iterable, Iterator, TypeVar
 
 from pymitter import EventEmitter  # type: ignore[import-untyped]
 
 from battleship.engine import errors, rosters
+from battleship.engine.geometry import get_geometry
 from battleship.shared.compat import StrEnum
 
 DEFAULT_BOARD_SIZE = 10
+MAX_BOARD_SIZE = 26  # One column per letter.
 ASCII_OFFSET = 64
 
 
@@ -34,29 +38,87 @@ class Ship:
     type: str
     hp: int
     cells: list["Coordinate"] = dataclasses.field(default_factory=list, compare=False)
+    # The board this ship is placed on, it keeps fleet counters up to date.
+    board: "Board | None" = dataclasses.field(default=None, compare=False, repr=False)
 
     @property
     def destroyed(self) -> bool:
         return self.hp == 0
 
-    def damage(self) -> None:
-        if not self.destroyed:
+    def damage(self, hits: int = 1) -> None:
+        for _ in range(min(hits, self.hp)):
             self.hp -= 1
 
+            if self.board is not None:
+                self.board.on_ship_damaged(self)
+
 
-@dataclasses.dataclass
 class Coordinate:
+    """
+    An immutable board coordinate.
+
+    Coordinates that fit the largest possible board (plus a one-cell
+    margin around it, so neighbours of edge cells are covered too) are
+    interned: constructing, parsing and moving to a neighbour return
+    shared instances from a lookup table, and equality is usually
+    decided by identity.
+    """
+
+    __slots__ = ("x", "y", "_human")
+
     x: int
     y: int
+    _human: str | None
+
+    def __new__(cls, x: int, y: int) -> "Coordinate":
+        coordinate = _interned.get((x, y))
+
+        if coordinate is None:
+            coordinate = cls._make(x, y)
+
+        return coordinate
+
+    @classmethod
+    def _make(cls, x: int, y: int) -> "Coordinate":
+        coordinate = object.__new__(cls)
+        object.__setattr__(coordinate, "x", x)
+        object.__setattr__(coordinate, "y", y)
+        object.__setattr__(coordinate, "_human", None)
+        return coordinate
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self) -> tuple[type["Coordinate"], tuple[int, int]]:
+        return Coordinate, (self.x, self.y)
+
+    def __copy__(self) -> "Coordinate":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "Coordinate":
+        return self
+
+    def __repr__(self) -> str:
+        return f"Coordinate(x={self.x}, y={self.y})"
+
+    def __hash__(self) -> int:
+        # Hashed as the human-readable form, which equals the coordinate too.
+        return hash(self.to_human())
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, str):
-            return self.to_human() == other
+        if self is other:
+            return True
 
         if isinstance(other, Coordinate):
-            return (self.x, self.y) == (other.x, other.y)
+            return self.x == other.x and self.y == other.y
 
-        raise NotImplementedError(f"Cannot compare Coordinate to {other.__class__.__name__}.")
+        if isinstance(other, str):
+            return self.to_human() == other
+
+        return NotImplemented
 
     def up(self) -> "Coordinate":
         return Coordinate(self.x, self.y - 1)
@@ -80,11 +142,44 @@ class Coordinate:
 
     @classmethod
     def from_human(cls, coordinate: str) -> "Coordinate":
-        col, row = parse_coordinate(coordinate)
-        return Coordinate(ord(col) - ASCII_OFFSET - 1, row - 1)
+        try:
+            return _interned_human[coordinate]
+        except (KeyError, TypeError):
+            col, row = parse_coordinate(coordinate)
+            return Coordinate(ord(col) - ASCII_OFFSET - 1, row - 1)
 
     def to_human(self) -> str:
-        return f"{self.col}{self.row}"
+        human = self._human
+
+        if human is None:
+            human = f"{self.col}{self.row}"
+            object.__setattr__(self, "_human", human)
+
+        return human
+
+
+def _intern_coordinates() -> dict[tuple[int, int], Coordinate]:
+    interned = {}
+
+    for x, y in itertools.product(range(-1, MAX_BOARD_SIZE + 1), repeat=2):
+        coordinate = Coordinate._make(x, y)
+        coordinate.to_human()
+        interned[x, y] = coordinate
+
+    return interned
+
+
+_interned: dict[tuple[int, int], Coordinate] = _intern_coordinates()
+_interned_human: dict[str, Coordinate] = {c.to_human(): c for c in _interned.values()}
+
+
+@cache
+def get_coordinates(size: int) -> tuple[Coordinate, ...]:
+    """
+    Returns all coordinates of a `size x size` board, row by row,
+    so that a coordinate's position in the tuple is `y * size + x`.
+    """
+    return tuple(Coordinate(x, y) for y in range(size) for x in range(size))
 
 
 @dataclasses.dataclass
@@ -152,10 +247,15 @@ def position_to_coordinates(position: Collection[str]) -> list[Coordinate]:
 class Board:
     def __init__(self, size: int = DEFAULT_BOARD_SIZE) -> None:
         self.size = size
+        self.geometry = get_geometry(size)
         self.grid = [
             [Cell(Coordinate(col, row)) for col in range(self.size)] for row in range(self.size)
         ]
         self.ships: list[Ship] = []
+        self.occupied = 0
+        self.ships_alive = 0
+        self.hp = 0
+        self.ship_counts: Counter[rosters.ShipType] = Counter()
 
     def __repr__(self) -> str:
         return f"<Board {self.size}x{self.size}, {len(self.ships)} ships>"
@@ -185,64 +285,272 @@ class Board:
 
         return self.grid[coordinate.y][coordinate.x]
 
+    def get_mask(self, coordinates: Iterable[Coordinate]) -> int:
+        """
+        Returns a bitmask of given cells, see battleship.engine.geometry.
+        """
+        mask = 0
+
+        for coordinate in coordinates:
+            index = self.geometry.index(coordinate.x, coordinate.y)
+
+            if index is None:
+                raise errors.CellOutOfRange(f"Cell at {coordinate} doesn't exist.")
+
+            mask |= 1 << index
+
+        return mask
+
     def has_adjacent_ship(self, coordinate: Coordinate) -> bool:
-        cell = self.get_cell(coordinate)
+        index = self.geometry.index(coordinate.x, coordinate.y)
 
-        if not cell:
+        if index is None:
             raise errors.CellOutOfRange(f"Cell at {coordinate=} does not exist.")
 
-        adjacent_coordinates = [
-            cell.coordinate.up(),
-            cell.coordinate.right(),
-            cell.coordinate.down(),
-            cell.coordinate.left(),
-        ]
-        diagonals = [
-            adjacent_coordinates[1].up(),
-            adjacent_coordinates[1].down(),
-            adjacent_coordinates[3].up(),
-            adjacent_coordinates[3].down(),
-        ]
-        adjacent_coordinates.extend(diagonals)
+        return bool(self.occupied & self.geometry.neighbours[index])
 
-        cells = [self.get_cell(coor) for coor in adjacent_coordinates]
+    def can_place_ship(self, mask: int, no_adjacent_ships: bool = False) -> bool:
+        """
+        Checks the whole ship footprint (see `get_mask`) at once: its cells
+        must be free and, if adjacent ships are forbidden, must not touch
+        any other ship.
+        """
+        if no_adjacent_ships:
+            mask = self.geometry.halo(mask)
 
-        return any([cell is not None and cell.ship is not None for cell in cells])
+        return not self.occupied & mask
 
     def place_ship(
         self, coordinates: Collection[Coordinate], ship: Ship, no_adjacent_ships: bool = False
     ) -> None:
+        mask = self._check_placement(coordinates, ship, no_adjacent_ships)
+
+        for coordinate in coordinates:
+            self.grid[coordinate.y][coordinate.x].set_ship(ship)
+
+        self.occupied |= mask
+        self._add_to_fleet(ship)
+        ship.cells.extend(coordinates)
+
+    def get_shots(self) -> int:
+        """
+        Returns a bitmask of shot cells.
+        """
+        return sum(1 << i for i, cell in enumerate(self.cells) if cell.is_shot)
+
+    def set_shots(self, mask: int) -> None:
+        """
+        Marks cells from the bitmask as shot and the rest as not shot.
+        Doesn't damage ships, their hit points are restored separately.
+        """
+        for i, cell in enumerate(self.cells):
+            cell.is_shot = bool(mask >> i & 1)
+
+    def clone(self) -> "Board":
+        """
+        Returns an independent copy of the board with copies of its ships.
+        """
+        board = type(self)(self.size)
+
+        for ship in self.ships:
+            board.place_ship(ship.cells, Ship(ship.id, ship.type, len(ship.cells)))
+            board.ships[-1].damage(len(ship.cells) - ship.hp)
+
+        board.set_shots(self.get_shots())
+        return board
+
+    def _add_to_fleet(self, ship: Ship) -> None:
+        """
+        Adds the ship to the fleet and starts tracking its damage.
+        """
+        self.ships.append(ship)
+        self.ship_counts[ship.type] += 1
+        self.hp += ship.hp
+        self.ships_alive += not ship.destroyed
+        ship.board = self
+
+    def on_ship_damaged(self, ship: Ship) -> None:
+        self.hp -= 1
+
+        if ship.destroyed:
+            self.ships_alive -= 1
+
+    def hit_cell(self, coordinate: Coordinate) -> Ship | None:
+        cell = self.get_cell(coordinate)
+
+        if cell is None:
+            raise errors.CellOutOfRange(f"Cell at {coordinate} doesn't exist.")
+
+        cell.hit()
+        return cell.ship
+
+    def _check_placement(
+        self, coordinates: Collection[Coordinate], ship: Ship, no_adjacent_ships: bool
+    ) -> int:
         if len(coordinates) != ship.hp:
             raise errors.ShipDoesntFitCells(
                 f"Cannot place {ship.hp} HP ship onto {len(coordinates)} cells."
             )
 
         is_valid_position(coordinates)
+        mask = self.get_mask(coordinates)
 
-        if no_adjacent_ships:
-            for coordinate in coordinates:
-                if self.has_adjacent_ship(coordinate):
-                    raise errors.CannotPlaceShip(f"Coordinate {coordinate} has an adjacent ship.")
+        if no_adjacent_ships and not self.can_place_ship(mask, no_adjacent_ships=True):
+            raise errors.CannotPlaceShip(f"Position {coordinates} has an adjacent ship.")
 
-        for coordinate in coordinates:
-            cell = self.get_cell(coordinate)
+        if taken := self.occupied & mask:
+            raise errors.CellTaken(
+                f"Cell {self._get_coordinate(taken).to_human()} already has a ship."
+            )
 
-            if cell is None:
-                raise errors.CellOutOfRange(f"Cell at {coordinate} doesn't exist.")
+        return mask
 
-            cell.set_ship(ship)
+    def _get_coordinate(self, mask: int) -> Coordinate:
+        """
+        Returns the coordinate of the lowest cell in the mask.
+        """
+        return get_coordinates(self.size)[(mask & -mask).bit_length() - 1]
 
-        self.ships.append(ship)
+
+class BitCell(Cell):
+    """
+    A view of a BitBoard cell. Holds no state of its own,
+    reads and writes go straight to the board bitmasks.
+    """
+
+    def __init__(self, board: "BitBoard", coordinate: Coordinate, bit: int) -> None:
+        self.coordinate = coordinate
+        self._board = board
+        self._bit = bit
+
+    def __repr__(self) -> str:
+        return f"Cell {self.coordinate.to_human()}"
+
+    @property  # type: ignore[override]
+    def ship(self) -> Ship | None:
+        return self._board.get_ship_at(self._bit)
+
+    @property  # type: ignore[override]
+    def is_shot(self) -> bool:
+        return bool(self._board.shots & self._bit)
+
+    def hit(self) -> None:
+        self._board.hit_cell(self.coordinate)
+
+    def set_ship(self, ship: Ship) -> None:
+        self._board.set_ship_at(self._bit, ship)
+
+
+class BitBoard(Board):
+    """
+    A Board that keeps ship occupancy, shot cells and ship membership
+    as integer bitmasks, one bit per cell (see battleship.engine.geometry).
+
+    Cells are not materialized until requested via `cells` or `get_cell`,
+    so shooting and placing ships don't allocate any per-cell objects.
+    """
+
+    def __init__(self, size: int = DEFAULT_BOARD_SIZE) -> None:
+        self.size = size
+        self.geometry = get_geometry(size)
+        self.ships: list[Ship] = []
+        self.occupied = 0
+        self.shots = 0
+        self.ships_alive = 0
+        self.hp = 0
+        self.ship_counts: Counter[rosters.ShipType] = Counter()
+        self._ship_masks: list[int] = []
+
+    @cached_property
+    def cells(self) -> list[Cell]:
+        return [
+            BitCell(self, coordinate, 1 << i)
+            for i, coordinate in enumerate(get_coordinates(self.size))
+        ]
+
+    @cached_property
+    def grid(self) -> list[list[Cell]]:  # type: ignore[override]
+        cells = self.cells
+        return [cells[row * self.size : (row + 1) * self.size] for row in range(self.size)]
+
+    def get_cell(self, coordinate: Coordinate) -> Cell | None:
+        index = self.geometry.index(coordinate.x, coordinate.y)
+
+        if index is None:
+            return None
+
+        return self.cells[index]
+
+    def get_ship_at(self, bit: int) -> Ship | None:
+        if not self.occupied & bit:
+            return None
+
+        for ship, mask in zip(self.ships, self._ship_masks):
+            if mask & bit:
+                return ship
+
+        return None
+
+    def set_ship_at(self, bit: int, ship: Ship) -> None:
+        if self.occupied & bit:
+            raise errors.CellTaken(
+                f"Cell {self._get_coordinate(bit).to_human()} already has a ship."
+            )
+
+        self.occupied |= bit
+
+        for i, known_ship in enumerate(self.ships):
+            if known_ship is ship:
+                self._ship_masks[i] |= bit
+                return
+
+        self._add_to_fleet(ship)
+        self._ship_masks.append(bit)
+
+    def place_ship(
+        self, coordinates: Collection[Coordinate], ship: Ship, no_adjacent_ships: bool = False
+    ) -> None:
+        mask = self._check_placement(coordinates, ship, no_adjacent_ships)
+        self.occupied |= mask
+        self._add_to_fleet(ship)
+        self._ship_masks.append(mask)
         ship.cells.extend(coordinates)
 
+    def get_shots(self) -> int:
+        return self.shots
+
+    def set_shots(self, mask: int) -> None:
+        self.shots = mask
+
+    def clone(self) -> "BitBoard":
+        board = BitBoard(self.size)
+        board.occupied = self.occupied
+        board.shots = self.shots
+        board._ship_masks = self._ship_masks.copy()
+
+        for ship in self.ships:
+            board._add_to_fleet(Ship(ship.id, ship.type, ship.hp, ship.cells.copy()))
+
+        return board
+
     def hit_cell(self, coordinate: Coordinate) -> Ship | None:
-        cell = self.get_cell(coordinate)
+        index = self.geometry.index(coordinate.x, coordinate.y)
 
-        if cell is None:
+        if index is None:
             raise errors.CellOutOfRange(f"Cell at {coordinate} doesn't exist.")
 
-        cell.hit()
-        return cell.ship
+        bit = 1 << index
+
+        if self.shots & bit:
+            raise errors.CellAlreadyShot(f"You can't shot the same cell {Cell(coordinate)} twice.")
+
+        self.shots |= bit
+        ship = self.get_ship_at(bit)
+
+        if ship is not None:
+            ship.damage()
+
+        return ship
 
 
 @dataclasses.dataclass(unsafe_hash=True)
@@ -262,7 +570,7 @@ class Player:
         return self.board.hit_cell(coordinate)
 
     def count_ships(self, ship_type: rosters.ShipType) -> int:
-        return len([ship for ship in self.board.ships if ship.type == ship_type])
+        return self.board.ship_counts[ship_type]
 
     def get_ship(self, ship_id: str) -> Ship | None:
         try:
@@ -272,7 +580,11 @@ class Player:
 
     @property
     def ships_alive(self) -> int:
-        return len([ship for ship in self.board.ships if not ship.destroyed])
+        return self.board.ships_alive
+
+    @property
+    def hp(self) -> int:
+        return self.board.hp
 
     @property
     def ships(self) -> list[Ship]:
@@ -344,11 +656,70 @@ class GameState(StrEnum):
     END = enum.auto()
 
 
+class _SnapshotFlag(enum.IntFlag):
+    SALVO_MODE = enum.auto()
+    NO_ADJACENT_SHIPS = enum.auto()
+    CAN_MAKE_TURN = enum.auto()
+    PLAYER_A_MOVES = enum.auto()
+    BIT_BOARD = enum.auto()
+
+
+SNAPSHOT_MAGIC = b"BSG"
+SNAPSHOT_VERSION = 1
+# Magic, version, board size, firing order, game state, winner (0 - none, 1 - A, 2 - B), flags.
+_SNAPSHOT_HEADER = struct.Struct("<3sBBBBBB")
+# Roster item index, hit points left, number of cells.
+_SNAPSHOT_SHIP = struct.Struct("<BBB")
+
+
+class _SnapshotReader:
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def read(self, size: int) -> bytes:
+        if self.offset + size > len(self.data):
+            raise ValueError("Snapshot is truncated.")
+
+        chunk = self.data[self.offset : self.offset + size].tobytes()
+        self.offset += size
+        return chunk
+
+    def unpack(self, layout: struct.Struct) -> tuple[Any, ...]:
+        return layout.unpack(self.read(layout.size))
+
+    def read_byte(self) -> int:
+        return self.read(1)[0]
+
+    def read_str(self) -> str:
+        return self.read(self.read_byte()).decode()
+
+
+def _pack_str(value: str) -> bytes:
+    data = value.encode()
+
+    if len(data) > 255:
+        raise ValueError(f"String {value!r} is too long for a snapshot.")
+
+    return bytes([len(data)]) + data
+
+
 Event = TypeVar("Event", bound=GameEvent)
 Handler = Callable[[Event], None] | Callable[[Event], Awaitable[None]]
 
 
 class Game:
+    """
+    The player who moves first is chosen randomly, unless `first_move` is given.
+
+    By default, events are dispatched through an event emitter, so handlers
+    may be coroutine functions (scheduled on the running event loop). With
+    `sync_events=True` handlers must be plain functions and are called
+    directly, in order of subscription. In both modes an event is only built
+    if someone listens to it, and the outcome of a move can be read from
+    the return value of `turn()` and the game properties instead.
+    """
+
     def __init__(
         self,
         player_a: Player,
@@ -357,6 +728,8 @@ class Game:
         firing_order: FiringOrder = FiringOrder.ALTERNATELY,
         salvo_mode: bool = False,
         no_adjacent_ships: bool = False,
+        sync_events: bool = False,
+        first_move: Player | None = None,
     ) -> None:
         self.player_a = player_a
         self.player_b = player_b
@@ -364,13 +737,22 @@ class Game:
         self.firing_order = firing_order
         self.salvo_mode = salvo_mode
         self.no_adjacent_ships = no_adjacent_ships
+        self.sync_events = sync_events
+
+        if first_move is None:
+            self._actor, self._subject = random.sample([player_a, player_b], k=2)
+        elif first_move is player_a:
+            self._actor, self._subject = player_a, player_b
+        elif first_move is player_b:
+            self._actor, self._subject = player_b, player_a
+        else:
+            raise ValueError(f"{first_move} doesn't play this game.")
 
-        self._player_cycle = pairwise(cycle(random.sample([player_a, player_b], k=2)))
-        self._actor, self._subject = next(self._player_cycle)
         self._winner: Player | None = None
         self._can_make_turn = False
         self._state = GameState.ARRANGE_FLEET
         self._ee = EventEmitter()
+        self._handlers: dict[str, list[Handler[Any]]] = {}
 
     def __str__(self) -> str:
         return f"Game <{self.player_a} vs {self.player_b}> <Winner: {self._winner}>"
@@ -392,7 +774,158 @@ class Game:
         return self._winner
 
     def on(self, event: type[Event], func: Handler[Event]) -> None:
-        self._ee.on(event.__name__, func)
+        if self.sync_events:
+            if inspect.iscoroutinefunction(func):
+                raise TypeError("Coroutine handlers are not supported with synchronous events.")
+        else:
+            self._ee.on(event.__name__, func)
+
+        self._handlers.setdefault(event.__name__, []).append(func)
+
+    def snapshot(self) -> bytes:
+        """
+        Encodes the game state (options, roster, fleets, shots and turn order)
+        into a compact binary blob, see `restore`. Event handlers are not saved.
+        """
+        size = self.player_a.board.size
+        roster_index = {item.id: i for i, item in enumerate(self.roster)}
+        flags = _SnapshotFlag(0)
+
+        for flag, enabled in (
+            (_SnapshotFlag.SALVO_MODE, self.salvo_mode),
+            (_SnapshotFlag.NO_ADJACENT_SHIPS, self.no_adjacent_ships),
+            (_SnapshotFlag.CAN_MAKE_TURN, self._can_make_turn),
+            (_SnapshotFlag.PLAYER_A_MOVES, self._actor is self.player_a),
+            (_SnapshotFlag.BIT_BOARD, isinstance(self.player_a.board, BitBoard)),
+        ):
+            if enabled:
+                flags |= flag
+
+        chunks = [
+            _SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                size,
+                list(FiringOrder).index(FiringOrder(self.firing_order)),
+                list(GameState).index(self._state),
+                self._get_winner_code(),
+                flags,
+            ),
+            _pack_str(self.roster.name),
+            bytes([len(self.roster)]),
+        ]
+
+        for item in self.roster:
+            chunks += [_pack_str(item.id), _pack_str(item.type), bytes([item.hp])]
+
+        for player in (self.player_a, self.player_b):
+            chunks += [
+                _pack_str(player.name),
+                player.board.get_shots().to_bytes((size * size + 7) // 8, "little"),
+                bytes([len(player.ships)]),
+            ]
+
+            for ship in player.ships:
+                cells = [c.y * size + c.x for c in ship.cells]
+                chunks.append(_SNAPSHOT_SHIP.pack(roster_index[ship.id], ship.hp, len(cells)))
+                chunks.append(struct.pack(f"<{len(cells)}H", *cells))
+
+        return b"".join(chunks)
+
+    @classmethod
+    def restore(cls, snapshot: bytes, sync_events: bool = False) -> "Game":
+        """
+        Creates a game from a blob made by `snapshot`.
+        """
+        try:
+            return cls._restore(_SnapshotReader(snapshot), sync_events)
+        except (ValueError, IndexError, KeyError, struct.error) as exc:
+            raise errors.InvalidSnapshot(f"Cannot restore game: {exc}") from exc
+
+    @classmethod
+    def _restore(cls, reader: _SnapshotReader, sync_events: bool) -> "Game":
+        magic, version, size, firing_order, state, winner, flags = reader.unpack(_SNAPSHOT_HEADER)
+
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("not a game snapshot")
+
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported snapshot version {version}")
+
+        flags = _SnapshotFlag(flags)
+        roster_name = reader.read_str()
+        roster = rosters.Roster(
+            name=roster_name,
+            items=[
+                rosters.RosterItem(reader.read_str(), reader.read_str(), reader.read_byte())
+                for _ in range(reader.read_byte())
+            ],
+        )
+        board_type = BitBoard if flags & _SnapshotFlag.BIT_BOARD else Board
+        coordinates = get_coordinates(size)
+        players = []
+
+        for _ in range(2):
+            player = Player(reader.read_str(), board_type(size))
+            shots = int.from_bytes(reader.read((size * size + 7) // 8), "little")
+
+            for _ in range(reader.read_byte()):
+                item_index, hp, cell_count = reader.unpack(_SNAPSHOT_SHIP)
+                cells = struct.unpack(f"<{cell_count}H", reader.read(2 * cell_count))
+                item = roster.items[item_index]
+                ship = Ship(item.id, item.type, cell_count)
+                player.board.place_ship([coordinates[c] for c in cells], ship)
+                ship.damage(cell_count - hp)
+
+            player.board.set_shots(shots)
+            players.append(player)
+
+        if reader.offset != len(reader.data):
+            raise ValueError("unexpected data after the end of snapshot")
+
+        player_a, player_b = players
+        game = cls(
+            player_a,
+            player_b,
+            roster,
+            firing_order=list(FiringOrder)[firing_order],
+            salvo_mode=bool(flags & _SnapshotFlag.SALVO_MODE),
+            no_adjacent_ships=bool(flags & _SnapshotFlag.NO_ADJACENT_SHIPS),
+            sync_events=sync_events,
+            first_move=player_a if flags & _SnapshotFlag.PLAYER_A_MOVES else player_b,
+        )
+        game._state = list(GameState)[state]
+        game._winner = (None, player_a, player_b)[winner]
+        game._can_make_turn = bool(flags & _SnapshotFlag.CAN_MAKE_TURN)
+        return game
+
+    def _get_winner_code(self) -> int:
+        if self._winner is None:
+            return 0
+
+        return 1 if self._winner is self.player_a else 2
+
+    def clone(self, sync_events: bool | None = None) -> "Game":
+        """
+        Returns an independent copy of the game, e.g. to look ahead.
+        Event handlers are not copied.
+        """
+        player_a = Player(self.player_a.name, self.player_a.board.clone())
+        player_b = Player(self.player_b.name, self.player_b.board.clone())
+        game = Game(
+            player_a,
+            player_b,
+            self.roster,
+            firing_order=self.firing_order,
+            salvo_mode=self.salvo_mode,
+            no_adjacent_ships=self.no_adjacent_ships,
+            sync_events=self.sync_events if sync_events is None else sync_events,
+            first_move=player_a if self._actor is self.player_a else player_b,
+        )
+        game._state = self._state
+        game._winner = (None, player_a, player_b)[self._get_winner_code()]
+        game._can_make_turn = self._can_make_turn
+        return game
 
     def add_ship(
         self, player: Player, position: Collection[str], roster_id: rosters.ShipId
@@ -411,12 +944,11 @@ class Game:
             )
 
         self._emit(
-            ShipSpawned(
-                player=player,
-                fleet_ready=self._is_fleet_ready(player),
-                ship_id=roster_id,
-                position=position,
-            )
+            ShipSpawned,
+            player=player,
+            fleet_ready=self._is_fleet_ready(player),
+            ship_id=roster_id,
+            position=position,
         )
         self._check_game_ready()
 
@@ -453,7 +985,11 @@ class Game:
         self._can_make_turn = True
         return salvo
 
-    def turn(self, salvo: Salvo) -> None:
+    def turn(self, salvo: Salvo) -> GameState:
+        """
+        Ends the move. Returns the new game state: whether the game has ended
+        (see `winner`) or who moves next (see `actor` and `subject`).
+        """
         if not self._can_make_turn:
             raise RuntimeError("Cannot make turn at this time. Try calling fire() before.")
 
@@ -462,8 +998,9 @@ class Game:
         if salvo.subject.ships_alive == 0:
             self._winner = salvo.actor
             self._state = GameState.END
-            self._emit(GameEnded(winner=salvo.actor))
+            self._emit(GameEnded, winner=salvo.actor)
             self._ee.off_all()
+            self._handlers.clear()
         else:
             if (
                 self.firing_order == FiringOrder.ALTERNATELY
@@ -472,10 +1009,13 @@ class Game:
             ):
                 self._cycle_players()
 
-            self._emit(NextMove(actor=self._actor, subject=self._subject))
+            self._emit(NextMove, actor=self._actor, subject=self._subject)
+
+        return self._state
 
     def _is_fleet_ready(self, player: Player) -> bool:
-        return {ship.id for ship in player.ships} == {item.id for item in self.roster}
+        # Ships can only be added from the roster and only once, see `add_ship`.
+        return len(player.ships) == len(self.roster)
 
     def _build_ship(self, ship_id: rosters.ShipId) -> Ship:
         try:
@@ -487,10 +1027,21 @@ class Game:
     def _check_game_ready(self) -> None:
         if self._is_fleet_ready(self.player_a) and self._is_fleet_ready(self.player_b):
             self._state = GameState.BATTLE
-            self._emit(NextMove(self._actor, self._subject))
+            self._emit(NextMove, actor=self._actor, subject=self._subject)
 
     def _cycle_players(self) -> None:
-        self._actor, self._subject = next(self._player_cycle)
+        self._actor, self._subject = self._subject, self._actor
+
+    def _emit(self, event_type: type[GameEvent], **fields: Any) -> None:
+        handlers = self._handlers.get(event_type.__name__)
+
+        if not handlers:
+            return
 
-    def _emit(self, event: GameEvent) -> None:
-        self._ee.emit_future(event.__class__.__name__, event)
+        event = event_type(**fields)
+
+        if self.sync_events:
+            for handler in tuple(handlers):
+                handler(event)
+        else:
+            self._ee.emit_future(event_type.__name__, event)
@@ -56,3 +56,7 @@ class IncorrectShots(BattleshipError):
 
 class CannotPlaceShip(BattleshipError):
     pass
+
+
+class InvalidSnapshot(BattleshipError):
+    pass
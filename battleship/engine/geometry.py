@@ -0,0 +1,100 @@
+"""
+Precomputed bitmask geometry of square boards.
+
+Cell (x, y) of a `size x size` board is represented by bit `1 << (y * size + x)`,
+so any set of cells (a ship, shots, the whole fleet) is a single integer.
+"""
+
+import dataclasses
+from functools import cache
+
+
+@dataclasses.dataclass(frozen=True)
+class Geometry:
+    size: int
+    full: int
+    not_first_col: int
+    not_last_col: int
+    neighbours: tuple[int, ...]
+    halos: tuple[int, ...]
+
+    def index(self, x: int, y: int) -> int | None:
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            return None
+
+        return y * self.size + x
+
+    def halo(self, mask: int) -> int:
+        """
+        Returns given cells together with all cells that touch them,
+        including diagonally. Works for any set of cells in one go.
+        """
+        row = mask | ((mask << 1) & self.not_first_col) | ((mask >> 1) & self.not_last_col)
+        return (row | (row << self.size) | (row >> self.size)) & self.full
+
+
+@cache
+def get_geometry(size: int) -> Geometry:
+    full = (1 << size * size) - 1
+    first_col = sum(1 << (y * size) for y in range(size))
+    last_col = first_col << (size - 1)
+    geometry = Geometry(
+        size=size,
+        full=full,
+        not_first_col=full & ~first_col,
+        not_last_col=full & ~last_col,
+        neighbours=(),
+        halos=(),
+    )
+    halos = tuple(geometry.halo(1 << i) for i in range(size * size))
+    neighbours = tuple(halo & ~(1 << i) for i, halo in enumerate(halos))
+    return dataclasses.replace(geometry, neighbours=neighbours, halos=halos)
+
+
+@dataclasses.dataclass(frozen=True)
+class Placement:
+    mask: int
+    cells: tuple[int, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class PlacementIndex:
+    """
+    All placements of a ship of given length on an empty board,
+    plus an inverted index of placements covering every cell.
+    """
+
+    size: int
+    length: int
+    placements: tuple[Placement, ...]
+    by_cell: tuple[tuple[int, ...], ...]
+
+
+@cache
+def get_placement_index(size: int, length: int) -> PlacementIndex:
+    placements = []
+
+    for y in range(size):
+        for x in range(size - length + 1):
+            cells = tuple(y * size + x + i for i in range(length))
+            placements.append(Placement(sum(1 << cell for cell in cells), cells))
+
+    # A single-cell ship looks the same in both directions.
+    if length > 1:
+        for x in range(size):
+            for y in range(size - length + 1):
+                cells = tuple((y + i) * size + x for i in range(length))
+                placements.append(Placement(sum(1 << cell for cell in cells), cells))
+
+    by_cell: list[list[int]] = [[] for _ in range(size * size)]
+
+    for i, placement in enumerate(placements):
+        for cell in placement.cells:
+            by_cell[cell].append(i)
+
+    return PlacementIndex(
+        size=size,
+        length=length,
+        placements=tuple(placements),
+        by_cell=tuple(map(tuple, by_cell)),
+    )
@@ -0,0 +1,378 @@
+"""
+Headless bot-vs-bot games.
+
+Games are played synchronously on `domain.Game`, without an event loop,
+a terminal or artificial delays. Every game is seeded, so any result can
+be replayed with the same contenders, rules and seed.
+"""
+
+import dataclasses
+import itertools
+import math
+import random
+import statistics
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from typing import TypeAlias
+
+from battleship.engine import ai, domain, rosters
+from battleship.engine.api import create_game
+
+Placer: TypeAlias = Callable[
+    [domain.Board, rosters.Roster, bool], Mapping[rosters.ShipId, Sequence[domain.Coordinate]]
+]
+CallerFactory: TypeAlias = Callable[[domain.Board, rosters.Roster, bool], ai.BaseTargetCaller]
+
+
+def autoplace(
+    board: domain.Board, roster: rosters.Roster, no_adjacent_ships: bool
+) -> dict[rosters.ShipId, list[domain.Coordinate]]:
+    return ai.Autoplacer(board, roster, no_adjacent_ships).place_fleet()
+
+
+@dataclasses.dataclass(frozen=True)
+class Contender:
+    """
+    A bot: how it arranges its fleet and how it picks targets.
+    The caller is created for the enemy board.
+    """
+
+    name: str
+    caller: CallerFactory = partial(ai.make_target_caller, ai.Targeting.HUNT)
+    placer: Placer = autoplace
+
+
+@dataclasses.dataclass(frozen=True)
+class Rules:
+    roster: rosters.RosterName = "classic"
+    firing_order: domain.FiringOrder = domain.FiringOrder.ALTERNATELY
+    salvo_mode: bool = False
+    no_adjacent_ships: bool = False
+
+    def __str__(self) -> str:
+        flags = [self.roster, self.firing_order]
+
+        if self.salvo_mode:
+            flags.append("salvo")
+
+        if self.no_adjacent_ships:
+            flags.append("no_adjacent")
+
+        return "/".join(flags)
+
+    @classmethod
+    def all(cls) -> list["Rules"]:
+        """
+        Returns every combination of rosters and game options.
+        """
+        return [
+            cls(roster, domain.FiringOrder(firing_order), salvo_mode, no_adjacent_ships)
+            for roster, firing_order, salvo_mode, no_adjacent_ships in itertools.product(
+                rosters.get_rosters(), domain.FiringOrder, (False, True), (False, True)
+            )
+        ]
+
+
+@dataclasses.dataclass(frozen=True)
+class GameResult:
+    seed: int
+    rules: Rules
+    winner: str
+    first: str
+    turns: int
+    shots: dict[str, int]
+    hits: dict[str, int]
+    duration: float
+
+
+def play(
+    player_a: Contender,
+    player_b: Contender,
+    rules: Rules = Rules(),
+    seed: int = 0,
+    board_type: type[domain.Board] = domain.BitBoard,
+) -> GameResult:
+    """
+    Plays a single game to the end. Seeds the `random` module, which drives
+    the first move, fleet placement and targeting.
+    """
+    if player_a.name == player_b.name:
+        raise ValueError("Contenders must have different names.")
+
+    random.seed(seed)
+    start = time.perf_counter()
+    roster = rosters.get_roster(rules.roster)
+    game = create_game(
+        player_a.name,
+        player_b.name,
+        roster,
+        rules.firing_order,
+        rules.salvo_mode,
+        rules.no_adjacent_ships,
+        board_type=board_type,
+        sync_events=True,
+    )
+    contenders = {game.player_a: player_a, game.player_b: player_b}
+    first = game.actor.name
+
+    for player, contender in contenders.items():
+        fleet = contender.placer(player.board, roster, rules.no_adjacent_ships)
+
+        for ship_id, position in fleet.items():
+            game.add_ship(player, [coordinate.to_human() for coordinate in position], ship_id)
+
+    callers = {
+        game.player_a: player_a.caller(game.player_b.board, roster, rules.no_adjacent_ships),
+        game.player_b: player_b.caller(game.player_a.board, roster, rules.no_adjacent_ships),
+    }
+    shots = {player_a.name: 0, player_b.name: 0}
+    hits = {player_a.name: 0, player_b.name: 0}
+    # Every turn shoots at least one cell, so a game can't last longer than this.
+    max_turns = 2 * game.player_a.board.size**2
+    state = game.state
+    turns = 0
+
+    while state != domain.GameState.END:
+        if turns == max_turns:
+            raise RuntimeError(f"Game with seed {seed} did not end in {max_turns} turns.")
+
+        actor = game.actor
+        caller = callers[actor]
+        count = actor.ships_alive if rules.salvo_mode else 1
+        salvo = game.fire(caller.call_out(count=count))
+        caller.provide_feedback(salvo.shots)
+        state = game.turn(salvo)
+        turns += 1
+        shots[actor.name] += len(salvo)
+        hits[actor.name] += sum(shot.hit for shot in salvo)
+
+    assert game.winner
+    return GameResult(
+        seed=seed,
+        rules=rules,
+        winner=game.winner.name,
+        first=first,
+        turns=turns,
+        shots=shots,
+        hits=hits,
+        duration=time.perf_counter() - start,
+    )
+
+
+@dataclasses.dataclass
+class Report:
+    results: list[GameResult] = dataclasses.field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def games(self) -> int:
+        return len(self.results)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def wins(self, name: str) -> int:
+        return sum(result.winner == name for result in self.results)
+
+    def win_rate(self, name: str) -> float:
+        return self.wins(name) / self.games if self.games else 0.0
+
+    def mean_shots_to_win(self, name: str) -> float:
+        """
+        Mean number of shots the contender needed to sink the whole enemy fleet.
+        """
+        shots = [result.shots[name] for result in self.results if result.winner == name]
+        return statistics.fmean(shots) if shots else 0.0
+
+    def extend(self, other: "Report") -> None:
+        self.results.extend(other.results)
+        self.elapsed += other.elapsed
+
+
+def simulate(
+    player_a: Contender,
+    player_b: Contender,
+    rules: Rules | Iterable[Rules] = Rules(),
+    games: int = 100,
+    seed: int = 0,
+    board_type: type[domain.Board] = domain.BitBoard,
+) -> Report:
+    """
+    Plays `games` games for every set of rules. Game number `i` is seeded
+    with `seed + i`, so two runs with the same arguments play the same games.
+    """
+    rule_sets = [rules] if isinstance(rules, Rules) else list(rules)
+    report = Report()
+    start = time.perf_counter()
+
+    for rule_set in rule_sets:
+        for i in range(games):
+            report.results.append(play(player_a, player_b, rule_set, seed + i, board_type))
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+# Two-sided 95% confidence.
+Z_95 = 1.96
+
+
+@dataclasses.dataclass
+class Score:
+    """
+    Results of one contender, reduced to sums that can be merged
+    across shards played in different processes.
+    """
+
+    games: int = 0
+    wins: int = 0
+    shots_to_win: int = 0
+    shots_to_win_squared: int = 0
+
+    def add(self, result: GameResult, name: str) -> None:
+        self.games += 1
+
+        if result.winner == name:
+            shots = result.shots[name]
+            self.wins += 1
+            self.shots_to_win += shots
+            self.shots_to_win_squared += shots**2
+
+    def merge(self, other: "Score") -> None:
+        self.games += other.games
+        self.wins += other.wins
+        self.shots_to_win += other.shots_to_win
+        self.shots_to_win_squared += other.shots_to_win_squared
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def win_rate_interval(self) -> tuple[float, float]:
+        """
+        Wilson score interval, behaves well for win rates close to 0 or 1.
+        """
+        if not self.games:
+            return 0.0, 1.0
+
+        n, p = self.games, self.win_rate
+        center = (p + Z_95**2 / (2 * n)) / (1 + Z_95**2 / n)
+        margin = Z_95 * math.sqrt(p * (1 - p) / n + Z_95**2 / (4 * n**2)) / (1 + Z_95**2 / n)
+        return max(center - margin, 0.0), min(center + margin, 1.0)
+
+    @property
+    def mean_shots_to_win(self) -> float:
+        return self.shots_to_win / self.wins if self.wins else 0.0
+
+    @property
+    def mean_shots_to_win_interval(self) -> tuple[float, float]:
+        mean = self.mean_shots_to_win
+
+        if self.wins < 2:
+            return mean, mean
+
+        variance = (self.shots_to_win_squared - self.wins * mean**2) / (self.wins - 1)
+        margin = Z_95 * math.sqrt(max(variance, 0.0) / self.wins)
+        return mean - margin, mean + margin
+
+
+@dataclasses.dataclass
+class TournamentReport:
+    """
+    Scores of every contender against every opponent,
+    keyed by `(contender, opponent)` names.
+    """
+
+    scores: dict[tuple[str, str], Score] = dataclasses.field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def games(self) -> int:
+        # Every game is counted once for each of the two contenders.
+        return sum(score.games for score in self.scores.values()) // 2
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def merge(self, scores: Mapping[tuple[str, str], Score]) -> None:
+        for key, score in scores.items():
+            self.scores.setdefault(key, Score()).merge(score)
+
+    def standings(self) -> dict[str, Score]:
+        """
+        Returns scores of contenders against all opponents, best first.
+        """
+        standings: dict[str, Score] = {}
+
+        for (name, _), score in self.scores.items():
+            standings.setdefault(name, Score()).merge(score)
+
+        return dict(sorted(standings.items(), key=lambda item: item[1].win_rate, reverse=True))
+
+
+def play_shard(
+    player_a: Contender,
+    player_b: Contender,
+    rules: Rules,
+    games: int,
+    seed: int,
+    board_type: type[domain.Board] = domain.BitBoard,
+) -> dict[tuple[str, str], Score]:
+    """
+    Plays games seeded `seed` to `seed + games - 1` and returns their scores.
+    """
+    score_a, score_b = Score(), Score()
+
+    for i in range(games):
+        result = play(player_a, player_b, rules, seed + i, board_type)
+        score_a.add(result, player_a.name)
+        score_b.add(result, player_b.name)
+
+    return {(player_a.name, player_b.name): score_a, (player_b.name, player_a.name): score_b}
+
+
+def run_tournament(
+    contenders: Sequence[Contender],
+    rules: Rules | Iterable[Rules] = Rules(),
+    games: int = 1000,
+    seed: int = 0,
+    workers: int | None = None,
+    shard_size: int = 1000,
+    board_type: type[domain.Board] = domain.BitBoard,
+) -> TournamentReport:
+    """
+    Plays a round-robin tournament: every pair of contenders plays `games`
+    games under every set of rules. Games are split into shards of seeds
+    and played across a process pool. Every pair plays the same seeds.
+    Pass `workers=1` to play in the current process.
+    """
+    if len({contender.name for contender in contenders}) != len(contenders):
+        raise ValueError("Contenders must have different names.")
+
+    rule_sets = [rules] if isinstance(rules, Rules) else list(rules)
+    shards = [
+        (player_a, player_b, rule_set, min(shard_size, games - start), seed + start, board_type)
+        for player_a, player_b in itertools.combinations(contenders, 2)
+        for rule_set in rule_sets
+        for start in range(0, games, shard_size)
+    ]
+    report = TournamentReport()
+    start = time.perf_counter()
+
+    if workers == 1:
+        for shard in shards:
+            report.merge(play_shard(*shard))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_shard, *shard) for shard in shards]
+
+            for future in as_completed(futures):
+                report.merge(future.result())
+
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -13,14 +13,17 @@ from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
 
 from battleship import PACKAGE_NAME
 from battleship.server import context
+from battleship.server.bus import MessageBus
 from battleship.server.config import Config
 from battleship.server.di import build_container, connect_event_handlers
+from battleship.server.game import GameManager
 from battleship.server.metrics import (
     MetricsMiddleware,
     MetricsScraperAuthenticationHandler,
 )
-from battleship.server.repositories import ClientRepository
+from battleship.server.repositories import ClientRepository, SessionRepository
 from battleship.server.routes import router
+from battleship.server.summaries import SummaryWriter
 
 
 async def cleanup_clients(app: Application) -> None:
@@ -34,6 +37,35 @@ async def cleanup_clients(app: Application) -> None:
         raise
 
 
+async def reindex_sessions(app: Application) -> None:
+    count = await app.services.resolve(SessionRepository).reindex()
+    logger.debug("Indexed {count} sessions.", count=count)
+
+
+async def start_message_bus(app: Application) -> None:
+    await app.services.resolve(MessageBus).start()
+
+
+async def stop_message_bus(app: Application) -> None:
+    await app.services.resolve(MessageBus).close()
+
+
+async def start_summary_writer(app: Application) -> None:
+    await app.services.resolve(SummaryWriter).start()
+
+
+async def stop_summary_writer(app: Application) -> None:
+    await app.services.resolve(SummaryWriter).close()
+
+
+async def start_game_manager(app: Application) -> None:
+    await app.services.resolve(GameManager).start()
+
+
+async def stop_game_manager(app: Application) -> None:
+    await app.services.resolve(GameManager).close()
+
+
 async def teardown_redis(app: Application) -> None:
     client = app.services.resolve(Redis)
 
@@ -110,7 +142,14 @@ def create_app(container: Container | None = None) -> Any:
         Policy("authenticated", AuthenticatedRequirement()),
     )
 
+    app.on_start += reindex_sessions
+    app.on_start += start_message_bus
+    app.on_start += start_summary_writer
+    app.on_start += start_game_manager
+    app.on_stop += stop_game_manager
+    app.on_stop += stop_summary_writer
     app.on_stop += cleanup_clients
+    app.on_stop += stop_message_bus
     app.on_stop += teardown_redis
 
     app.middlewares.append(client_version_middleware)
@@ -1,9 +1,19 @@
 import abc
-from collections.abc import Awaitable, Callable
+import asyncio
+import enum
+import inspect
+import uuid
+from collections.abc import Awaitable, Callable, Mapping
+from fnmatch import fnmatchcase
+from typing import Any
 
+import redis.asyncio as redis
+from loguru import logger
 from pymitter import EventEmitter  # type: ignore[import-untyped]
 
-from battleship.shared.events import AnyMessage
+from battleship.shared.events import AnyMessage, Message
+
+Handler = Callable[..., Awaitable[None]]
 
 
 class MessageBus(abc.ABC):
@@ -12,11 +22,26 @@ class MessageBus(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def subscribe(self, event: str, func: Callable[..., Awaitable[None]]) -> None:
+    def subscribe(self, event: str, func: Handler) -> None:
+        pass
+
+    @abc.abstractmethod
+    def unsubscribe(self, event: str, func: Handler) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def subscribed(self) -> None:
+        """
+        Waits until subscriptions made so far receive events emitted
+        by other processes.
+        """
+
+    @abc.abstractmethod
+    async def start(self) -> None:
         pass
 
     @abc.abstractmethod
-    def unsubscribe(self, event: str, func: Callable[..., Awaitable[None]]) -> None:
+    async def close(self) -> None:
         pass
 
 
@@ -27,8 +52,235 @@ class InMemoryMessageBus(MessageBus):
     async def emit(self, event: str, message: AnyMessage) -> None:
         self._ee.emit_future(event, message)
 
-    def subscribe(self, event: str, func: Callable[..., Awaitable[None]]) -> None:
+    def subscribe(self, event: str, func: Handler) -> None:
         self._ee.on(event, func)
 
-    def unsubscribe(self, event: str, func: Callable[..., Awaitable[None]]) -> None:
+    def unsubscribe(self, event: str, func: Handler) -> None:
         self._ee.off(event, func)
+
+    async def subscribed(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class Delivery(enum.Enum):
+    # Handled only by the process that emitted the event.
+    LOCAL = enum.auto()
+    # Has a single subscriber in the cluster: if it's in this process,
+    # the event doesn't go through Redis at all.
+    DIRECT = enum.auto()
+    # Handled by subscribers in every process.
+    BROADCAST = enum.auto()
+
+
+class RedisMessageBus(MessageBus):
+    """
+    Delivers events to subscribers in all server processes via Redis Pub/Sub.
+
+    Subscribers in this process are called directly, other processes get
+    the event from Redis. Events can be subscribed to by pattern, e.g.
+    `clients.out.*`. Publishes made within one event loop tick are sent
+    to Redis in a single pipeline, batches are sent one after another.
+    """
+
+    namespace = "bus:"
+    # How long `subscribed` waits for Redis to confirm subscriptions.
+    subscribe_timeout = 5
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        routes: Mapping[str, Delivery] | None = None,
+        default: Delivery = Delivery.BROADCAST,
+    ) -> None:
+        self._client = client
+        self._pubsub = client.pubsub()
+        self._routes = dict(routes or {})
+        self._default = default
+        # Tells our own publishes apart from those of other processes.
+        self._origin = uuid.uuid4().hex.encode()
+        self._handlers: dict[str, list[Handler]] = {}
+        self._patterns: set[str] = set()
+        # Channels waiting for Redis to confirm the subscription.
+        self._confirmations: dict[str, asyncio.Future[None]] = {}
+        self._outbox: list[tuple[str, bytes]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._started = False
+        self._tasks: set[asyncio.Future[Any]] = set()
+
+    def get_channel(self, event: str) -> str:
+        return f"{self.namespace}{event}"
+
+    def get_delivery(self, event: str) -> Delivery:
+        for pattern, delivery in self._routes.items():
+            if fnmatchcase(event, pattern):
+                return delivery
+
+        return self._default
+
+    async def emit(self, event: str, message: AnyMessage) -> None:
+        delivery = self.get_delivery(event)
+        handlers = self._match(event)
+        self._dispatch(handlers, message)
+
+        if delivery == Delivery.LOCAL or (delivery == Delivery.DIRECT and handlers):
+            return
+
+        self._outbox.append((self.get_channel(event), self._origin + message.to_json().encode()))
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+    def subscribe(self, event: str, func: Handler) -> None:
+        handlers = self._handlers.setdefault(event, [])
+        handlers.append(func)
+
+        if "*" in event:
+            self._patterns.add(event)
+
+        if len(handlers) == 1 and self._started and self._is_remote(event):
+            self._schedule(self._psubscribe([self.get_channel(event)]))
+
+    def unsubscribe(self, event: str, func: Handler) -> None:
+        handlers = self._handlers.get(event, [])
+
+        if func in handlers:
+            handlers.remove(func)
+
+        if handlers:
+            return
+
+        self._handlers.pop(event, None)
+        self._patterns.discard(event)
+
+        if self._started and self._is_remote(event):
+            self._schedule(self._pubsub.punsubscribe(self.get_channel(event)))
+
+    async def subscribed(self) -> None:
+        if not self._confirmations:
+            return
+
+        _, pending = await asyncio.wait(
+            list(self._confirmations.values()), timeout=self.subscribe_timeout
+        )
+
+        if pending:
+            logger.warning("{count} subscriptions are not confirmed yet.", count=len(pending))
+
+    async def start(self) -> None:
+        # Subscriptions made before the start are sent to Redis in one go.
+        self._started = True
+        channels = [self.get_channel(event) for event in self._handlers if self._is_remote(event)]
+
+        if channels:
+            await self._psubscribe(channels)
+
+        await self._pubsub.connect()  # type: ignore[no-untyped-call]
+        self._reader_task = asyncio.create_task(self._run_reader())
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+
+        if self._flush_task is not None:
+            await self._flush_task
+
+        await self._pubsub.aclose()  # type: ignore[no-untyped-call]
+
+    def _psubscribe(self, channels: list[str]) -> Awaitable[Any]:
+        loop = asyncio.get_running_loop()
+
+        for channel in channels:
+            if channel not in self._confirmations:
+                self._confirmations[channel] = loop.create_future()
+
+        return self._pubsub.psubscribe(*channels)
+
+    def _confirm(self, channel: bytes) -> None:
+        future = self._confirmations.pop(channel.decode(), None)
+
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def _is_remote(self, event: str) -> bool:
+        return self.get_delivery(event) != Delivery.LOCAL
+
+    def _match(self, event: str) -> list[Handler]:
+        handlers = list(self._handlers.get(event, ()))
+
+        for pattern in self._patterns:
+            if fnmatchcase(event, pattern):
+                handlers.extend(self._handlers[pattern])
+
+        return handlers
+
+    def _dispatch(self, handlers: list[Handler], message: AnyMessage) -> None:
+        for func in handlers:
+            result = func(message)
+
+            if inspect.isawaitable(result):
+                self._schedule(result)
+
+    def _schedule(self, awaitable: Awaitable[Any]) -> None:
+        task = asyncio.ensure_future(awaitable)
+        # The loop keeps weak references only.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self) -> None:
+        # The only flush running: a batch emitted later must not overtake
+        # this one on another connection, or events of a client reach
+        # other processes out of order.
+        try:
+            while self._outbox:
+                # Let the rest of the current tick add its publishes to the batch.
+                await asyncio.sleep(0)
+                batch, self._outbox = self._outbox, []
+
+                try:
+                    async with self._client.pipeline(transaction=False) as pipe:
+                        for channel, data in batch:
+                            pipe.publish(channel, data)
+
+                        await pipe.execute()
+                except redis.RedisError:
+                    logger.exception("Cannot publish {count} events.", count=len(batch))
+        finally:
+            self._flush_task = None
+
+    async def _run_reader(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except redis.RedisError:
+                logger.exception("Message bus lost connection to Redis.")
+                await asyncio.sleep(1)
+                continue
+
+            if message is None:
+                continue
+
+            if message["type"] == "psubscribe":
+                self._confirm(message["channel"])
+            elif message["type"] == "pmessage":
+                self._receive(message["pattern"], message["data"])
+
+    @logger.catch
+    def _receive(self, channel: bytes, data: bytes) -> None:
+        origin, payload = data[: len(self._origin)], data[len(self._origin) :]
+
+        if origin == self._origin:
+            return
+
+        event = channel.decode().removeprefix(self.namespace)
+        # Only handlers of the matched subscription, as a publish matching
+        # several subscriptions is received once per subscription.
+        handlers = list(self._handlers.get(event, ()))
+        self._dispatch(handlers, Message.from_raw(payload))
@@ -0,0 +1,117 @@
+"""
+In-process cache of the lobby: open sessions and player counts.
+
+Lobby clients poll these far more often than they change. Responses are
+kept encoded, with an ETag, and are dropped when repositories report a
+change. Entity events are handled only by the process that emitted them,
+so changes made by other processes arrive as notifications, which are
+broadcast. Entries also expire on their own in case a message is lost.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+from pydantic import TypeAdapter
+
+from battleship.server import services
+from battleship.server.repositories import ClientRepository, SessionRepository
+from battleship.shared.events import (
+    EntityEvent,
+    Message,
+    NotificationEvent,
+    Subscription,
+)
+from battleship.shared.models import Session
+
+_sessions_adapter: TypeAdapter[list[Session]] = TypeAdapter(list[Session])
+
+
+class CachedResponse:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'.encode()
+        self.created_at = time.monotonic()
+
+
+class CachedEntry:
+    """
+    A response built on first request after it was invalidated.
+    Concurrent requests wait for the same build.
+    """
+
+    def __init__(self, build: Callable[[], Awaitable[bytes]], max_age: float) -> None:
+        self._build = build
+        self._max_age = max_age
+        self._response: CachedResponse | None = None
+        self._pending: asyncio.Future[CachedResponse] | None = None
+        # Bumped on every invalidation, a build that raced with one isn't kept.
+        self._version = 0
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._response = None
+        self._pending = None
+
+    async def get(self) -> CachedResponse:
+        response = self._response
+
+        if response is not None and time.monotonic() - response.created_at < self._max_age:
+            return response
+
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self._refresh())
+
+        return await asyncio.shield(self._pending)
+
+    async def _refresh(self) -> CachedResponse:
+        version = self._version
+
+        try:
+            response = CachedResponse(await self._build())
+        finally:
+            if version == self._version:
+                self._pending = None
+
+        if version == self._version:
+            self._response = response
+
+        return response
+
+
+class LobbyCache:
+    # Safety net for invalidations lost on the way.
+    MAX_AGE = 30
+
+    def __init__(
+        self, sessions: SessionRepository, clients: ClientRepository, max_age: float = MAX_AGE
+    ) -> None:
+        self._sessions = sessions
+        self._clients = clients
+        self.sessions = CachedEntry(self._build_sessions, max_age)
+        self.players = CachedEntry(self._build_players, max_age)
+
+    async def handle_session_event(self, message: Message[EntityEvent]) -> None:
+        self.sessions.invalidate()
+        self.players.invalidate()
+
+    async def handle_client_event(self, message: Message[EntityEvent]) -> None:
+        self.players.invalidate()
+
+    async def handle_notification_event(self, message: Message[NotificationEvent]) -> None:
+        match message.unwrap().subscription:
+            case Subscription.SESSIONS_UPDATE:
+                self.sessions.invalidate()
+            case Subscription.PLAYERS_UPDATE:
+                self.players.invalidate()
+
+    async def _build_sessions(self) -> bytes:
+        logger.trace("Build cached session list.")
+        return _sessions_adapter.dump_json(await self._sessions.list_open())
+
+    async def _build_players(self) -> bytes:
+        logger.trace("Build cached player count.")
+        count = await services.count_players(self._clients, self._sessions)
+        return count.to_json().encode()
@@ -1,3 +1,7 @@
+import tempfile
+from pathlib import Path
+from typing import Literal
+
 from pydantic import RedisDsn
 from pydantic_settings import BaseSettings
 
@@ -13,6 +17,17 @@ class Config(BaseSettings):
     SERVER_VERSION: str
     SENTRY_DSN: str
     METRICS_SCRAPER_SECRET: str
+    # Use "redis" to run several server processes: they exchange
+    # messages and share games via Redis.
+    MESSAGE_BUS: Literal["memory", "redis"] = "memory"
+    # Outbound messages a connection may have waiting to be sent. A client
+    # that falls behind is disconnected and resyncs its game on reconnect,
+    # or loses its oldest messages with "drop_oldest".
+    SEND_QUEUE_SIZE: int = 256
+    SEND_QUEUE_OVERFLOW: Literal["disconnect", "drop_oldest"] = "disconnect"
+    # Game results that couldn't be saved to Redis wait here. Processes on
+    # the same host may share the file. Put it on a volume to keep them across container restarts.
+    STATISTICS_SPILL_PATH: Path = Path(tempfile.gettempdir()) / "battleship-statistics.jsonl"
 
     @property
     def auth0_audience(self) -> str:
@@ -1,8 +1,14 @@
 from redis.asyncio import Redis
-from rodi import Container
+from rodi import ActivationScope, Container
 
 from battleship.server.auth import Auth0AuthManager, AuthManager
-from battleship.server.bus import InMemoryMessageBus, MessageBus
+from battleship.server.bus import (
+    Delivery,
+    InMemoryMessageBus,
+    MessageBus,
+    RedisMessageBus,
+)
+from battleship.server.cache import LobbyCache
 from battleship.server.config import Config, get_config
 from battleship.server.game import GameManager
 from battleship.server.handlers import (
@@ -12,9 +18,15 @@ from battleship.server.handlers import (
     PlayersOnlineSubscriptionHandler,
     SessionUpdateHandler,
 )
+from battleship.server.notifications import NotificationHub
+from battleship.server.placement import LocalPlacement, Placement, RedisPlacement
 from battleship.server.repositories import (
     ClientRepository,
+    GameRepository,
+    LeaderboardRepository,
     RedisClientRepository,
+    RedisGameRepository,
+    RedisLeaderboardRepository,
     RedisSessionRepository,
     RedisStatisticsRepository,
     RedisSubscriptionsRepository,
@@ -22,6 +34,7 @@ from battleship.server.repositories import (
     StatisticsRepository,
     SubscriptionRepository,
 )
+from battleship.server.summaries import SummaryWriter
 
 
 def connect_event_handlers(services: Container) -> None:
@@ -31,6 +44,49 @@ def connect_event_handlers(services: Container) -> None:
     message_bus.subscribe("entities.client", services.resolve(PlayersOnlineSubscriptionHandler))
     message_bus.subscribe("websocket", services.resolve(ClientDisconnectedHandler))
     message_bus.subscribe("games", services.resolve(HandleServerGameEvent))
+    notification_hub = services.resolve(NotificationHub)
+    message_bus.subscribe("notifications", notification_hub.handle_notification_event)
+    message_bus.subscribe("entities.subscription", notification_hub.handle_subscription_event)
+    lobby_cache = services.resolve(LobbyCache)
+    message_bus.subscribe("entities.session", lobby_cache.handle_session_event)
+    message_bus.subscribe("entities.client", lobby_cache.handle_client_event)
+    message_bus.subscribe("notifications", lobby_cache.handle_notification_event)
+    # Game commands forwarded by other workers.
+    worker_id = services.resolve(Placement).worker_id
+    message_bus.subscribe("workers", services.resolve(HandleServerGameEvent))
+    message_bus.subscribe(f"workers.{worker_id}", services.resolve(HandleServerGameEvent))
+
+
+# Repository events and game commands are handled by the process
+# that emitted them, each process subscribes its own handlers.
+MESSAGE_ROUTES = {
+    # Subscribed connections can be in any process.
+    "entities.subscription": Delivery.BROADCAST,
+    "entities.*": Delivery.LOCAL,
+    "websocket": Delivery.LOCAL,
+    "games": Delivery.LOCAL,
+    "clients.*": Delivery.DIRECT,
+    "workers.*": Delivery.DIRECT,
+}
+
+
+def build_message_bus(config: Config, redis: Redis) -> MessageBus:
+    if config.MESSAGE_BUS == "redis":
+        return RedisMessageBus(redis, MESSAGE_ROUTES)
+
+    return InMemoryMessageBus()
+
+
+def build_placement(config: Config, redis: Redis) -> Placement:
+    if config.MESSAGE_BUS == "redis":
+        return RedisPlacement(redis)
+
+    return LocalPlacement()
+
+
+def build_summary_writer(scope: ActivationScope) -> SummaryWriter:
+    config = scope.get(Config)
+    return SummaryWriter(scope.get(StatisticsRepository), config.STATISTICS_SPILL_PATH)
 
 
 def build_container() -> Container:
@@ -38,10 +94,11 @@ def build_container() -> Container:
     config = get_config()
     redis = Redis.from_url(str(config.REDIS_URL))
     container.add_instance(redis, Redis)
-    message_bus = InMemoryMessageBus()
+    message_bus = build_message_bus(config, redis)
 
     container.add_singleton_by_factory(get_config, Config)
     container.add_instance(message_bus, MessageBus)
+    container.add_instance(build_placement(config, redis), Placement)
     container.add_singleton(SessionUpdateHandler)
     container.add_singleton(PlayersIngameSubscriptionHandler)
     container.add_singleton(PlayersOnlineSubscriptionHandler)
@@ -51,6 +108,11 @@ def build_container() -> Container:
     container.add_singleton(SessionRepository, RedisSessionRepository)
     container.add_singleton(ClientRepository, RedisClientRepository)
     container.add_singleton(StatisticsRepository, RedisStatisticsRepository)
+    container.add_singleton(GameRepository, RedisGameRepository)
+    container.add_singleton(LeaderboardRepository, RedisLeaderboardRepository)
     container.add_singleton(SubscriptionRepository, RedisSubscriptionsRepository)
+    container.add_singleton_by_factory(build_summary_writer, SummaryWriter)
     container.add_singleton(GameManager)
+    container.add_singleton(NotificationHub)
+    container.add_singleton(LobbyCache)
     return container
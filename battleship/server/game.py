@@ -1,6 +1,6 @@
 import asyncio
 from time import time
-from typing import Collection, Literal
+from typing import Any, Collection, Iterable, Literal
 
 from loguru import logger
 
@@ -8,11 +8,15 @@ from battleship.engine import create_game, domain
 from battleship.engine.rosters import get_roster
 from battleship.server import metrics
 from battleship.server.bus import MessageBus
+from battleship.server.placement import Placement
 from battleship.server.repositories import (
     ClientRepository,
+    GameRepository,
+    SavedGame,
     SessionRepository,
-    StatisticsRepository,
 )
+from battleship.server.repositories.sessions import SessionNotFound
+from battleship.server.summaries import SummaryWriter
 from battleship.shared.events import (
     ClientGameEvent,
     GameEvent,
@@ -30,23 +34,43 @@ from battleship.shared.models import (
 
 class Game:
     def __init__(
-        self, host: Client, guest: Client, session: Session, message_bus: MessageBus
+        self,
+        host: Client,
+        guest: Client,
+        session: Session,
+        message_bus: MessageBus,
+        game_repository: GameRepository | None = None,
+        saved_game: SavedGame | None = None,
     ) -> None:
         self.host = host
         self.guest = guest
         self.session_id = session.id
         self.roster = get_roster(session.roster)
-        self.game = create_game(
-            player_a=host.nickname,
-            player_b=guest.nickname,
-            roster=self.roster,
-            firing_order=session.firing_order,
-            salvo_mode=session.salvo_mode,
-            no_adjacent_ships=session.no_adjacent_ships,
-        )
         self.message_bus = message_bus
-        self.summary = GameSummary()
-        self.start: float = 0
+        self.game_repository = game_repository
+        self.resumed = saved_game is not None
+        self.suspended = False
+        # Sent to a player who missed the end of the game.
+        self.result: Message[GameEvent] | None = None
+
+        if saved_game is None:
+            self.game = create_game(
+                player_a=host.nickname,
+                player_b=guest.nickname,
+                roster=self.roster,
+                firing_order=session.firing_order,
+                salvo_mode=session.salvo_mode,
+                no_adjacent_ships=session.no_adjacent_ships,
+                board_type=domain.BitBoard,
+                sync_events=True,
+            )
+            self.summary = GameSummary()
+            self.start: float = 0
+        else:
+            self.game = domain.Game.restore(saved_game.snapshot, sync_events=True)
+            self.summary = saved_game.summary
+            self.start = saved_game.start
+
         self.clients: dict[str, Client] = {host.nickname: host, guest.nickname: guest}
         self.players: dict[str, domain.Player] = {
             self.game.player_a.name: self.game.player_a,
@@ -58,10 +82,15 @@ class Game:
         self.game.on(domain.GameEnded, self.on_game_ended)
 
         self._event_queue: asyncio.Queue[Message[GameEvent]] = asyncio.Queue()
+        self._save_requested = asyncio.Event()
         self._background_tasks = [
             self._run_broadcaster(),
         ]
         self._stop_event = asyncio.Event()
+        self._sending: set[asyncio.Task[None]] = set()
+
+        if game_repository is not None:
+            self._background_tasks.append(self._run_saver())
 
     def __repr__(self) -> str:
         return f"<Game {self.session_id} | {self.host} vs {self.guest}>"
@@ -82,23 +111,110 @@ class Game:
 
         return asyncio.create_task(broadcaster())
 
+    def _run_saver(self) -> asyncio.Task[None]:
+        @logger.catch
+        async def saver() -> None:
+            # Moves that arrive while saving are coalesced into the next save.
+            while True:
+                await self._save_requested.wait()
+                self._save_requested.clear()
+                await self.save()
+
+        return asyncio.create_task(saver())
+
     def stop(self) -> None:
         self._stop_event.set()
 
+    def suspend(self) -> None:
+        """
+        Marks the game as suspended: it is going to be resumed by another
+        server process, so stopping it doesn't cancel it for the players.
+        """
+        self.suspended = True
+
+    def dump(self) -> SavedGame:
+        return SavedGame(
+            session_id=self.session_id,
+            host=self.host,
+            guest=self.guest,
+            snapshot=self.game.snapshot(),
+            summary=self.summary,
+            start=self.start,
+        )
+
+    async def save(self) -> None:
+        if self.game_repository is not None:
+            await self.game_repository.save(self.dump())
+
+    def resync(self, client_id: str) -> None:
+        """
+        Sends a reconnected client everything it missed: the state of
+        both boards, then whose move it is or how the game ended.
+        """
+        client = self.host if client_id == self.host.id else self.guest
+        messages = [self.get_state(client)]
+
+        if self.game.state == domain.GameState.BATTLE:
+            messages.append(self.awaiting_move(self.game.actor, self.game.subject))
+        elif self.result is not None:
+            messages.append(self.result)
+
+        self.send(client_id, *messages)
+
+    def get_state(self, client: Client) -> Message[GameEvent]:
+        player = self.players[client.nickname]
+        payload = dict(
+            # Enemy ships stay hidden, only shots at them are sent.
+            ships={ship.id: [coor.to_human() for coor in ship.cells] for ship in player.ships},
+            fleets_ready=[
+                name for name, owner in self.players.items() if len(owner.ships) == len(self.roster)
+            ],
+            salvos=[
+                salvo_to_model(self._get_shots(actor, subject)).to_json()
+                for actor, subject in (
+                    (self.game.player_a, self.game.player_b),
+                    (self.game.player_b, self.game.player_a),
+                )
+            ],
+        )
+        return Message(event=GameEvent(type=ServerGameEvent.GAME_STATE, payload=payload))
+
+    @staticmethod
+    def _get_shots(actor: domain.Player, subject: domain.Player) -> domain.Salvo:
+        # Every shot fired at the subject so far, as if in a single salvo.
+        salvo = domain.Salvo(actor, subject)
+
+        for cell in subject.board.cells:
+            if cell.is_shot:
+                salvo.add_shot(domain.Shot(cell.coordinate, cell.ship is not None, cell.ship))
+
+        return salvo
+
+    @staticmethod
+    def awaiting_move(actor: domain.Player, subject: domain.Player) -> Message[GameEvent]:
+        payload = dict(actor=actor.name, subject=subject.name)
+        return Message(event=GameEvent(type=ServerGameEvent.AWAITING_MOVE, payload=payload))
+
+    def send(self, client_id: str, *messages: Message[GameEvent]) -> None:
+        """
+        Sends messages to a single client in order, without waiting.
+        """
+
+        @logger.catch
+        async def sender() -> None:
+            for msg in messages:
+                await self.message_bus.emit(f"clients.out.{client_id}", msg)
+
+        # Keeps the task from being garbage collected before it's done.
+        task = asyncio.create_task(sender())
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
     def broadcast(self, msg: Message[GameEvent]) -> None:
         self._event_queue.put_nowait(msg)
 
     def on_next_move(self, event: domain.NextMove) -> None:
-        payload = dict(actor=event.actor.name, subject=event.subject.name)
-
-        self.broadcast(
-            Message(
-                event=GameEvent(
-                    type=ServerGameEvent.AWAITING_MOVE,
-                    payload=payload,
-                )
-            )
-        )
+        self.broadcast(self.awaiting_move(event.actor, event.subject))
 
     def send_salvo(self, salvo: domain.Salvo) -> None:
         model = salvo_to_model(salvo)
@@ -110,13 +226,13 @@ class Game:
     def on_game_ended(self, event: domain.GameEnded) -> None:
         self.summary.finalize(event.winner, start=self.start, end=time())
 
-        msg = Message[GameEvent](
+        self.result = Message[GameEvent](
             event=GameEvent(
                 type=ServerGameEvent.GAME_ENDED,
                 payload=dict(winner=event.winner.name, summary=self.summary.to_json()),
             )
         )
-        self.broadcast(msg)
+        self.broadcast(self.result)
         self.stop()
 
     def on_ship_spawned(
@@ -127,8 +243,7 @@ class Game:
         msg = Message[GameEvent](
             event=GameEvent(type=ServerGameEvent.SHIP_SPAWNED, payload=payload)
         )
-        client = self.clients[event.player.name]
-        asyncio.create_task(self.message_bus.emit(f"clients.out.{client.id}", msg))
+        self.send(self.clients[event.player.name].id, msg)
 
         if event.fleet_ready:
             self.broadcast(
@@ -153,8 +268,7 @@ class Game:
             self.broadcast(msg)
         else:
             client = self.guest if self.host.nickname == by_player else self.host
-            client = self.clients[client.nickname]
-            asyncio.create_task(self.message_bus.emit(f"clients.out.{client.id}", msg))
+            self.send(client.id, msg)
 
     def announce_game_start(self) -> None:
         game_options = dict(
@@ -164,41 +278,35 @@ class Game:
             no_adjacent_ships=self.game.no_adjacent_ships,
         )
 
-        asyncio.create_task(
-            self.message_bus.emit(
-                f"clients.out.{self.host.id}",
-                Message(
-                    event=GameEvent(
-                        type=ServerGameEvent.START_GAME,
-                        payload=dict(enemy=self.guest.nickname, **game_options),
-                    )
-                ),
-            )
-        )
-        asyncio.create_task(
-            self.message_bus.emit(
-                f"clients.out.{self.guest.id}",
+        for client, enemy in ((self.host, self.guest), (self.guest, self.host)):
+            self.send(
+                client.id,
                 Message(
                     event=GameEvent(
                         type=ServerGameEvent.START_GAME,
-                        payload=dict(enemy=self.host.nickname, **game_options),
+                        payload=dict(enemy=enemy.nickname, **game_options),
                     )
                 ),
             )
-        )
 
     async def play(self) -> GameSummary:
-        metrics.games_started_total.inc({})
         self.connect_event_handlers()
-        self.announce_game_start()
-        self.start = time()
+        # Moves sent through other processes must not be lost.
+        await self.message_bus.subscribed()
+
+        if not self.resumed:
+            metrics.games_started_total.inc({})
+            self.announce_game_start()
+            self.start = time()
+            await self.save()
 
         try:
             await self._stop_event.wait()
             metrics.games_finished_total.inc({})
             return self.summary
         except asyncio.CancelledError:
-            self.send_game_cancelled(reason="disconnect")
+            if not self.suspended:
+                self.send_game_cancelled(reason="disconnect")
             raise
         finally:
             await self.cleanup()
@@ -215,6 +323,9 @@ class Game:
 
         self.disconnect_event_handlers()
 
+        if self.suspended:
+            await self.save()
+
     def fire(self, position: Collection[str]) -> None:
         salvo = self.game.fire(position)
         self.summary.update_shots(salvo)
@@ -235,9 +346,11 @@ class Game:
                     ship_id: str = event.payload["ship_id"]
                     position: Collection[str] = event.payload["position"]
                     self.add_ship(client_nickname, position, ship_id)
+                    self._save_requested.set()
                 case GameEvent(type=ClientGameEvent.FIRE):
                     position: Collection[str] = event.payload["position"]  # type: ignore[no-redef]
                     self.fire(position)
+                    self._save_requested.set()
                 case GameEvent(type=ClientGameEvent.CANCEL_GAME):
                     self.send_game_cancelled(reason="quit", by_player=client_nickname)
                     self.stop()
@@ -267,64 +380,305 @@ class Game:
 
 
 class GameManager:
+    # How long a started game waits for a disconnected player to come back.
+    RECONNECT_TIMEOUT = 30
+    # How often leases on games are renewed and orphaned games are adopted.
+    SUPERVISE_INTERVAL = 10
+
     def __init__(
         self,
         sessions: SessionRepository,
         clients: ClientRepository,
-        statistics: StatisticsRepository,
+        summaries: SummaryWriter,
+        games: GameRepository,
         message_bus: MessageBus,
+        placement: Placement,
     ):
         self._clients = clients
         self._sessions = sessions
-        self._statistics = statistics
+        self._summaries = summaries
+        self._saved_games = games
         self._message_bus = message_bus
+        self._placement = placement
         self._games: dict[str, tuple[Game, asyncio.Task[None]]] = {}
+        self._reconnect_timers: dict[str, asyncio.TimerHandle] = {}
+        # Results of games that ended while a player was away, by client ID.
+        self._missed_results: dict[str, Message[GameEvent]] = {}
+        self._supervisor: asyncio.Task[None] | None = None
+
+    @property
+    def worker_id(self) -> str:
+        return self._placement.worker_id
 
     def get_game(self, session_id: str) -> Game:
         game, _ = self._games[session_id]
         return game
 
+    async def start(self) -> None:
+        await self._placement.start()
+        await self.adopt_games()
+        self._supervisor = asyncio.create_task(self._run_supervisor())
+
+    async def close(self) -> None:
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            await asyncio.gather(self._supervisor, return_exceptions=True)
+
+        await self.suspend_games()
+        await self._placement.close()
+
     @logger.catch
     async def run_game(self, game: Game) -> None:
         try:
             metrics.games_now.inc({})
             summary = await game.play()
         finally:
-            await self._sessions.delete(game.session_id)
+            # A suspended game lives on in another process.
+            if not game.suspended:
+                await self._sessions.delete(game.session_id)
+                await self._saved_games.delete(game.session_id)
+
+            await self._placement.release(game.session_id)
             self._games.pop(game.session_id, None)
+
+            for client in (game.host, game.guest):
+                if game.result is not None and client.id in self._reconnect_timers:
+                    self._missed_results[client.id] = game.result
             logger.trace("Game {session_id} is cleaned up.", session_id=game.session_id)
             metrics.games_now.dec({})
 
-        await self.save_game_summary(game, summary)
+        self.save_game_summary(game, summary)
 
-    async def save_game_summary(self, game: Game, summary: GameSummary) -> None:
-        string_summary = summary.to_json()
-
-        # Replace player nickname with their ID.
-        string_summary = string_summary.replace(game.host.nickname, game.host.id).replace(
-            game.guest.nickname, game.guest.id
+    def save_game_summary(self, game: Game, summary: GameSummary) -> None:
+        # Players are named by nicknames in the game, statistics are kept by IDs.
+        ids = {game.host.nickname: game.host.id, game.guest.nickname: game.guest.id}
+        summary = summary.model_copy(
+            update=dict(
+                shots={ids[name]: shots for name, shots in summary.shots.items()},
+                hits={ids[name]: hits for name, hits in summary.hits.items()},
+                winner=ids.get(summary.winner) if summary.winner else None,
+            )
         )
 
-        summary = GameSummary.from_raw(string_summary)
-
         for client in (game.host, game.guest):
             if not client.guest:
-                await self._statistics.save(client.id, summary)
+                self._summaries.add(client, summary)
+
+    async def start_new_game(self, session_id: str, worker_id: str | None = None) -> None:
+        """
+        Starts the game on the worker it's assigned to. `worker_id` is
+        set when the game was forwarded here by another worker.
+        """
+        worker_id = worker_id or self._placement.assign(session_id)
+
+        if worker_id != self.worker_id:
+            await self._forward(worker_id, ServerGameEvent.START_GAME, session_id)
+            return
+
+        if not await self._placement.acquire(session_id):
+            logger.warning("Game {session_id} is already played.", session_id=session_id)
+            return
+
+        try:
+            session = await self._sessions.get(session_id)
+            players = await asyncio.gather(
+                self._clients.get(session.host_id),
+                self._clients.get(session.guest_id),
+            )
+        except Exception:
+            await self._placement.release(session_id)
+            raise
 
-    async def start_new_game(self, session_id: str) -> None:
-        session = await self._sessions.get(session_id)
-        players = await asyncio.gather(
-            self._clients.get(session.host_id),
-            self._clients.get(session.guest_id),
-        )
         host, guest = players
 
         logger.debug(f"Start new game {host.nickname} vs. {guest.nickname}.")
-        game = Game(host, guest, session, self._message_bus)
+        game = Game(host, guest, session, self._message_bus, self._saved_games)
         await self._sessions.update(session.id, guest_id=guest.id, started=True)
-        task = asyncio.create_task(self.run_game(game))
-        self._games[session.id] = (game, task)
+        self._run(game)
+
+    async def adopt_games(self) -> int:
+        """
+        Resumes saved games assigned to this worker that no worker plays, e.g.
+        games of a worker that was stopped or died. Players have
+        `RECONNECT_TIMEOUT` seconds to reconnect, otherwise the game is cancelled.
+        """
+        count = 0
+        session_ids = [
+            session_id
+            for session_id in await self._saved_games.list_ids()
+            if session_id not in self._games
+            and self._placement.assign(session_id) == self.worker_id
+        ]
+        acquired = [
+            session_id
+            for session_id in await self._placement.find_unleased(session_ids)
+            if await self._placement.acquire(session_id)
+        ]
+
+        saved_games = await self._saved_games.get_many(acquired)
+
+        # Finished or expired since they were listed.
+        for session_id in set(acquired) - {saved_game.session_id for saved_game in saved_games}:
+            await self._placement.release(session_id)
+
+        for saved_game in saved_games:
+            session_id = saved_game.session_id
+
+            try:
+                session = await self._sessions.get(session_id)
+            except SessionNotFound:
+                await self._saved_games.delete(session_id)
+                await self._placement.release(session_id)
+                continue
+
+            logger.debug("Resume game {session_id}.", session_id=session.id)
+            game = Game(
+                saved_game.host,
+                saved_game.guest,
+                session,
+                self._message_bus,
+                self._saved_games,
+                saved_game,
+            )
+            self._run(game)
+
+            for client in (game.host, game.guest):
+                await self.client_disconnected(session.id, client.id)
+
+            count += 1
+
+        return count
+
+    async def suspend_games(self, session_ids: Iterable[str] | None = None) -> None:
+        """
+        Saves and stops games without cancelling them,
+        so they can be resumed by another server process.
+        """
+        tasks = []
+
+        for session_id in list(self._games if session_ids is None else session_ids):
+            game, task = self._games[session_id]
+            game.suspend()
+            task.cancel()
+            tasks.append(task)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def client_disconnected(self, session_id: str, client_id: str) -> None:
+        """
+        Cancels the game unless the client reconnects in time.
+        """
+        if session_id not in self._games:
+            await self._forward_to_owner(
+                session_id, ServerGameEvent.CANCEL_GAME, dict(client_id=client_id)
+            )
+            return
+
+        loop = asyncio.get_running_loop()
+        self._reconnect_timers[client_id] = loop.call_later(
+            self.RECONNECT_TIMEOUT, self._check_abandoned_game, session_id, client_id
+        )
+
+    async def client_connected(self, client_id: str) -> None:
+        # The game can be played by any worker.
+        await self._message_bus.emit(
+            "workers",
+            Message(
+                event=GameEvent(type=ServerGameEvent.RESUME_GAME, payload=dict(client_id=client_id))
+            ),
+        )
+
+    async def resume_client(self, client_id: str) -> None:
+        timer = self._reconnect_timers.pop(client_id, None)
+
+        if timer is None:
+            return
+
+        timer.cancel()
+
+        if (result := self._missed_results.pop(client_id, None)) is not None:
+            await self._message_bus.emit(f"clients.out.{client_id}", result)
+            return
+
+        for game, _ in self._games.values():
+            if client_id in (game.host.id, game.guest.id):
+                game.resync(client_id)
+
+    async def cancel_game(self, session_id: str) -> None:
+        if session_id not in self._games:
+            await self._forward_to_owner(session_id, ServerGameEvent.CANCEL_GAME)
+            return
 
-    def cancel_game(self, session_id: str) -> None:
         _, task = self._games[session_id]
         task.cancel()
+
+    def _run(self, game: Game) -> None:
+        task = asyncio.create_task(self.run_game(game))
+        self._games[game.session_id] = (game, task)
+
+    async def _forward(
+        self,
+        worker_id: str,
+        event_type: ServerGameEvent,
+        session_id: str,
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        payload = dict(payload or {}, worker_id=worker_id)
+        await self._message_bus.emit(
+            f"workers.{worker_id}",
+            Message(event=GameEvent(type=event_type, session_id=session_id, payload=payload)),
+        )
+
+    async def _forward_to_owner(
+        self,
+        session_id: str,
+        event_type: ServerGameEvent,
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        owner = await self._placement.get_owner(session_id)
+
+        if owner is not None and owner != self.worker_id:
+            await self._forward(owner, event_type, session_id, payload)
+
+    def _check_abandoned_game(self, session_id: str, client_id: str) -> None:
+        self._reconnect_timers.pop(client_id, None)
+        asyncio.create_task(self._cancel_abandoned_game(session_id, client_id))
+
+    @logger.catch
+    async def _cancel_abandoned_game(self, session_id: str, client_id: str) -> None:
+        result = self._missed_results.pop(client_id, None)
+
+        # The client could reconnect to another worker before this one adopted the game.
+        if await self._clients.exists(client_id):
+            if result is not None:
+                await self._message_bus.emit(f"clients.out.{client_id}", result)
+            elif session_id in self._games:
+                self.get_game(session_id).resync(client_id)
+
+            return
+
+        if result is None:
+            await self.cancel_game(session_id)
+
+    async def _run_supervisor(self) -> None:
+        while True:
+            await asyncio.sleep(self.SUPERVISE_INTERVAL)
+
+            try:
+                await self.supervise()
+            except Exception:
+                # Leases must be renewed on the next round anyway.
+                logger.exception("Cannot supervise games.")
+
+    async def supervise(self) -> None:
+        await self._placement.refresh()
+        # Clients connected here are alive as long as this worker is.
+        await self._clients.refresh()
+        lost = await self._placement.renew(list(self._games))
+
+        if lost:
+            # Another worker can adopt them already.
+            logger.warning("Leases on games {lost} are lost.", lost=lost)
+            await self.suspend_games(lost)
+
+        await self.adopt_games()
@@ -107,9 +107,7 @@ class PlayersIngameSubscriptionHandler:
         if event.action not in (Action.START, Action.REMOVE):
             return
 
-        sessions = await self._sessions.list()
-        started_sessions = [s for s in sessions if s.started]
-        players_ingame = len(started_sessions) * 2
+        players_ingame = await self._sessions.count_started() * 2
         payload = dict(type="ingame_changed", count=players_ingame)
 
         await self._message_bus.emit(
@@ -159,7 +157,9 @@ class ClientDisconnectedHandler:
                     "games",
                     Message(
                         event=GameEvent(
-                            type=ServerGameEvent.CANCEL_GAME, session_id=current_session.id
+                            type=ServerGameEvent.CANCEL_GAME,
+                            session_id=current_session.id,
+                            payload=dict(client_id=event.client_id),
                         )
                     ),
                 )
@@ -175,10 +175,22 @@ class HandleServerGameEvent:
 
     async def __call__(self, message: Message[GameEvent]) -> None:
         event = message.unwrap()
+
+        if event.type == ServerGameEvent.RESUME_GAME:
+            await self._game_manager.resume_client(event.payload["client_id"])
+            return
+
         assert event.session_id, "Session ID missing in a game event"
 
         match event.type:
             case ServerGameEvent.START_GAME:
-                await self._game_manager.start_new_game(event.session_id)
+                await self._game_manager.start_new_game(
+                    event.session_id, event.payload.get("worker_id")
+                )
+            case ServerGameEvent.CANCEL_GAME if "client_id" in event.payload:
+                # The player may come back, give them some time.
+                await self._game_manager.client_disconnected(
+                    event.session_id, event.payload["client_id"]
+                )
             case ServerGameEvent.CANCEL_GAME:
-                self._game_manager.cancel_game(event.session_id)
+                await self._game_manager.cancel_game(event.session_id)
@@ -3,7 +3,7 @@ from typing import Any
 from aioprometheus.asgi.middleware import EXCLUDE_PATHS
 from aioprometheus.asgi.middleware import MetricsMiddleware as _MetricsMiddleware
 from aioprometheus.asgi.middleware import Receive, Scope, Send
-from aioprometheus.collectors import REGISTRY, Counter, Gauge
+from aioprometheus.collectors import REGISTRY, Counter, Gauge, Histogram
 from aioprometheus.renderer import render
 from blacksheep import Request, Router
 from guardpost import AuthenticationHandler, Identity
@@ -20,6 +20,22 @@ websocket_messages_out = Counter(
     "websocket_messages_out_total",
     doc="Outbound WebSocket messages amount",
 )
+websocket_send_queue = Gauge(
+    "websocket_send_queue",
+    doc="Outbound WebSocket messages waiting to be sent",
+)
+websocket_send_latency_seconds = Histogram(
+    "websocket_send_latency_seconds",
+    doc="Time an outbound WebSocket message spends in the send queue",
+)
+websocket_messages_dropped = Counter(
+    "websocket_messages_dropped_total",
+    doc="Outbound WebSocket messages dropped before sending",
+)
+websocket_send_queue_overflows = Counter(
+    "websocket_send_queue_overflows_total",
+    doc="Connections closed because their send queue overflowed",
+)
 games_started_total = Counter(
     "games_started_total",
     doc="Started games amount",
@@ -0,0 +1,60 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from battleship.shared.events import (
+    EntityEvent,
+    Message,
+    NotificationEvent,
+    Subscription,
+)
+from battleship.shared.models import Action
+
+if TYPE_CHECKING:
+    from battleship.server.websocket import Connection
+
+
+class NotificationHub:
+    """
+    Delivers notifications to subscribed connections of this server process.
+
+    Keeps an index of local subscribers, updated from subscription entity
+    events, so a notification costs one lookup instead of a Redis query
+    per connection.
+    """
+
+    def __init__(self) -> None:
+        self._connections: dict[str, "Connection"] = {}
+        self._subscribers: dict[Subscription, set[str]] = defaultdict(set)
+
+    def connect(self, connection: "Connection") -> None:
+        self._connections[connection.connection_id] = connection
+
+    def disconnect(self, connection: "Connection") -> None:
+        if self._connections.get(connection.connection_id) is not connection:
+            # Replaced by a newer connection of the same client.
+            return
+
+        del self._connections[connection.connection_id]
+
+        for subscribers in self._subscribers.values():
+            subscribers.discard(connection.connection_id)
+
+    def get_subscribers(self, subscription: Subscription) -> set[str]:
+        return self._subscribers[subscription]
+
+    async def handle_subscription_event(self, message: Message[EntityEvent]) -> None:
+        event = message.unwrap()
+        subscription = Subscription(event.payload["subscription"])
+
+        if event.action == Action.ADD and event.entity_id in self._connections:
+            self._subscribers[subscription].add(event.entity_id)
+
+        if event.action == Action.REMOVE:
+            self._subscribers[subscription].discard(event.entity_id)
+
+    async def handle_notification_event(self, message: Message[NotificationEvent]) -> None:
+        event = message.unwrap()
+
+        # Connections only queue the message, a slow client can't hold up others.
+        for subscriber in self._subscribers[event.subscription]:
+            await self._connections[subscriber].send_event(message)
@@ -0,0 +1,232 @@
+"""
+Placement of games on server processes (workers).
+
+A new game is assigned to a worker by consistent hashing of its session ID
+over the live workers, so adding or removing a worker moves only a small
+share of new games. The worker playing a game holds a lease on it in Redis:
+a game is never played by two workers at once, and games of a worker that
+died are adopted by others once their leases expire.
+"""
+
+import abc
+import bisect
+import hashlib
+import time
+import uuid
+from collections.abc import Iterable
+
+import redis.asyncio as redis
+
+
+class HashRing:
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 64) -> None:
+        self._replicas = replicas
+        self._nodes: frozenset[str] = frozenset()
+        self._keys: list[int] = []
+        self._ring: list[str] = []
+        self.update(nodes)
+
+    @property
+    def nodes(self) -> frozenset[str]:
+        return self._nodes
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def update(self, nodes: Iterable[str]) -> None:
+        self._nodes = frozenset(nodes)
+        points = sorted(
+            (self._hash(f"{node}:{i}"), node) for node in self._nodes for i in range(self._replicas)
+        )
+        self._keys = [key for key, _ in points]
+        self._ring = [node for _, node in points]
+
+    def get(self, key: str) -> str:
+        if not self._ring:
+            raise LookupError("Hash ring has no nodes.")
+
+        i = bisect.bisect(self._keys, self._hash(key)) % len(self._keys)
+        return self._ring[i]
+
+
+class Placement(abc.ABC):
+    worker_id: str
+
+    @abc.abstractmethod
+    async def start(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def refresh(self) -> None:
+        """
+        Tells other workers this one is alive and updates the list of workers.
+        """
+
+    @abc.abstractmethod
+    def assign(self, session_id: str) -> str:
+        """
+        Returns ID of the worker that should play given session.
+        """
+
+    @abc.abstractmethod
+    async def find_unleased(self, session_ids: Iterable[str]) -> list[str]:
+        """
+        Returns sessions no worker holds a lease on.
+        """
+
+    @abc.abstractmethod
+    async def acquire(self, session_id: str) -> bool:
+        pass
+
+    @abc.abstractmethod
+    async def renew(self, session_ids: Iterable[str]) -> list[str]:
+        """
+        Extends leases on given sessions. Returns sessions whose leases were lost.
+        """
+
+    @abc.abstractmethod
+    async def release(self, session_id: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def get_owner(self, session_id: str) -> str | None:
+        pass
+
+
+class LocalPlacement(Placement):
+    """
+    Placement for a single server process: it plays all games.
+    """
+
+    def __init__(self) -> None:
+        self.worker_id = uuid.uuid4().hex
+        self._leases: set[str] = set()
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def refresh(self) -> None:
+        pass
+
+    def assign(self, session_id: str) -> str:
+        return self.worker_id
+
+    async def find_unleased(self, session_ids: Iterable[str]) -> list[str]:
+        return [session_id for session_id in session_ids if session_id not in self._leases]
+
+    async def acquire(self, session_id: str) -> bool:
+        if session_id in self._leases:
+            return False
+
+        self._leases.add(session_id)
+        return True
+
+    async def renew(self, session_ids: Iterable[str]) -> list[str]:
+        return [session_id for session_id in session_ids if session_id not in self._leases]
+
+    async def release(self, session_id: str) -> None:
+        self._leases.discard(session_id)
+
+    async def get_owner(self, session_id: str) -> str | None:
+        return self.worker_id if session_id in self._leases else None
+
+
+RENEW_LEASE = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("EXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LEASE = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisPlacement(Placement):
+    workers_key = "workers"
+    namespace = "leases:"
+    # Both workers and leases expire unless refreshed in time.
+    ttl = 30
+
+    def __init__(self, client: redis.Redis) -> None:
+        self.worker_id = uuid.uuid4().hex
+        self._client = client
+        self._ring = HashRing([self.worker_id])
+        self._renew_lease = client.register_script(RENEW_LEASE)
+        self._release_lease = client.register_script(RELEASE_LEASE)
+
+    def get_key(self, session_id: str) -> str:
+        return f"{self.namespace}{session_id}"
+
+    async def start(self) -> None:
+        await self.refresh()
+
+    async def close(self) -> None:
+        await self._client.zrem(self.workers_key, self.worker_id)
+
+    async def refresh(self) -> None:
+        now = time.time()
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.workers_key, {self.worker_id: now + self.ttl})
+            pipe.zremrangebyscore(self.workers_key, "-inf", now)
+            pipe.zrange(self.workers_key, 0, -1)
+            *_, workers = await pipe.execute()
+
+        nodes = {worker.decode() for worker in workers}
+
+        if nodes != self._ring.nodes:
+            self._ring.update(nodes)
+
+    def assign(self, session_id: str) -> str:
+        return self._ring.get(session_id)
+
+    async def find_unleased(self, session_ids: Iterable[str]) -> list[str]:
+        session_ids = list(session_ids)
+
+        if not session_ids:
+            return []
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.exists(self.get_key(session_id))
+
+            leased = await pipe.execute()
+
+        return [session_id for session_id, exists in zip(session_ids, leased) if not exists]
+
+    async def acquire(self, session_id: str) -> bool:
+        key = self.get_key(session_id)
+        return bool(await self._client.set(key, self.worker_id, nx=True, ex=self.ttl))
+
+    async def renew(self, session_ids: Iterable[str]) -> list[str]:
+        session_ids = list(session_ids)
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                await self._renew_lease(
+                    keys=[self.get_key(session_id)], args=[self.worker_id, self.ttl], client=pipe
+                )
+
+            renewed = await pipe.execute()
+
+        return [session_id for session_id, ok in zip(session_ids, renewed) if not ok]
+
+    async def release(self, session_id: str) -> None:
+        await self._release_lease(keys=[self.get_key(session_id)], args=[self.worker_id])
+
+    async def get_owner(self, session_id: str) -> str | None:
+        owner = await self._client.get(self.get_key(session_id))
+        return owner.decode() if owner else None
@@ -1,4 +1,6 @@
 from .clients import ClientRepository, RedisClientRepository
+from .games import GameRepository, RedisGameRepository, SavedGame
+from .leaderboard import LeaderboardRepository, RedisLeaderboardRepository
 from .sessions import RedisSessionRepository, SessionRepository
 from .statistics import RedisStatisticsRepository, StatisticsRepository
 from .subscriptions import RedisSubscriptionsRepository, SubscriptionRepository
@@ -6,6 +8,11 @@ from .subscriptions import RedisSubscriptionsRepository, SubscriptionRepository
 __all__ = [
     "ClientRepository",
     "RedisClientRepository",
+    "GameRepository",
+    "RedisGameRepository",
+    "SavedGame",
+    "LeaderboardRepository",
+    "RedisLeaderboardRepository",
     "StatisticsRepository",
     "RedisStatisticsRepository",
     "SessionRepository",
@@ -1,5 +1,6 @@
 import abc
 import asyncio
+import time
 
 import redis.asyncio as redis
 
@@ -43,7 +44,15 @@ class ClientRepository(Observable, abc.ABC):
 
     @abc.abstractmethod
     async def clear(self) -> int:
-        pass
+        """
+        Removes clients added by this server process.
+        """
+
+    @abc.abstractmethod
+    async def refresh(self) -> None:
+        """
+        Keeps clients added by this server process alive.
+        """
 
     @abc.abstractmethod
     async def count(self) -> int:
@@ -93,6 +102,9 @@ class InMemoryClientRepository(ClientRepository):
 
         return client_count
 
+    async def refresh(self) -> None:
+        pass
+
     async def count(self) -> int:
         return len(self._clients)
 
@@ -101,9 +113,17 @@ class InMemoryClientRepository(ClientRepository):
 
 
 class RedisClientRepository(ClientRepository):
+    """
+    Clients expire unless the process they are connected to refreshes
+    them, so clients of a process that died don't linger. The index is
+    a sorted set of client IDs scored by the time they expire.
+    """
+
     key = "clients"
     namespace = key + ":"
-    pattern = namespace + "*"
+    # IDs of all clients, kept in sync with client keys.
+    index_key = "index:" + key
+    ttl = 30
 
     def __init__(
         self,
@@ -113,6 +133,8 @@ class RedisClientRepository(ClientRepository):
         super().__init__(message_bus)
         self._client = client
         self._lock = asyncio.Lock()
+        # Clients connected to this process.
+        self._local: set[str] = set()
 
     def get_key(self, client_id: str) -> str:
         return f"{self.namespace}{client_id}"
@@ -130,6 +152,7 @@ class RedisClientRepository(ClientRepository):
 
             client = Client(id=client_id, nickname=nickname, guest=guest, version=version)
             await self._save(client)
+            self._local.add(client_id)
             return client
 
     async def get(self, client_id: str) -> Client:
@@ -141,26 +164,56 @@ class RedisClientRepository(ClientRepository):
         return Client.from_raw(data)
 
     async def list(self) -> list[Client]:
-        keys = await self._client.keys(self.pattern)
-        get_futures = [self.get(self.get_client_id(key)) for key in keys]
-        return await asyncio.gather(*get_futures)
+        client_ids = await self._client.zrangebyscore(self.index_key, time.time(), "+inf")
+
+        if not client_ids:
+            return []
+
+        clients = await self._client.mget(
+            [self.get_key(self.get_client_id(id_)) for id_ in client_ids]
+        )
+        return [Client.from_raw(data) for data in clients if data is not None]
 
     async def delete(self, client_id: str) -> bool:
-        result = bool(await self._client.delete(self.get_key(client_id)))
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(self.get_key(client_id))
+            pipe.zrem(self.index_key, client_id)
+            deleted, _ = await pipe.execute()
+
+        self._local.discard(client_id)
         await self.notify(client_id, Action.REMOVE)
-        return result
+        return bool(deleted)
 
     async def clear(self) -> int:
-        keys: list[bytes] = await self._client.keys(self.pattern)
+        # Other processes keep serving their clients.
+        client_ids, self._local = list(self._local), set()
+
+        if not client_ids:
+            return 0
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(*map(self.get_key, client_ids))
+            pipe.zrem(self.index_key, *client_ids)
+            count, _ = await pipe.execute()
+
+        return int(count)
+
+    async def refresh(self) -> None:
+        now = time.time()
 
-        if len(keys):
-            count: int = await self._client.delete(*keys)
-            return count
-        return 0
+        async with self._client.pipeline(transaction=True) as pipe:
+            for client_id in self._local:
+                pipe.expire(self.get_key(client_id), self.ttl)
+
+            if self._local:
+                pipe.zadd(self.index_key, dict.fromkeys(self._local, now + self.ttl))
+
+            # Clients of processes that died.
+            pipe.zremrangebyscore(self.index_key, "-inf", now)
+            await pipe.execute()
 
     async def count(self) -> int:
-        keys = await self._client.keys(self.pattern)
-        return len(keys)
+        return int(await self._client.zcount(self.index_key, time.time(), "+inf"))
 
     async def exists(self, client_id: str) -> bool:
         return bool(await self._client.exists(self.get_key(client_id)))
@@ -170,4 +223,10 @@ class RedisClientRepository(ClientRepository):
             id=client.id, nickname=client.nickname, guest=client.guest, version=client.version
         )
         await self.notify(client.id, Action.ADD, payload=model.to_dict())
-        return bool(await self._client.set(self.get_key(client.id), model.to_json()))
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self.get_key(client.id), model.to_json(), ex=self.ttl)
+            pipe.zadd(self.index_key, {client.id: time.time() + self.ttl})
+            saved, _ = await pipe.execute()
+
+        return bool(saved)
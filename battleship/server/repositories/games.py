@@ -0,0 +1,156 @@
+import abc
+import dataclasses
+from collections.abc import Sequence
+
+import redis.asyncio as redis
+
+from battleship.shared.models import Client, GameSummary, SessionID
+
+
+class GameNotFound(Exception):
+    pass
+
+
+@dataclasses.dataclass
+class SavedGame:
+    """
+    State of a game in progress, enough to resume it in another process.
+    The game itself is kept as a `domain.Game` snapshot.
+    """
+
+    session_id: SessionID
+    host: Client
+    guest: Client
+    snapshot: bytes
+    summary: GameSummary
+    start: float
+
+
+class GameRepository(abc.ABC):
+    @abc.abstractmethod
+    async def save(self, game: SavedGame) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def get(self, session_id: SessionID) -> SavedGame:
+        pass
+
+    @abc.abstractmethod
+    async def get_many(self, session_ids: Sequence[SessionID]) -> list[SavedGame]:
+        """
+        Returns saved games with given IDs, skipping those that don't exist.
+        """
+
+    @abc.abstractmethod
+    async def list_ids(self) -> list[SessionID]:
+        pass
+
+    @abc.abstractmethod
+    async def delete(self, session_id: SessionID) -> bool:
+        pass
+
+
+class InMemoryGameRepository(GameRepository):
+    def __init__(self) -> None:
+        self._games: dict[SessionID, SavedGame] = {}
+
+    async def save(self, game: SavedGame) -> None:
+        self._games[game.session_id] = game
+
+    async def get(self, session_id: SessionID) -> SavedGame:
+        try:
+            return self._games[session_id]
+        except KeyError:
+            raise GameNotFound(f"Game {session_id} not found.")
+
+    async def get_many(self, session_ids: Sequence[SessionID]) -> list[SavedGame]:
+        return [self._games[id_] for id_ in session_ids if id_ in self._games]
+
+    async def list_ids(self) -> list[SessionID]:
+        return list(self._games)
+
+    async def delete(self, session_id: SessionID) -> bool:
+        return self._games.pop(session_id, None) is not None
+
+
+class RedisGameRepository(GameRepository):
+    key = "games"
+    namespace = key + ":"
+    # IDs of saved games. Games expire on their own, so the index may
+    # refer to expired ones, they are removed from it when fetched.
+    index_key = "index:" + key
+    # Abandoned games don't stay in Redis forever.
+    ttl = 60 * 60 * 24
+
+    def __init__(self, client: redis.Redis) -> None:
+        self._client = client
+
+    def get_key(self, session_id: SessionID) -> str:
+        return f"{self.namespace}{session_id}"
+
+    async def save(self, game: SavedGame) -> None:
+        key = self.get_key(game.session_id)
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    "host": game.host.to_json(),
+                    "guest": game.guest.to_json(),
+                    "snapshot": game.snapshot,
+                    "summary": game.summary.to_json(),
+                    "start": game.start,
+                },
+            )
+            pipe.expire(key, self.ttl)
+            pipe.sadd(self.index_key, game.session_id)
+            await pipe.execute()
+
+    async def get(self, session_id: SessionID) -> SavedGame:
+        data = await self._client.hgetall(self.get_key(session_id))  # type: ignore[misc]
+
+        if not data:
+            raise GameNotFound(f"Game {session_id} not found.")
+
+        return self._load(session_id, data)
+
+    async def get_many(self, session_ids: Sequence[SessionID]) -> list[SavedGame]:
+        if not session_ids:
+            return []
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hgetall(self.get_key(session_id))
+
+            results = await pipe.execute()
+
+        games = [self._load(id_, data) for id_, data in zip(session_ids, results) if data]
+        expired = [id_ for id_, data in zip(session_ids, results) if not data]
+
+        if expired:
+            await self._client.srem(self.index_key, *expired)  # type: ignore[misc]
+
+        return games
+
+    async def list_ids(self) -> list[SessionID]:
+        session_ids = await self._client.smembers(self.index_key)  # type: ignore[misc]
+        return [session_id.decode() for session_id in session_ids]
+
+    async def delete(self, session_id: SessionID) -> bool:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(self.get_key(session_id))
+            pipe.srem(self.index_key, session_id)
+            deleted, _ = await pipe.execute()
+
+        return bool(deleted)
+
+    @staticmethod
+    def _load(session_id: SessionID, data: dict[bytes, bytes]) -> SavedGame:
+        return SavedGame(
+            session_id=session_id,
+            host=Client.from_raw(data[b"host"]),
+            guest=Client.from_raw(data[b"guest"]),
+            snapshot=data[b"snapshot"],
+            summary=GameSummary.from_raw(data[b"summary"]),
+            start=float(data[b"start"]),
+        )
@@ -0,0 +1,96 @@
+import abc
+
+import redis.asyncio as redis
+
+from battleship.shared.models import (
+    LeaderboardCategory,
+    LeaderboardEntry,
+    LeaderboardPage,
+)
+
+
+class LeaderboardRepository(abc.ABC):
+    @abc.abstractmethod
+    async def get_page(
+        self, category: LeaderboardCategory, offset: int, limit: int
+    ) -> LeaderboardPage:
+        pass
+
+    @abc.abstractmethod
+    async def get_entry(
+        self, category: LeaderboardCategory, user_id: str
+    ) -> LeaderboardEntry | None:
+        pass
+
+
+class RedisLeaderboardRepository(LeaderboardRepository):
+    """
+    Every category is a sorted set of user IDs scored by the category value.
+    The sets are updated by `RedisStatisticsRepository` with statistics of
+    a player, so ranks are never computed by scanning statistics.
+    """
+
+    key = "leaderboard"
+    namespace = key + ":"
+    # User ID to the nickname the player had in their last game.
+    nicknames_key = namespace + "nicknames"
+    # Players need this many games to be ranked by win ratio and accuracy.
+    min_games = 10
+
+    def __init__(self, client: redis.Redis) -> None:
+        self._client = client
+
+    @classmethod
+    def get_key(cls, category: LeaderboardCategory) -> str:
+        return f"{cls.namespace}{category}"
+
+    async def get_page(
+        self, category: LeaderboardCategory, offset: int, limit: int
+    ) -> LeaderboardPage:
+        key = self.get_key(category)
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.zcard(key)
+            pipe.zrange(
+                key, offset, offset + limit - 1, desc=not category.ascending, withscores=True
+            )
+            total, members = await pipe.execute()
+
+        entries = []
+
+        if members:
+            user_ids = [user_id for user_id, _ in members]
+            nicknames = await self._client.hmget(self.nicknames_key, user_ids)  # type: ignore[misc]
+
+            for index, ((_, score), nickname) in enumerate(zip(members, nicknames)):
+                entries.append(
+                    LeaderboardEntry(
+                        rank=offset + index + 1,
+                        nickname=nickname.decode() if nickname else "",
+                        score=score,
+                    )
+                )
+
+        return LeaderboardPage(category=category, offset=offset, total=total, entries=entries)
+
+    async def get_entry(
+        self, category: LeaderboardCategory, user_id: str
+    ) -> LeaderboardEntry | None:
+        key = self.get_key(category)
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            if category.ascending:
+                pipe.zrank(key, user_id)
+            else:
+                pipe.zrevrank(key, user_id)
+
+            pipe.zscore(key, user_id)
+            pipe.hget(self.nicknames_key, user_id)
+            rank, score, nickname = await pipe.execute()
+
+        if rank is None:
+            return None
+
+        return LeaderboardEntry(
+            rank=rank + 1, nickname=nickname.decode() if nickname else "", score=score
+        )
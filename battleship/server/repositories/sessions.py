@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Iterable
 from typing import Any
 
 import redis.asyncio as redis
@@ -18,6 +19,38 @@ class SessionNotFound(Exception):
     pass
 
 
+# Removes a client from the index unless it has moved on to another session.
+UNLINK_CLIENT = """
+if redis.call("HGET", KEYS[1], ARGV[1]) == ARGV[2] then
+    return redis.call("HDEL", KEYS[1], ARGV[1])
+end
+return 0
+"""
+
+# Indexes a session unless it has been deleted since it was read. Links of
+# clients who have moved on to another session are left alone.
+INDEX_SESSION = """
+local key, index, started, clients = unpack(KEYS)
+local session_id, is_started = ARGV[1], ARGV[2] == "1"
+
+if redis.call("EXISTS", key) == 0 then
+    return 0
+end
+
+redis.call("SADD", index, session_id)
+
+if is_started then
+    redis.call("SADD", started, session_id)
+end
+
+for i = 3, #ARGV do
+    redis.call("HSETNX", clients, ARGV[i], session_id)
+end
+
+return 1
+"""
+
+
 class SessionRepository(Observable, abc.ABC):
     entity = "session"
 
@@ -32,6 +65,12 @@ class SessionRepository(Observable, abc.ABC):
     async def get(self, session_id: str) -> Session:
         pass
 
+    async def list_open(self) -> list[Session]:
+        return [s for s in await self.list() if not s.started]
+
+    async def count_started(self) -> int:
+        return sum(s.started for s in await self.list())
+
     @abc.abstractmethod
     async def list(self) -> list[Session]:
         pass
@@ -44,22 +83,31 @@ class SessionRepository(Observable, abc.ABC):
     async def update(self, session_id: str, **kwargs: Any) -> Session:
         pass
 
+    @abc.abstractmethod
+    async def reindex(self) -> int:
+        """
+        Adds stored sessions missing from indexes and drops deleted ones,
+        returns the number of sessions. Safe to run while other server
+        processes use the indexes.
+        """
+
+    @abc.abstractmethod
     async def get_for_client(self, client_id: str) -> Session | None:
-        try:
-            [session] = [s for s in await self.list() if client_id in (s.host_id, s.guest_id)]
-            return session
-        except ValueError:
-            return None
+        """
+        Returns the session the client hosts or has joined.
+        """
 
 
 class InMemorySessionRepository(SessionRepository):
     def __init__(self, message_bus: MessageBus) -> None:
         super().__init__(message_bus)
         self._sessions: dict[SessionID, Session] = {}
+        self._client_sessions: dict[str, SessionID] = {}
 
     async def add(self, host_id: str, data: SessionCreate) -> Session:
         session = Session(id=make_session_id(), host_id=host_id, **data.to_dict())
         self._sessions[session.id] = session
+        self._client_sessions[host_id] = session.id
         await self.notify(session.id, Action.ADD, payload=session.to_dict())
         return session
 
@@ -71,24 +119,48 @@ class InMemorySessionRepository(SessionRepository):
 
     async def delete(self, session_id: str) -> bool:
         session = self._sessions.pop(session_id, None)
+
+        if session is not None:
+            for client_id in (session.host_id, session.guest_id):
+                if self._client_sessions.get(client_id) == session_id:
+                    del self._client_sessions[client_id]
+
         await self.notify(session_id, Action.REMOVE)
         return session is not None
 
     async def update(self, session_id: str, **kwargs: Any) -> Session:
         session = await self.get(session_id)
         updated_session = Session.from_dict({**session.to_dict(), **kwargs})
+
+        if updated_session.guest_id:
+            self._client_sessions[updated_session.guest_id] = session_id
+
         await self.notify(session_id, Action.START)
         return updated_session
 
+    async def get_for_client(self, client_id: str) -> Session | None:
+        session_id = self._client_sessions.get(client_id)
+        return self._sessions.get(session_id) if session_id is not None else None
+
+    async def reindex(self) -> int:
+        return len(self._sessions)
+
 
 class RedisSessionRepository(SessionRepository):
     key = "sessions"
     namespace = key + ":"
     pattern = namespace + "*"
+    # IDs of all sessions and of started ones, kept in sync with session keys.
+    index_key = "index:" + key
+    started_key = index_key + ":started"
+    # Client ID to ID of the session the client hosts or has joined.
+    clients_key = index_key + ":clients"
 
     def __init__(self, client: redis.Redis, message_bus: MessageBus) -> None:
         super().__init__(message_bus)
         self._client = client
+        self._unlink_client = client.register_script(UNLINK_CLIENT)
+        self._index_session = client.register_script(INDEX_SESSION)
 
     def get_key(self, session_id: str) -> str:
         return f"{self.namespace}{session_id}"
@@ -113,13 +185,59 @@ class RedisSessionRepository(SessionRepository):
 
         return Session.from_raw(data)
 
+    async def _get_many(self, session_ids: Iterable[str | bytes]) -> list[Session]:
+        keys = [self.get_key(self.get_session_id(session_id)) for session_id in session_ids]
+
+        if not keys:
+            return []
+
+        return [
+            Session.from_raw(data) for data in await self._client.mget(keys) if data is not None
+        ]
+
+    async def list_open(self) -> list[Session]:
+        open_ids = self._client.sdiff([self.index_key, self.started_key])
+        session_ids = await open_ids  # type: ignore[misc]
+        return await self._get_many(session_ids)
+
+    async def count_started(self) -> int:
+        return int(await self._client.scard(self.started_key))  # type: ignore[misc]
+
     async def list(self) -> list[Session]:
-        session_keys = await self._client.keys(pattern=self.pattern)
-        sessions = await self._client.mget(session_keys)
-        return list(map(Session.from_raw, sessions))
+        session_ids = await self._client.smembers(self.index_key)  # type: ignore[misc]
+        return await self._get_many(session_ids)
+
+    async def get_for_client(self, client_id: str) -> Session | None:
+        session_id = await self._client.hget(self.clients_key, client_id)  # type: ignore[misc]
+
+        if session_id is None:
+            return None
+
+        try:
+            return await self.get(session_id.decode())
+        except SessionNotFound:
+            return None
 
     async def delete(self, session_id: str) -> bool:
-        deleted = await self._client.delete(self.get_key(session_id))
+        try:
+            session = await self.get(session_id)
+        except SessionNotFound:
+            client_ids = []
+        else:
+            client_ids = [id_ for id_ in (session.host_id, session.guest_id) if id_]
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(self.get_key(session_id))
+            pipe.srem(self.index_key, session_id)
+            pipe.srem(self.started_key, session_id)
+
+            for client_id in client_ids:
+                await self._unlink_client(
+                    keys=[self.clients_key], args=[client_id, session_id], client=pipe
+                )
+
+            deleted, *_ = await pipe.execute()
+
         await self.notify(session_id, Action.REMOVE)
         return bool(deleted)
 
@@ -130,5 +248,52 @@ class RedisSessionRepository(SessionRepository):
         await self.notify(session_id, Action.START)
         return updated_session
 
+    async def reindex(self) -> int:
+        # Indexes are only added to, never rebuilt: sessions saved by other
+        # processes meanwhile would be lost. A session is indexed in the
+        # same transaction it's saved in and IDs aren't reused, so an ID
+        # indexed before the scan without a session is a deleted one.
+        index_keys = [self.index_key, self.started_key]
+        indexed = await self._client.sunion(index_keys)  # type: ignore[misc]
+        keys = [key async for key in self._client.scan_iter(match=self.pattern, count=1000)]
+        sessions = await self._get_many(keys)
+        deleted = {self.get_session_id(id_) for id_ in indexed} - {s.id for s in sessions}
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for session in sessions:
+                await self._index_session(
+                    keys=[self.get_key(session.id), *index_keys, self.clients_key],
+                    args=[
+                        session.id,
+                        int(session.started),
+                        *self._get_client_mapping(session),
+                    ],
+                    client=pipe,
+                )
+
+            if deleted:
+                pipe.srem(self.index_key, *deleted)
+                pipe.srem(self.started_key, *deleted)
+
+            await pipe.execute()
+
+        return len(sessions)
+
+    def _get_client_mapping(self, *sessions: Session) -> dict[str, str]:
+        return {
+            client_id: session.id
+            for session in sessions
+            for client_id in (session.host_id, session.guest_id)
+            if client_id
+        }
+
     async def _save(self, session: Session) -> None:
-        await self._client.set(self.get_key(session.id), session.to_json())
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self.get_key(session.id), session.to_json())
+            pipe.sadd(self.index_key, session.id)
+            pipe.hset(self.clients_key, mapping=self._get_client_mapping(session))
+
+            if session.started:
+                pipe.sadd(self.started_key, session.id)
+
+            await pipe.execute()
@@ -1,11 +1,15 @@
 import abc
-import asyncio
-import random
+from collections.abc import Sequence
 
 import redis.asyncio as redis
-from loguru import logger
 
-from battleship.shared.models import GameSummary, PlayerStatistics
+from battleship.server.repositories.leaderboard import RedisLeaderboardRepository
+from battleship.shared.models import (
+    Client,
+    GameSummary,
+    LeaderboardCategory,
+    PlayerStatistics,
+)
 
 
 class StatisticsNotFound(Exception):
@@ -22,64 +26,157 @@ class StatisticsRepository(abc.ABC):
         pass
 
     @abc.abstractmethod
-    async def save(self, user_id: str, game_summary: GameSummary) -> bool:
+    async def save(self, client: Client, game_summary: GameSummary) -> bool:
         pass
 
+    @abc.abstractmethod
+    async def save_many(self, summaries: Sequence[tuple[Client, GameSummary]]) -> None:
+        """
+        Saves summaries of several players at once. Not atomic: if it fails,
+        some of the summaries may have been saved anyway.
+        """
+
+
+# Adds a game to player's statistics and updates their place on leaderboards.
+# Statistics saved as JSON by earlier versions are converted to a hash first.
+SAVE_STATISTICS = """
+local key, nicknames, wins, win_ratio, accuracy, quickest_win = unpack(KEYS)
+local won, shots, hits, duration = ARGV[1] == "1", ARGV[2], ARGV[3], tonumber(ARGV[4])
+local user_id, nickname, min_games = ARGV[5], ARGV[6], tonumber(ARGV[7])
+
+if redis.call("TYPE", key).ok == "string" then
+    local legacy = cjson.decode(redis.call("GET", key))
+    redis.call("DEL", key)
+
+    for _, field in ipairs({"games_played", "games_won", "shots", "hits",
+                            "total_duration", "quickest_win"}) do
+        redis.call("HSET", key, field, legacy[field] or 0)
+    end
+end
+
+redis.call("HINCRBY", key, "games_played", 1)
+redis.call("HINCRBY", key, "shots", shots)
+redis.call("HINCRBY", key, "hits", hits)
+redis.call("HINCRBY", key, "total_duration", duration)
+
+if won then
+    redis.call("HINCRBY", key, "games_won", 1)
+    local quickest = tonumber(redis.call("HGET", key, "quickest_win") or "0")
+
+    if quickest == 0 or duration < quickest then
+        redis.call("HSET", key, "quickest_win", duration)
+    end
+end
+
+local played, won_total, shots_total, hits_total, quickest = unpack(redis.call(
+    "HMGET", key, "games_played", "games_won", "shots", "hits", "quickest_win"
+))
+played, won_total = tonumber(played), tonumber(won_total or "0")
+
+redis.call("HSET", nicknames, user_id, nickname)
+redis.call("ZADD", wins, won_total, user_id)
+
+if played >= min_games then
+    redis.call("ZADD", win_ratio, won_total / played, user_id)
+
+    if tonumber(shots_total) > 0 then
+        redis.call("ZADD", accuracy, tonumber(hits_total) / tonumber(shots_total), user_id)
+    end
+end
+
+if tonumber(quickest or "0") > 0 then
+    redis.call("ZADD", quickest_win, quickest, user_id)
+end
+
+return 1
+"""
+
 
 class RedisStatisticsRepository(StatisticsRepository):
+    """
+    Keeps counters of every player in a hash, updated by a Lua script
+    in a single round trip. Derived values, like accuracy, are computed
+    by `PlayerStatistics` on read.
+    """
+
     key = "statistics"
+    fields = (
+        "games_played",
+        "games_won",
+        "shots",
+        "hits",
+        "total_duration",
+        "quickest_win",
+    )
 
     def __init__(self, client: redis.Redis) -> None:
         self._client = client
+        self._save_statistics = client.register_script(SAVE_STATISTICS)
 
     def get_key(self, user_id: str) -> str:
         return f"{self.key}:{user_id}"
 
     async def create(self, user_id: str) -> PlayerStatistics:
         statistics = PlayerStatistics(user_id=user_id)
-        await self._client.set(self.get_key(user_id), statistics.to_json())
+        await self._client.hset(  # type: ignore[misc]
+            self.get_key(user_id),
+            mapping={field: getattr(statistics, field) for field in self.fields},
+        )
         return statistics
 
     async def get(self, user_id: str) -> PlayerStatistics:
-        data = await self._client.get(self.get_key(user_id))
-
-        if data is None:
-            raise StatisticsNotFound
-
-        return PlayerStatistics.from_raw(data)
-
-    async def save(self, user_id: str, game_summary: GameSummary) -> bool:
-        retries = 5
-        ok = False
-
-        async with self._client.pipeline(transaction=True) as pipe:
-            while not ok and retries:
-                ok = await self._save(user_id, game_summary, pipe)
-
-                if not ok:
-                    retries -= 1
-                    await asyncio.sleep(random.random())
-
-        return ok
-
-    @logger.catch
-    async def _save(
-        self, user_id: str, game_summary: GameSummary, pipe: redis.client.Pipeline
-    ) -> bool:
         key = self.get_key(user_id)
 
-        await pipe.watch(key)
-        await pipe.execute()
+        try:
+            data = await self._client.hgetall(key)  # type: ignore[misc]
+        except redis.ResponseError:
+            # Saved as JSON by an earlier version and not played since.
+            legacy = await self._client.get(key)
 
-        data = await self._client.get(key)
+            if legacy is None:
+                raise StatisticsNotFound
 
-        if data is None:
-            statistics = PlayerStatistics(user_id=user_id)
-        else:
-            statistics = PlayerStatistics.from_raw(data)
+            return PlayerStatistics.from_raw(legacy)
 
-        statistics.update_from_summary(game_summary)
+        if not data:
+            raise StatisticsNotFound
 
-        await pipe.set(key, statistics.to_json())
-        [ok] = await pipe.execute()
+        return PlayerStatistics(
+            user_id=user_id, **{field.decode(): int(value) for field, value in data.items()}
+        )
+
+    async def save(self, client: Client, game_summary: GameSummary) -> bool:
+        ok = await self._save_statistics(
+            keys=self._get_keys(client), args=self._get_args(client, game_summary)
+        )
         return bool(ok)
+
+    async def save_many(self, summaries: Sequence[tuple[Client, GameSummary]]) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            for client, game_summary in summaries:
+                await self._save_statistics(
+                    keys=self._get_keys(client),
+                    args=self._get_args(client, game_summary),
+                    client=pipe,
+                )
+
+            await pipe.execute()
+
+    def _get_keys(self, client: Client) -> list[str]:
+        # In the order the script unpacks them.
+        return [
+            self.get_key(client.id),
+            RedisLeaderboardRepository.nicknames_key,
+            *(RedisLeaderboardRepository.get_key(category) for category in LeaderboardCategory),
+        ]
+
+    def _get_args(self, client: Client, game_summary: GameSummary) -> list[int | str]:
+        return [
+            int(game_summary.winner == client.id),
+            game_summary.get_shots(client.id),
+            game_summary.get_hits(client.id),
+            game_summary.duration,
+            client.id,
+            client.nickname,
+            RedisLeaderboardRepository.min_games,
+        ]
@@ -3,14 +3,19 @@ from collections import defaultdict
 
 import redis.asyncio as redis
 
+from battleship.server.bus import MessageBus
+from battleship.server.repositories.observable import Observable
 from battleship.shared.events import Subscription
+from battleship.shared.models import Action
 
 
 class SubscriptionNotFound(Exception):
     pass
 
 
-class SubscriptionRepository(abc.ABC):
+class SubscriptionRepository(Observable, abc.ABC):
+    entity = "subscription"
+
     @abc.abstractmethod
     async def add_subscriber(self, subscription: Subscription, subscriber: str) -> None:
         pass
@@ -29,7 +34,10 @@ class SubscriptionRepository(abc.ABC):
 
 
 class InMemorySubscriptionRepository(SubscriptionRepository):
-    def __init__(self, subscriptions: dict[str, set[str]] | None = None) -> None:
+    def __init__(
+        self, message_bus: MessageBus, subscriptions: dict[str, set[str]] | None = None
+    ) -> None:
+        super().__init__(message_bus)
         self._subscriptions: dict[str, set[str]] = defaultdict(set)
 
         if subscriptions:
@@ -37,6 +45,7 @@ class InMemorySubscriptionRepository(SubscriptionRepository):
 
     async def add_subscriber(self, subscription: Subscription, subscriber: str) -> None:
         self._subscriptions[subscription].add(subscriber)
+        await self.notify(subscriber, Action.ADD, payload=dict(subscription=subscription))
 
     async def get_subscribers(self, subscription: Subscription) -> set[str]:
         return self._subscriptions[subscription]
@@ -47,6 +56,8 @@ class InMemorySubscriptionRepository(SubscriptionRepository):
         except KeyError:
             pass
 
+        await self.notify(subscriber, Action.REMOVE, payload=dict(subscription=subscription))
+
     async def clear(self) -> None:
         self._subscriptions.clear()
 
@@ -54,13 +65,13 @@ class InMemorySubscriptionRepository(SubscriptionRepository):
 class RedisSubscriptionsRepository(SubscriptionRepository):
     key = "subscriptions"
     namespace = key + ":"
-    pattern = namespace + "*"
 
-    def __init__(self, client: redis.Redis) -> None:
+    def __init__(self, client: redis.Redis, message_bus: MessageBus) -> None:
+        super().__init__(message_bus)
         self._client = client
 
     def get_key(self, subscription: Subscription) -> str:
-        return f"{self.key}:{subscription}"
+        return f"{self.namespace}{subscription}"
 
     async def get_subscribers(self, subscription: Subscription) -> set[str]:
         subscribers = await self._client.smembers(self.get_key(subscription))  # type: ignore[misc]
@@ -68,12 +79,11 @@ class RedisSubscriptionsRepository(SubscriptionRepository):
 
     async def add_subscriber(self, subscription: Subscription, subscriber: str) -> None:
         await self._client.sadd(self.get_key(subscription), subscriber)  # type: ignore[misc]
+        await self.notify(subscriber, Action.ADD, payload=dict(subscription=subscription))
 
     async def delete_subscriber(self, subscription: Subscription, subscriber: str) -> None:
         await self._client.srem(self.get_key(subscription), subscriber)  # type: ignore[misc]
+        await self.notify(subscriber, Action.REMOVE, payload=dict(subscription=subscription))
 
     async def clear(self) -> None:
-        keys: list[bytes] = await self._client.keys(self.pattern)
-
-        if len(keys):
-            await self._client.delete(*keys)
+        await self._client.delete(*(self.get_key(subscription) for subscription in Subscription))
@@ -1,4 +1,5 @@
 from blacksheep import (
+    Content,
     FromJSON,
     Request,
     Response,
@@ -19,19 +20,27 @@ from battleship.engine import rosters
 from battleship.server import context, metrics, services
 from battleship.server.auth import AuthManager, InvalidSignup, WrongCredentials
 from battleship.server.bus import MessageBus
+from battleship.server.cache import CachedResponse, LobbyCache
+from battleship.server.config import Config
+from battleship.server.game import GameManager
+from battleship.server.notifications import NotificationHub
 from battleship.server.repositories import (
     ClientRepository,
+    LeaderboardRepository,
     SessionRepository,
     StatisticsRepository,
 )
 from battleship.server.repositories.subscriptions import SubscriptionRepository
 from battleship.server.websocket import Connection
+from battleship.shared import wire
 from battleship.shared.events import ClientDisconnectedEvent, Message, Subscription
 from battleship.shared.models import (
     IDToken,
+    LeaderboardCategory,
+    LeaderboardEntry,
+    LeaderboardPage,
     LoginCredentials,
     LoginData,
-    PlayerCount,
     PlayerStatistics,
     RefreshToken,
     Roster,
@@ -42,26 +51,46 @@ from battleship.shared.models import (
 
 router = Router()
 
+# The longest leaderboard page a client can ask for.
+MAX_LEADERBOARD_LIMIT = 100
+
 
 @router.ws("/ws")
 async def ws(
     websocket: WebSocket,
     identity: Identity,
     client_repository: ClientRepository,
-    subscription_repository: SubscriptionRepository,
     message_bus: MessageBus,
+    notification_hub: NotificationHub,
+    game_manager: GameManager,
+    config: Config,
 ) -> None:
     user_id = identity.claims["sub"]
     nickname = identity.claims["nickname"]
     guest = identity.has_claim_value("battleship/role", "guest")
     client = await client_repository.add(user_id, nickname, guest, context.client_version.get())
-    connection = Connection(user_id, nickname, websocket, message_bus, subscription_repository)
+    subprotocols = websocket.get_first_header(b"Sec-WebSocket-Protocol") or b""
+    binary = wire.SUBPROTOCOL in subprotocols.decode().replace(" ", "").split(",")
+    connection = Connection(
+        user_id,
+        nickname,
+        websocket,
+        message_bus,
+        notification_hub,
+        binary,
+        queue_size=config.SEND_QUEUE_SIZE,
+        overflow=config.SEND_QUEUE_OVERFLOW,
+    )
 
-    await websocket.accept()
+    await websocket.accept(subprotocol=wire.SUBPROTOCOL if binary else None)
     logger.debug(f"{connection} accepted.")
     metrics.websocket_connections.inc({})
 
     with connection:
+        # Events for this client from other processes must not be lost.
+        await message_bus.subscribed()
+        # Resume the game this client has been playing before a reconnect.
+        await game_manager.client_connected(client.id)
         await connection.listen()
 
     metrics.websocket_connections.dec({})
@@ -70,10 +99,18 @@ async def ws(
     await message_bus.emit("websocket", Message(event=ClientDisconnectedEvent(client_id=client.id)))
 
 
+def cached_response(request: Request, cached: CachedResponse) -> Response:
+    headers = [(b"ETag", cached.etag), (b"Cache-Control", b"no-cache")]
+
+    if request.get_first_header(b"If-None-Match") == cached.etag:
+        return Response(304, headers, None)
+
+    return Response(200, headers, Content(b"application/json", cached.body))
+
+
 @router.get("/sessions")
-async def list_sessions(session_repository: SessionRepository) -> list[Session]:
-    sessions = await session_repository.list()
-    return [s for s in sessions if not s.started]
+async def list_sessions(request: Request, lobby_cache: LobbyCache) -> Response:
+    return cached_response(request, await lobby_cache.sessions.get())
 
 
 @router.post("/sessions")
@@ -132,10 +169,8 @@ async def join_session(
 
 
 @router.get("/players/online")
-async def get_players_online(
-    client_repository: ClientRepository, session_repository: SessionRepository
-) -> PlayerCount:
-    return await services.count_players(client_repository, session_repository)
+async def get_players_online(request: Request, lobby_cache: LobbyCache) -> Response:
+    return cached_response(request, await lobby_cache.players.get())
 
 
 @router.post("/players/subscribe")
@@ -221,6 +256,40 @@ async def get_player_statistics(
     return await services.get_player_statistics(identity["sub"], statistics_repository)
 
 
+@router.get("/leaderboard/{category}")
+async def get_leaderboard(
+    identity: Identity,
+    category: str,
+    leaderboard_repository: LeaderboardRepository,
+    offset: int = 0,
+    limit: int = 20,
+) -> LeaderboardPage | Response:
+    try:
+        category_ = LeaderboardCategory(category)
+    except ValueError:
+        return not_found()
+
+    if offset < 0 or not 0 < limit <= MAX_LEADERBOARD_LIMIT:
+        return bad_request(f"Offset must be non-negative, limit from 1 to {MAX_LEADERBOARD_LIMIT}.")
+
+    page = await leaderboard_repository.get_page(category_, offset, limit)
+    page.player = await leaderboard_repository.get_entry(category_, identity.claims["sub"])
+    return page
+
+
+@router.get("/leaderboard/{category}/me")
+async def get_leaderboard_entry(
+    identity: Identity, category: str, leaderboard_repository: LeaderboardRepository
+) -> LeaderboardEntry | Response:
+    try:
+        category_ = LeaderboardCategory(category)
+    except ValueError:
+        return not_found()
+
+    entry = await leaderboard_repository.get_entry(category_, identity.claims["sub"])
+    return entry if entry is not None else not_found()
+
+
 @router.get("/metrics")
 async def get_metrics(request: Request) -> Response:
     accept_headers = request.get_headers(b"Accept")
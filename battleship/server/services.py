@@ -13,11 +13,10 @@ from battleship.shared.models import PlayerCount, PlayerStatistics
 async def count_players(
     client_repository: ClientRepository, session_repository: SessionRepository
 ) -> PlayerCount:
-    players = await client_repository.count()
-    sessions = await session_repository.list()
-    started_sessions = [s for s in sessions if s.started]
-    players_ingame = len(started_sessions) * 2
-    return PlayerCount(total=players, ingame=players_ingame)
+    players, started_sessions = await asyncio.gather(
+        client_repository.count(), session_repository.count_started()
+    )
+    return PlayerCount(total=players, ingame=started_sessions * 2)
 
 
 async def get_player_statistics(
@@ -0,0 +1,227 @@
+"""
+Write-behind of game summaries to player statistics.
+
+Finished games don't wait for Redis: their summaries are queued and saved
+in batches, when enough of them are queued or once a second. A batch that
+can't be saved is appended to a local spill file, which is saved again on
+the next start or as soon as a batch goes through.
+
+Every server process on a host may share the spill file. Writers append
+under an exclusive lock, and a replay first renames the file to claim it,
+so each spilled summary is replayed by one process only. A claimed file
+whose replay failed stays next to it and is picked up by the next replay,
+of this process or any other. Saving a batch isn't atomic though, so
+replaying one that failed halfway may count some games twice.
+"""
+
+import asyncio
+import fcntl
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import TextIO
+
+from loguru import logger
+
+from battleship.server.repositories import StatisticsRepository
+from battleship.shared.models import Client, GameSummary
+
+Entry = tuple[Client, GameSummary]
+
+
+class SummaryWriter:
+    def __init__(
+        self,
+        statistics: StatisticsRepository,
+        spill_path: Path,
+        batch_size: int = 100,
+        flush_interval: float = 1,
+    ) -> None:
+        self._statistics = statistics
+        self._spill_path = spill_path
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending: list[Entry] = []
+        self._flush_requested = asyncio.Event()
+        self._closing = False
+        # Guards the spill file, it's both written and replayed from here.
+        self._spill_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    def add(self, client: Client, summary: GameSummary) -> None:
+        self._pending.append((client, summary))
+
+        if len(self._pending) >= self._batch_size:
+            self._flush_requested.set()
+
+    async def start(self) -> None:
+        await self.replay()
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        # Not cancelled: a batch being saved would be lost.
+        self._closing = True
+        self._flush_requested.set()
+
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+        await self.flush()
+
+    async def flush(self) -> None:
+        batch, self._pending = self._pending, []
+
+        if not batch:
+            return
+
+        try:
+            await self._statistics.save_many(batch)
+        except asyncio.CancelledError:
+            # Saved with the next batch, or spilled if that fails.
+            self._pending[:0] = batch
+            raise
+        except Exception as exc:
+            logger.warning(
+                "Cannot save {count} game summaries, spilling: {exc}", count=len(batch), exc=exc
+            )
+            await self._spill(batch)
+            return
+
+        logger.debug("Saved {count} game summaries.", count=len(batch))
+
+        if self._find_spills():
+            # Statistics are reachable again.
+            await self.replay()
+
+    async def replay(self) -> None:
+        async with self._spill_lock:
+            claimed = await asyncio.to_thread(self._claim_spills)
+
+            if not claimed:
+                return
+
+            files = list(claimed.values())
+
+            try:
+                batch = await asyncio.to_thread(self._read_spills, files)
+
+                try:
+                    await self._statistics.save_many(batch)
+                except Exception as exc:
+                    # Claimed files are left for the next replay.
+                    logger.warning("Cannot replay spilled game summaries: {exc}", exc=exc)
+                    return
+
+                for path in claimed:
+                    path.unlink()
+            finally:
+                for file in files:
+                    file.close()
+
+            logger.info("Replayed {count} spilled game summaries.", count=len(batch))
+
+    @logger.catch
+    async def _spill(self, batch: list[Entry]) -> None:
+        async with self._spill_lock:
+            await asyncio.to_thread(self._write_spill, batch)
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+
+            self._flush_requested.clear()
+            await self.flush()
+
+    def _find_spills(self) -> list[Path]:
+        claimed = self._spill_path.parent.glob(f"{self._spill_path.name}.*")
+        return [self._spill_path, *claimed] if self._spill_path.exists() else [*claimed]
+
+    def _write_spill(self, batch: list[Entry]) -> None:
+        while True:
+            with self._spill_path.open("a") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+
+                if not self._is_open(file, self._spill_path):
+                    # Claimed by a replay before we got the lock.
+                    continue
+
+                for client, summary in batch:
+                    entry = dict(client=client.to_dict(), summary=summary.to_dict())
+                    file.write(json.dumps(entry) + "\n")
+
+                file.flush()
+                os.fsync(file.fileno())
+                return
+
+    def _claim_spills(self) -> dict[Path, TextIO]:
+        """
+        Returns locked spill files this process may replay and delete.
+        """
+        files: dict[Path, TextIO] = {}
+        claimed = self._spill_path.with_name(f"{self._spill_path.name}.{uuid.uuid4().hex}")
+
+        try:
+            file = self._spill_path.open()
+        except FileNotFoundError:
+            pass
+        else:
+            # Waits for writers, the ones which get the lock after us
+            # see the file renamed and write to a new one.
+            fcntl.flock(file, fcntl.LOCK_EX)
+
+            if self._is_open(file, self._spill_path):
+                self._spill_path.rename(claimed)
+                files[claimed] = file
+            else:
+                # Claimed by another replay before we got the lock.
+                file.close()
+
+        for path in self._spill_path.parent.glob(f"{self._spill_path.name}.*"):
+            if path == claimed:
+                continue
+
+            try:
+                file = path.open()
+            except FileNotFoundError:
+                continue
+
+            try:
+                # Held by a replay in progress.
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                file.close()
+                continue
+
+            if self._is_open(file, path):
+                files[path] = file
+            else:
+                # Replayed and deleted before we got the lock.
+                file.close()
+
+        return files
+
+    @staticmethod
+    def _is_open(file: TextIO, path: Path) -> bool:
+        try:
+            return os.stat(path).st_ino == os.fstat(file.fileno()).st_ino
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _read_spills(files: list[TextIO]) -> list[Entry]:
+        batch = []
+
+        for line in (line for file in files for line in file):
+            try:
+                entry = json.loads(line)
+                client = Client.from_dict(entry["client"])
+                batch.append((client, GameSummary.from_dict(entry["summary"])))
+            except (KeyError, ValueError):
+                # Torn write of a crashed process.
+                logger.warning("Skipped a malformed spilled game summary.")
+
+        return batch
@@ -1,14 +1,112 @@
-from typing import Any, AsyncGenerator, AsyncIterator
+import asyncio
+import dataclasses
+import time
+from collections import deque
+from collections.abc import Hashable
+from typing import Any, AsyncGenerator, AsyncIterator, Literal, TypeAlias
 
 from blacksheep import WebSocket, WebSocketDisconnectError
 from loguru import logger
 
 from battleship.server import metrics
 from battleship.server.bus import MessageBus
-from battleship.server.repositories import SubscriptionRepository
-from battleship.shared.events import GameEvent, Message, NotificationEvent
+from battleship.server.notifications import NotificationHub
+from battleship.shared import wire
+from battleship.shared.events import GameEvent, Message, NotificationEvent, Subscription
 
 ClientMessage = Message[GameEvent] | Message[NotificationEvent]
+OverflowPolicy: TypeAlias = Literal["disconnect", "drop_oldest"]
+
+# Close code "Try Again Later", the client reconnects.
+CLOSE_OVERFLOW = 1013
+
+
+def get_coalesce_key(message: ClientMessage) -> Hashable | None:
+    """
+    Messages with the same key supersede each other: only the latest one
+    is worth sending. Returns None if every message must be delivered.
+    """
+    event = message.event
+
+    if isinstance(event, NotificationEvent) and event.subscription == Subscription.PLAYERS_UPDATE:
+        # Player counts, only the latest count of each kind matters.
+        return event.subscription, event.payload.get("type")
+
+    return None
+
+
+@dataclasses.dataclass
+class _Entry:
+    message: ClientMessage
+    key: Hashable | None
+    enqueued_at: float
+
+
+class SendQueue:
+    """
+    Bounded FIFO of outgoing messages of one connection.
+
+    A message that supersedes one still waiting in the queue replaces it
+    in place, so it takes no extra room.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: deque[_Entry] = deque()
+        self._pending: dict[Hashable, _Entry] = {}
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def full(self) -> bool:
+        return len(self._entries) >= self.maxsize
+
+    def put(self, message: ClientMessage) -> bool:
+        """
+        Returns True if the message has replaced a superseded one.
+        Raises `asyncio.QueueFull` if there is no room for it.
+        """
+        key = get_coalesce_key(message)
+
+        if key is not None and (entry := self._pending.get(key)) is not None:
+            entry.message = message
+            return True
+
+        if self.full():
+            raise asyncio.QueueFull
+
+        entry = _Entry(message, key, time.monotonic())
+        self._entries.append(entry)
+
+        if key is not None:
+            self._pending[key] = entry
+
+        self._ready.set()
+        return False
+
+    def drop(self) -> None:
+        self._forget(self._entries.popleft())
+
+    async def get(self) -> tuple[ClientMessage, float]:
+        """
+        Waits for the oldest message, returns it with the time it was queued at.
+        """
+        while not self._entries:
+            self._ready.clear()
+            await self._ready.wait()
+
+        entry = self._entries.popleft()
+        self._forget(entry)
+        return entry.message, entry.enqueued_at
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pending.clear()
+
+    def _forget(self, entry: _Entry) -> None:
+        if entry.key is not None:
+            del self._pending[entry.key]
 
 
 class WebSocketWrapper:
@@ -25,70 +123,161 @@ class WebSocketWrapper:
     async def send_text(self, text: str) -> None:
         await self._socket.send_text(text)
 
-    async def __aiter__(self) -> AsyncGenerator[str, None]:
+    async def send_bytes(self, data: bytes) -> None:
+        await self._socket.send_bytes(data)
+
+    async def close(self, code: int, reason: str) -> None:
+        await self._socket.close(code, reason)
+
+    async def __aiter__(self) -> AsyncGenerator[str | bytes, None]:
         while True:
             try:
-                text = await self._socket.receive_text()
+                frame = await self._socket.receive()
+                text = frame.get("text")
+                data = text if text is not None else frame["bytes"]
                 logger.trace(
                     "{ws} Message received {message}",
                     ws=self,
-                    message=text,
+                    message=data,
                 )
-                yield text
+                yield data
             except WebSocketDisconnectError:
                 break
 
 
 class Connection:
+    """
+    WebSocket connection of a client.
+
+    Outgoing messages are put to a bounded queue and sent by a writer task,
+    so a slow client never blocks the message bus. When the queue overflows,
+    the connection is closed or the oldest messages are dropped, depending
+    on the overflow policy.
+    """
+
     def __init__(
         self,
         user_id: str,
         nickname: str,
         websocket: WebSocket,
         message_bus: MessageBus,
-        subscription_repository: SubscriptionRepository,
+        notification_hub: NotificationHub,
+        binary: bool = False,
+        queue_size: int = 256,
+        overflow: OverflowPolicy = "disconnect",
     ):
         self.connection_id = user_id
         self.nickname = nickname
         self._websocket = WebSocketWrapper(websocket)
         self._message_bus = message_bus
-        self._subscription_repository = subscription_repository
+        self._notification_hub = notification_hub
+        self.binary = binary
+        self._queue = SendQueue(queue_size)
+        self._overflow = overflow
+        self._closing = False
+        self._writer_task: asyncio.Task[None] | None = None
+        self._close_task: asyncio.Task[None] | None = None
 
     def __repr__(self) -> str:
         return f"<Connection {self.nickname} {self._websocket.client_ip}>"
 
+    @property
+    def labels(self) -> dict[str, str]:
+        return {"client": self.nickname, "connection_id": self.connection_id}
+
     def __enter__(self) -> None:
-        self._message_bus.subscribe("notifications", self._handle_notification_event)
+        self._writer_task = asyncio.create_task(self._run_writer())
+        self._notification_hub.connect(self)
         self._message_bus.subscribe(f"clients.out.{self.connection_id}", self.send_event)
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self._message_bus.unsubscribe("notifications", self._handle_notification_event)
+        self._notification_hub.disconnect(self)
         self._message_bus.unsubscribe(f"clients.out.{self.connection_id}", self.send_event)
+        self._stop_writer()
 
     def __del__(self) -> None:
         logger.trace("{conn} was garbage collected.", conn=self)
 
-    async def messages(self) -> AsyncIterator[str]:
+    async def messages(self) -> AsyncIterator[str | bytes]:
         async for message in self._websocket:
             yield message
 
     async def listen(self) -> None:
         async for ws_message in self.messages():
-            message: ClientMessage = Message.from_raw(ws_message)
+            message: ClientMessage
+
+            if isinstance(ws_message, bytes):
+                message = wire.decode(ws_message)  # type: ignore[assignment]
+            else:
+                message = Message.from_raw(ws_message)
+
             await self._message_bus.emit(f"clients.in.{self.connection_id}", message)
-            metrics.websocket_messages_in.inc(
-                {"client": self.nickname, "connection_id": self.connection_id}
-            )
+            metrics.websocket_messages_in.inc(self.labels)
 
     async def send_event(self, event: ClientMessage) -> None:
-        await self._websocket.send_text(event.to_json())
-        metrics.websocket_messages_out.inc(
-            {"client": self.nickname, "connection_id": self.connection_id}
+        """
+        Queues the message for sending, never waits for the client.
+        """
+        if self._closing:
+            return
+
+        try:
+            superseded = self._queue.put(event)
+        except asyncio.QueueFull:
+            if self._overflow == "disconnect":
+                self._disconnect_slow_client()
+                return
+
+            self._queue.drop()
+            self._queue.put(event)
+            metrics.websocket_messages_dropped.inc({"reason": "overflow"})
+            logger.debug("{conn} is too slow, dropped a message.", conn=self)
+            return
+
+        if superseded:
+            metrics.websocket_messages_dropped.inc({"reason": "superseded"})
+        else:
+            metrics.websocket_send_queue.inc({})
+
+    def _disconnect_slow_client(self) -> None:
+        logger.warning(
+            "{conn} send queue overflowed ({size} messages), closing.",
+            conn=self,
+            size=self._queue.maxsize,
         )
+        metrics.websocket_send_queue_overflows.inc({})
+        metrics.websocket_messages_dropped.add({"reason": "overflow"}, len(self._queue) + 1)
+        self._stop_writer()
+        self._close_task = asyncio.create_task(
+            self._websocket.close(CLOSE_OVERFLOW, "Send queue overflow")
+        )
+
+    def _stop_writer(self) -> None:
+        self._closing = True
+        metrics.websocket_send_queue.sub({}, len(self._queue))
+        self._queue.clear()
 
-    async def _handle_notification_event(self, message: Message[NotificationEvent]) -> None:
-        event = message.unwrap()
-        subscribers = await self._subscription_repository.get_subscribers(event.subscription)
+        if self._writer_task is not None and self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+
+    async def _send(self, event: ClientMessage) -> None:
+        if self.binary:
+            await self._websocket.send_bytes(wire.encode(event))
+        else:
+            await self._websocket.send_text(event.to_json())
+
+    async def _run_writer(self) -> None:
+        while True:
+            event, enqueued_at = await self._queue.get()
+            metrics.websocket_send_queue.dec({})
+
+            try:
+                await self._send(event)
+            except Exception as exc:
+                # The client is gone, the listener will notice it too.
+                logger.warning("{conn} failed to send a message: {exc}", conn=self, exc=exc)
+                self._stop_writer()
+                return
 
-        if self.connection_id in subscribers:
-            await self.send_event(message)
+            metrics.websocket_send_latency_seconds.observe({}, time.monotonic() - enqueued_at)
+            metrics.websocket_messages_out.inc(self.labels)
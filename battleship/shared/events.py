@@ -1,7 +1,7 @@
 from enum import auto, unique
-from typing import Any, Generic, Literal, TypeAlias, TypeVar, cast
+from typing import Annotated, Any, Generic, Literal, TypeAlias, TypeVar, cast
 
-from pydantic import Field
+from pydantic import Field, PlainSerializer, PlainValidator, PrivateAttr
 
 from battleship.shared.compat import StrEnum
 from battleship.shared.models import BaseModel
@@ -22,8 +22,10 @@ class ServerGameEvent(StrEnum):
     AWAITING_MOVE = auto()
     SALVO = auto()
     CANCEL_GAME = auto()
+    RESUME_GAME = auto()
     GAME_ENDED = auto()
     GAME_CANCELLED = auto()
+    GAME_STATE = auto()
 
 
 @unique
@@ -32,14 +34,39 @@ class Subscription(StrEnum):
     SESSIONS_UPDATE = auto()
 
 
+GameEventType: TypeAlias = ServerGameEvent | ClientGameEvent
+
+# Server event wins for a value both enums have, e.g. "cancel_game".
+_GAME_EVENT_TYPES: dict[str, GameEventType] = {
+    **{event.value: event for event in ClientGameEvent},
+    **{event.value: event for event in ServerGameEvent},
+}
+
+
+def _validate_game_event_type(value: Any) -> GameEventType:
+    # A dict lookup instead of trying both enums in turn, which
+    # took more than half of the time to parse a game event.
+    if isinstance(value, (ServerGameEvent, ClientGameEvent)):
+        return value
+
+    try:
+        return _GAME_EVENT_TYPES[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown game event type {value!r}.")
+
+
 class GameEvent(BaseModel):
     message_type: Literal["game_event"] = "game_event"
-    type: ServerGameEvent | ClientGameEvent
+    type: Annotated[
+        GameEventType,
+        PlainValidator(_validate_game_event_type),
+        PlainSerializer(str, return_type=str, when_used="json"),
+    ]
     session_id: str | None = None
     payload: dict[str, Any] = {}
 
 
-Entity = Literal["session", "client", "statistics"]
+Entity = Literal["session", "client", "statistics", "subscription"]
 
 
 class EntityEvent(BaseModel):
@@ -66,11 +93,29 @@ T = TypeVar("T", bound=AnyEvent)
 
 
 class Message(BaseModel, Generic[T]):
+    """
+    Messages are immutable once sent: a message is encoded only once,
+    and the same frame is sent to every recipient.
+    """
+
     event: AnyEvent = Field(..., discriminator="message_type")
+    _frame: str | None = PrivateAttr(default=None)
+    # Frame of the binary protocol, see `battleship.shared.wire`.
+    _packed: bytes | None = PrivateAttr(default=None)
 
     def unwrap(self) -> T:
         return cast(T, self.event)
 
+    def __eq__(self, other: object) -> bool:
+        # Encoded frames are a cache, they don't make messages different.
+        return isinstance(other, Message) and self.event == other.event
+
+    def to_json(self) -> str:
+        if self._frame is None:
+            self._frame = super().to_json()
+
+        return self._frame
+
 
 AnyMessage: TypeAlias = (
     Message[NotificationEvent]
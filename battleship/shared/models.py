@@ -179,10 +179,7 @@ class GameSummary(BaseModel):
         self.winner = winner.name
         self.duration = int(end - start)
         self.ships_left = winner.ships_alive
-
-        for ship in winner.ships:
-            if not ship.destroyed:
-                self.hp_left += ship.hp
+        self.hp_left = winner.hp
 
 
 class PlayerStatistics(BaseModel):
@@ -215,20 +212,32 @@ class PlayerStatistics(BaseModel):
             return 0
         return self.games_won / self.games_played
 
-    def update_from_summary(self, summary: GameSummary) -> None:
-        self.games_played += 1
 
-        if summary.winner == self.user_id:
-            self.games_won += 1
+class LeaderboardCategory(StrEnum):
+    WINS = auto()
+    WIN_RATIO = auto()
+    ACCURACY = auto()
+    QUICKEST_WIN = auto()
+
+    @property
+    def ascending(self) -> bool:
+        # The quicker the win, the better.
+        return self == LeaderboardCategory.QUICKEST_WIN
 
-            if not self.quickest_win:
-                self.quickest_win = summary.duration
-            elif summary.duration < self.quickest_win:
-                self.quickest_win = summary.duration
 
-        self.shots += summary.get_shots(self.user_id)
-        self.hits += summary.get_hits(self.user_id)
-        self.total_duration += summary.duration
+class LeaderboardEntry(BaseModel):
+    rank: int
+    nickname: str
+    score: float
+
+
+class LeaderboardPage(BaseModel):
+    category: LeaderboardCategory
+    offset: int
+    total: int
+    entries: list[LeaderboardEntry]
+    # Position of the player who requested the page.
+    player: LeaderboardEntry | None = None
 
 
 class Client(BaseModel):
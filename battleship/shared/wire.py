@@ -0,0 +1,282 @@
+"""
+Compact binary encoding of websocket messages.
+
+Negotiated per connection with the `SUBPROTOCOL` websocket subprotocol,
+plain JSON frames are used otherwise. A binary frame starts with a kind
+byte. The hot game events are packed: event types are small integers,
+coordinates are single bytes, names and IDs are length-prefixed UTF-8.
+Any other message is carried as its JSON frame.
+"""
+
+import json
+import struct
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from battleship.engine import domain
+from battleship.shared.events import (
+    AnyMessage,
+    ClientGameEvent,
+    GameEvent,
+    GameEventType,
+    Message,
+    ServerGameEvent,
+)
+
+SUBPROTOCOL = "battleship.binary.v1"
+
+KIND_JSON = 0
+KIND_GAME_EVENT = 1
+
+_U8 = struct.Struct("<B")
+
+# Shot flags.
+_HIT = 1
+_SHIP = 2
+_DESTROYED = 4
+
+
+class WireError(ValueError):
+    pass
+
+
+class _Unpackable(Exception):
+    """
+    The message doesn't fit the packed layout, send it as JSON.
+    """
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
+    def u8(self, value: int) -> None:
+        if not 0 <= value <= 255:
+            raise _Unpackable
+
+        self._buffer.append(value)
+
+    def string(self, value: str) -> None:
+        data = value.encode()
+        self.u8(len(data))
+        self._buffer += data
+
+    def coordinate(self, value: str) -> None:
+        coordinate = domain.Coordinate.from_human(value)
+
+        if not (0 <= coordinate.x < 16 and 0 <= coordinate.y < 16):
+            raise _Unpackable
+
+        self._buffer.append(coordinate.x << 4 | coordinate.y)
+
+    def coordinates(self, values: Sequence[str]) -> None:
+        self.u8(len(values))
+
+        for value in values:
+            self.coordinate(value)
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int = 0) -> None:
+        self._data = data
+        self._offset = offset
+
+    def u8(self) -> int:
+        (value,) = _U8.unpack_from(self._data, self._offset)
+        self._offset += 1
+        return int(value)
+
+    def string(self) -> str:
+        length = self.u8()
+        end = self._offset + length
+
+        if end > len(self._data):
+            raise WireError("String is out of frame.")
+
+        value = self._data[self._offset : end].decode()
+        self._offset = end
+        return value
+
+    def coordinate(self) -> str:
+        value = self.u8()
+        return domain.Coordinate(value >> 4, value & 0xF).to_human()
+
+    def coordinates(self) -> list[str]:
+        return [self.coordinate() for _ in range(self.u8())]
+
+    def done(self) -> None:
+        if self._offset != len(self._data):
+            raise WireError("Trailing bytes in frame.")
+
+
+def _pack_fire(writer: _Writer, payload: dict[str, Any]) -> None:
+    writer.coordinates(payload["position"])
+
+
+def _unpack_fire(reader: _Reader) -> dict[str, Any]:
+    return dict(position=reader.coordinates())
+
+
+def _pack_spawn_ship(writer: _Writer, payload: dict[str, Any]) -> None:
+    writer.string(payload["ship_id"])
+    writer.coordinates(payload["position"])
+
+
+def _unpack_spawn_ship(reader: _Reader) -> dict[str, Any]:
+    return dict(ship_id=reader.string(), position=reader.coordinates())
+
+
+def _pack_ship_spawned(writer: _Writer, payload: dict[str, Any]) -> None:
+    writer.string(payload["player"])
+    writer.string(payload["ship_id"])
+    writer.coordinates(payload["position"])
+
+
+def _unpack_ship_spawned(reader: _Reader) -> dict[str, Any]:
+    return dict(player=reader.string(), ship_id=reader.string(), position=reader.coordinates())
+
+
+def _pack_awaiting_move(writer: _Writer, payload: dict[str, Any]) -> None:
+    writer.string(payload["actor"])
+    writer.string(payload["subject"])
+
+
+def _unpack_awaiting_move(reader: _Reader) -> dict[str, Any]:
+    return dict(actor=reader.string(), subject=reader.string())
+
+
+def _pack_salvo(writer: _Writer, payload: dict[str, Any]) -> None:
+    # The salvo is sent as a JSON-encoded `models.Salvo`.
+    salvo = json.loads(payload["salvo"])
+
+    for player in (salvo["actor"], salvo["subject"]):
+        writer.string(player["name"])
+        writer.u8(player["ships_alive"])
+
+    writer.u8(len(salvo["shots"]))
+
+    for shot in salvo["shots"]:
+        ship = shot["ship"]
+        flags = _HIT * shot["hit"]
+
+        if ship is not None:
+            flags |= _SHIP | _DESTROYED * ship["destroyed"]
+
+        writer.coordinate(shot["coordinate"])
+        writer.u8(flags)
+
+        if ship is not None:
+            writer.string(ship["id"])
+            writer.string(ship["type"])
+            writer.coordinates(ship["cells"])
+
+
+def _unpack_salvo(reader: _Reader) -> dict[str, Any]:
+    actor = dict(name=reader.string(), ships_alive=reader.u8())
+    subject = dict(name=reader.string(), ships_alive=reader.u8())
+    shots = []
+
+    for _ in range(reader.u8()):
+        coordinate = reader.coordinate()
+        flags = reader.u8()
+        ship = None
+
+        if flags & _SHIP:
+            ship = dict(
+                id=reader.string(),
+                type=reader.string(),
+                destroyed=bool(flags & _DESTROYED),
+                cells=reader.coordinates(),
+            )
+
+        shots.append(dict(coordinate=coordinate, hit=bool(flags & _HIT), ship=ship))
+
+    salvo = dict(actor=actor, subject=subject, shots=shots)
+    return dict(salvo=json.dumps(salvo, separators=(",", ":")))
+
+
+Packer = Callable[[_Writer, dict[str, Any]], None]
+Unpacker = Callable[[_Reader], dict[str, Any]]
+
+# Codes are part of the protocol, never reuse them.
+_LAYOUTS: dict[GameEventType, tuple[int, frozenset[str], Packer, Unpacker]] = {
+    ClientGameEvent.FIRE: (1, frozenset({"position"}), _pack_fire, _unpack_fire),
+    ClientGameEvent.SPAWN_SHIP: (
+        2,
+        frozenset({"ship_id", "position"}),
+        _pack_spawn_ship,
+        _unpack_spawn_ship,
+    ),
+    ServerGameEvent.AWAITING_MOVE: (
+        3,
+        frozenset({"actor", "subject"}),
+        _pack_awaiting_move,
+        _unpack_awaiting_move,
+    ),
+    ServerGameEvent.SALVO: (4, frozenset({"salvo"}), _pack_salvo, _unpack_salvo),
+    ServerGameEvent.SHIP_SPAWNED: (
+        5,
+        frozenset({"player", "ship_id", "position"}),
+        _pack_ship_spawned,
+        _unpack_ship_spawned,
+    ),
+}
+_TYPES_BY_CODE = {code: type_ for type_, (code, *_) in _LAYOUTS.items()}
+
+
+def _pack(message: AnyMessage) -> bytes:
+    event = message.event
+
+    if isinstance(event, GameEvent) and event.session_id is None:
+        layout = _LAYOUTS.get(event.type)
+
+        if layout is not None:
+            code, keys, pack, _ = layout
+
+            if event.payload.keys() == keys:
+                writer = _Writer()
+                writer.u8(KIND_GAME_EVENT)
+                writer.u8(code)
+
+                try:
+                    pack(writer, event.payload)
+                except (_Unpackable, KeyError, TypeError, ValueError):
+                    pass
+                else:
+                    return writer.getvalue()
+
+    return _U8.pack(KIND_JSON) + message.to_json().encode()
+
+
+def encode(message: AnyMessage) -> bytes:
+    """
+    Encodes the message once, like `Message.to_json`.
+    """
+    if message._packed is None:
+        message._packed = _pack(message)
+
+    return message._packed
+
+
+def decode(data: bytes) -> AnyMessage:
+    try:
+        reader = _Reader(data)
+        kind = reader.u8()
+
+        if kind == KIND_JSON:
+            return Message.from_raw(data[1:])
+
+        if kind != KIND_GAME_EVENT:
+            raise WireError(f"Unknown frame kind {kind}.")
+
+        type_ = _TYPES_BY_CODE[reader.u8()]
+        _, _, _, unpack = _LAYOUTS[type_]
+        payload = unpack(reader)
+        reader.done()
+    except (struct.error, KeyError, UnicodeDecodeError) as exc:
+        raise WireError("Malformed frame.") from exc
+
+    return Message(event=GameEvent(type=type_, payload=payload))
@@ -11,6 +11,7 @@ from textual.screen import Screen
 
 from battleship import get_client_version
 from battleship.client import Client, ClientError, ConnectionEvent
+from battleship.engine import ai
 from battleship.tui import screens, strategies
 from battleship.tui.di import container
 from battleship.tui.widgets import modals
@@ -45,12 +46,19 @@ class BattleshipApp(App[None]):
 
     @classmethod
     def singleplayer(
-        cls, roster: str, firing_order: str, salvo_mode: bool, no_adjacent_ships: bool
+        cls,
+        roster: str,
+        firing_order: str,
+        salvo_mode: bool,
+        no_adjacent_ships: bool,
+        targeting: ai.Targeting = ai.Targeting.HUNT,
     ) -> "BattleshipApp":
         singleplayer_screen = screens.Singleplayer()
 
         def start_game() -> None:
-            singleplayer_screen.start_game(roster, firing_order, salvo_mode, no_adjacent_ships)
+            singleplayer_screen.start_game(
+                roster, firing_order, salvo_mode, no_adjacent_ships, targeting
+            )
 
         instance: BattleshipApp = cls(mount_screen=singleplayer_screen)
         instance.call_later(start_game)
@@ -210,6 +218,16 @@ class BattleshipApp(App[None]):
                     timeout=5,
                 )
 
+        async def resume_active_game() -> None:
+            # The server keeps the game for a while, wait for it to tell whose move it is.
+            if isinstance(self.screen, screens.Game):
+                screen = cast(screens.Game, self.screen)
+
+                try:
+                    await screen.resume_game()
+                except strategies.GameNeverResumed:
+                    await cancel_active_game()
+
         logger.debug(
             "Handle connection loss: show the modal, "
             "setup handlers in case it is restored (or lost forever)."
@@ -230,7 +248,7 @@ class BattleshipApp(App[None]):
                 ConnectionEvent.CONNECTION_IMPOSSIBLE, handle_connection_impossible
             )
             await modal.dismiss()
-            await cancel_active_game()
+            await resume_active_game()
 
         async def handle_connection_impossible() -> None:
             logger.debug("Unable to restore connection, return to the main menu.")
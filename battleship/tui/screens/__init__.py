@@ -1,6 +1,7 @@
 from battleship.tui.screens.create_game import CreateGame
 from battleship.tui.screens.game import Game
 from battleship.tui.screens.join_game import JoinGame
+from battleship.tui.screens.leaderboard import Leaderboard
 from battleship.tui.screens.lobby import Lobby
 from battleship.tui.screens.main_menu import MainMenu
 from battleship.tui.screens.multiplayer import Multiplayer
@@ -17,5 +18,6 @@ __all__ = [
     "CreateGame",
     "JoinGame",
     "Statistics",
+    "Leaderboard",
     "Settings",
 ]
@@ -31,12 +31,12 @@ from battleship.tui.widgets.modals import GameSummaryModal, SessionEndModal
 
 
 def convert_to_coordinate(coordinate: Coordinate) -> str:
-    return chr(coordinate.column + 1 + 64) + str(coordinate.row + 1)
+    return domain.Coordinate(coordinate.column, coordinate.row).to_human()
 
 
 def convert_from_coordinate(coordinate: str) -> Coordinate:
-    column, row = domain.parse_coordinate(coordinate)
-    return Coordinate(row - 1, ord(column) - 1 - 64)
+    coor = domain.Coordinate.from_human(coordinate)
+    return Coordinate(coor.y, coor.x)
 
 
 CANCEL_MSG = {
@@ -120,6 +120,7 @@ class Game(Screen[None]):
         self._strategy.subscribe("salvo", self.on_salvo)
         self._strategy.subscribe("game_ended", self.on_game_ended)
         self._strategy.subscribe("game_cancelled", self.on_game_cancelled)
+        self._strategy.subscribe("game_state", self.on_game_state)
 
     def compose(self) -> ComposeResult:
         with Container():
@@ -240,6 +241,50 @@ class Game(Screen[None]):
         if self._strategy.salvo_mode:
             self.board_map[salvo.actor.name].min_targets = salvo.ships_left
 
+    def on_game_state(
+        self,
+        ships: dict[str, list[str]],
+        fleets_ready: list[str],
+        salvos: list[models.Salvo],
+    ) -> None:
+        logger.info("Restore the game state after reconnect.")
+
+        for ship_id, position in ships.items():
+            self.player_board.paint_ship([convert_from_coordinate(p) for p in position])
+            self.player_fleet.place(ship_id)
+
+        self.players_ready = len(fleets_ready)
+
+        if self.players_ready == 2:
+            text = PHASE_BATTLE_SALVO if self._strategy.salvo_mode else PHASE_BATTLE
+            self.query_one(Announcement).update_phase(text)
+
+        for salvo in salvos:
+            board = self.board_map[salvo.subject.name]
+            damage: dict[str, int] = {}
+
+            for shot in salvo.shots:
+                coor = convert_from_coordinate(shot.coordinate)
+
+                if shot.miss:
+                    board.paint_miss(coor)
+                    continue
+
+                assert shot.ship, "Shot was a hit, but no ship"
+                damage[shot.ship.id] = damage.get(shot.ship.id, 0) + 1
+
+                if shot.ship.destroyed:
+                    board.paint_destroyed(map(convert_from_coordinate, shot.ship.cells))
+                else:
+                    board.paint_damage(coor)
+
+            self.fleet_map[salvo.subject.name].set_damage(damage)
+
+            if self._strategy.salvo_mode:
+                self.board_map[salvo.actor.name].min_targets = salvo.ships_left
+
+        self.write_as_game(":link: Reconnected to the game")
+
     def on_game_ended(self, winner: str, summary: models.GameSummary) -> None:
         logger.info("Game ended. {winner} has won.", winner=winner)
 
@@ -294,6 +339,10 @@ class Game(Screen[None]):
 
         self.app.push_screen(SessionEndModal(), callback)
 
+    async def resume_game(self) -> None:
+        logger.info("Resume the game after reconnect.")
+        await self._strategy.resumed()
+
     def cancel_game(self) -> None:
         logger.info("Game has been cancelled.")
 
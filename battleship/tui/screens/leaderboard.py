@@ -0,0 +1,140 @@
+from typing import Any
+
+from loguru import logger
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Container, Vertical, VerticalScroll
+from textual.events import Mount, ScreenResume, ScreenSuspend
+from textual.screen import Screen
+from textual.widgets import DataTable, Label, Markdown, Tab, Tabs
+
+from battleship.client import Client, ClientError
+from battleship.shared.models import (
+    LeaderboardCategory,
+    LeaderboardEntry,
+    LeaderboardPage,
+)
+from battleship.tui import resources
+from battleship.tui.di import container
+from battleship.tui.format import format_duration
+from battleship.tui.widgets import AppFooter
+
+CATEGORY_LABELS = {
+    LeaderboardCategory.WINS: "Wins",
+    LeaderboardCategory.WIN_RATIO: "Win/loss ratio",
+    LeaderboardCategory.ACCURACY: "Accuracy",
+    LeaderboardCategory.QUICKEST_WIN: "Quickest win",
+}
+
+
+def format_score(category: LeaderboardCategory, score: float) -> str:
+    match category:
+        case LeaderboardCategory.WIN_RATIO | LeaderboardCategory.ACCURACY:
+            return f"{round(score * 100, 1)}%"
+        case LeaderboardCategory.QUICKEST_WIN:
+            return format_duration(int(score))
+        case _:
+            return str(int(score))
+
+
+class Leaderboard(Screen[None]):
+    BINDINGS = [
+        ("escape", "back", "Back"),
+        ("p", "previous_page", "Previous page"),
+        ("n", "next_page", "Next page"),
+    ]
+    PAGE_SIZE = 20
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._client = container.resolve(Client)
+        self._category = LeaderboardCategory.WINS
+        self._page: LeaderboardPage | None = None
+
+        with resources.get_resource("leaderboard_help.md").open() as fh:
+            self.help = fh.read()
+
+    def compose(self) -> ComposeResult:
+        with Container(classes="container"):
+            with VerticalScroll():
+                yield Markdown(
+                    self.help,
+                )
+
+            with Vertical():
+                yield Tabs(
+                    *(Tab(label, id=category) for category, label in CATEGORY_LABELS.items())
+                )
+                yield DataTable(cursor_type="row", zebra_stripes=True)
+                yield Label(id="player")
+
+        yield AppFooter()
+
+    @on(Mount)
+    def add_columns(self) -> None:
+        table: DataTable[str] = self.query_one(DataTable)
+        table.add_column("Rank", key="rank")
+        table.add_column("Player", key="nickname")
+        table.add_column("Score", key="score")
+
+    def action_back(self) -> None:
+        self.app.pop_screen()
+
+    async def action_previous_page(self) -> None:
+        if self._page is not None and self._page.offset > 0:
+            await self.load_page(max(self._page.offset - self.PAGE_SIZE, 0))
+
+    async def action_next_page(self) -> None:
+        if self._page is None:
+            return
+
+        offset = self._page.offset + self.PAGE_SIZE
+
+        if offset < self._page.total:
+            await self.load_page(offset)
+
+    @on(Tabs.TabActivated)
+    async def switch_category(self, event: Tabs.TabActivated) -> None:
+        self._category = LeaderboardCategory(str(event.tab.id))
+        await self.load_page(0)
+
+    async def load_page(self, offset: int) -> None:
+        self.loading = True  # noqa
+
+        try:
+            page = await self._client.fetch_leaderboard(self._category, offset, self.PAGE_SIZE)
+        except ClientError:
+            self.notify(
+                "Cannot load leaderboard", title="Loading error", severity="error", timeout=5
+            )
+        else:
+            self._page = page
+            self._show_page(page)
+        finally:
+            self.loading = False  # noqa
+
+    def _show_page(self, page: LeaderboardPage) -> None:
+        table: DataTable[str] = self.query_one(DataTable)
+        table.clear()
+
+        for entry in page.entries:
+            table.add_row(*self._format_entry(entry))
+
+        if page.player is None:
+            text = "Finish a multiplayer game to get on the leaderboard."
+        else:
+            rank, _, score = self._format_entry(page.player)
+            text = f"Your rank: {rank} of {page.total}, {score}"
+
+        self.query_one("#player", Label).update(text)
+
+    def _format_entry(self, entry: LeaderboardEntry) -> tuple[str, str, str]:
+        return str(entry.rank), entry.nickname, format_score(self._category, entry.score)
+
+    @on(ScreenResume)
+    def log_enter(self) -> None:
+        logger.info("Enter {screen} screen.", screen=self.__class__.__name__)
+
+    @on(ScreenSuspend)
+    def log_leave(self) -> None:
+        logger.info("Leave {screen} screen.", screen=self.__class__.__name__)
@@ -40,6 +40,7 @@ class Lobby(Screen[None]):
                     yield ListItem(Label("🎯 Create game"), id="create_game")
                     yield ListItem(Label("🔍 Join game"), id="join_game")
                     yield ListItem(Label("📜 Statistics"), id="stats")
+                    yield ListItem(Label("🏆 Leaderboard"), id="leaderboard")
                     yield ListItem(Label("👋 Logout"), id="logout")
 
         yield AppFooter()
@@ -103,6 +104,10 @@ class Lobby(Screen[None]):
         finally:
             self.loading = False  # noqa
 
+    @on(ListView.Selected, item="#leaderboard")
+    async def show_leaderboard(self) -> None:
+        await self.app.push_screen(screens.Leaderboard())
+
     async def update_online_count(self, count: int) -> None:
         self.query_one(LobbyHeader).players_online = count
 
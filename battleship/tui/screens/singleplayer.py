@@ -8,7 +8,7 @@ from textual.events import ScreenResume, ScreenSuspend
 from textual.screen import Screen
 from textual.widgets import Markdown
 
-from battleship.engine import create_game
+from battleship.engine import ai, create_game
 from battleship.engine.rosters import get_roster
 from battleship.tui import resources, screens, strategies
 from battleship.tui.di import container
@@ -37,7 +37,7 @@ class Singleplayer(Screen[None]):
                 )
 
             with Container():
-                yield NewGame()
+                yield NewGame(with_targeting=True)
 
         yield AppFooter()
 
@@ -45,7 +45,12 @@ class Singleplayer(Screen[None]):
         self.app.switch_screen(screens.MainMenu())
 
     def start_game(
-        self, roster_name: str, firing_order: str, salvo_mode: bool, no_adjacent_ships: bool
+        self,
+        roster_name: str,
+        firing_order: str,
+        salvo_mode: bool,
+        no_adjacent_ships: bool,
+        targeting: ai.Targeting = ai.Targeting.HUNT,
     ) -> None:
         roster = get_roster(roster_name)
         game = create_game(
@@ -59,18 +64,26 @@ class Singleplayer(Screen[None]):
         logger.info(
             "Start singleplayer game. Player name: {player_name}. Roster: {roster}. "
             "Firing order: {firing_order}. Salvo mode: {salvo_mode}. "
-            "No adjacent ships: {no_adjacent_ships}.",
+            "No adjacent ships: {no_adjacent_ships}. Targeting: {targeting}.",
             player_name=self._settings.player_name,
             roster=roster,
             firing_order=firing_order,
             salvo_mode=salvo_mode,
             no_adjacent_ships=no_adjacent_ships,
+            targeting=targeting,
         )
-        self.app.push_screen(screens.Game(strategy=strategies.SingleplayerStrategy(game)))
+        strategy = strategies.SingleplayerStrategy(game, targeting=targeting)
+        self.app.push_screen(screens.Game(strategy=strategy))
 
     @on(NewGame.PlayPressed)
     def start_game_from_event(self, event: NewGame.PlayPressed) -> None:
-        self.start_game(event.roster, event.firing_order, event.salvo_mode, event.no_adjacent_ships)
+        self.start_game(
+            event.roster,
+            event.firing_order,
+            event.salvo_mode,
+            event.no_adjacent_ships,
+            event.targeting,
+        )
 
     @on(ScreenResume)
     def log_enter(self) -> None:
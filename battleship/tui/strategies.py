@@ -8,7 +8,7 @@ from typing import Any, Callable, Collection
 from pymitter import EventEmitter  # type: ignore[import-untyped]
 
 from battleship import is_debug
-from battleship.client import Client
+from battleship.client import Client, ConnectionEvent
 from battleship.engine import Roster, RosterItem, ai, domain
 from battleship.shared import models
 from battleship.shared.compat import async_timeout as timeout
@@ -19,6 +19,7 @@ __all__ = [
     "SingleplayerStrategy",
     "MultiplayerStrategy",
     "GameNeverStarted",
+    "GameNeverResumed",
 ]
 
 
@@ -26,6 +27,10 @@ class GameNeverStarted(Exception):
     pass
 
 
+class GameNeverResumed(Exception):
+    pass
+
+
 class GameStrategy(abc.ABC):
     def __init__(self) -> None:
         self._ee = EventEmitter()
@@ -77,6 +82,13 @@ class GameStrategy(abc.ABC):
     def cancel(self) -> None:
         pass
 
+    @abc.abstractmethod
+    async def resumed(self) -> None:
+        """
+        Waits until the game can go on after the connection to the server
+        was restored. Raises `GameNeverResumed` if it can't.
+        """
+
     def subscribe(self, event: str, handler: Callable[..., Any]) -> None:
         self._ee.on(event, handler)
 
@@ -98,9 +110,20 @@ class GameStrategy(abc.ABC):
     def emit_game_ended(self, winner: str, summary: models.GameSummary) -> None:
         self._ee.emit_future("game_ended", winner=winner, summary=summary)
 
+    def emit_game_state(
+        self,
+        ships: dict[str, list[str]],
+        fleets_ready: list[str],
+        salvos: list[models.Salvo],
+    ) -> None:
+        self._ee.emit_future("game_state", ships=ships, fleets_ready=fleets_ready, salvos=salvos)
+
 
 class MultiplayerStrategy(GameStrategy):
     START_TIMEOUT = 60 * 10  # 10 minutes.
+    # The server gives a player 30 seconds to reconnect, more if the game
+    # has to be adopted by another server process first.
+    RESUME_TIMEOUT = 60
 
     def __init__(self, player: str, client: Client):
         super().__init__()
@@ -112,6 +135,7 @@ class MultiplayerStrategy(GameStrategy):
         self._no_adjacent_ships: bool | None = None
         self._winner = None
         self._client = client
+        self._fleets_ready = 0
 
         client.add_listener(ServerGameEvent.SHIP_SPAWNED, self._on_ship_spawned)
         client.add_listener(ServerGameEvent.FLEET_READY, self._on_fleet_ready)
@@ -120,8 +144,11 @@ class MultiplayerStrategy(GameStrategy):
         client.add_listener(ServerGameEvent.GAME_ENDED, self._on_game_ended)
         client.add_listener(ServerGameEvent.GAME_CANCELLED, self._on_game_cancelled)
         client.add_listener(ServerGameEvent.START_GAME, self._on_start_game)
+        client.add_listener(ServerGameEvent.GAME_STATE, self._on_game_state)
+        client.add_listener(ConnectionEvent.CONNECTION_LOST, self._on_connection_lost)
 
         self._game_started = asyncio.Event()
+        self._game_resumed = asyncio.Event()
 
     @property
     def player(self) -> str:
@@ -172,6 +199,20 @@ class MultiplayerStrategy(GameStrategy):
             self._clear_handlers()
             raise GameNeverStarted
 
+    async def resumed(self) -> None:
+        """
+        Waits for the server to tell whose move it is after a reconnect.
+        While fleets are being arranged, there is nothing to wait for.
+        """
+        if self._fleets_ready < 2:
+            return
+
+        try:
+            async with timeout(self.RESUME_TIMEOUT):
+                await self._game_resumed.wait()
+        except TimeoutError:
+            raise GameNeverResumed
+
     def _clear_handlers(self) -> None:
         self._client.remove_listener(ServerGameEvent.SHIP_SPAWNED, self._on_ship_spawned)
         self._client.remove_listener(ServerGameEvent.FLEET_READY, self._on_fleet_ready)
@@ -180,6 +221,8 @@ class MultiplayerStrategy(GameStrategy):
         self._client.remove_listener(ServerGameEvent.GAME_ENDED, self._on_game_ended)
         self._client.remove_listener(ServerGameEvent.GAME_CANCELLED, self._on_game_cancelled)
         self._client.remove_listener(ServerGameEvent.START_GAME, self._on_start_game)
+        self._client.remove_listener(ServerGameEvent.GAME_STATE, self._on_game_state)
+        self._client.remove_listener(ConnectionEvent.CONNECTION_LOST, self._on_connection_lost)
 
     def _on_ship_spawned(self, payload: dict[str, Any]) -> None:
         player = payload["player"]
@@ -189,11 +232,13 @@ class MultiplayerStrategy(GameStrategy):
 
     def _on_fleet_ready(self, payload: dict[str, Any]) -> None:
         player = payload["player"]
+        self._fleets_ready += 1
         self.emit_fleet_ready(player)
 
     def _on_awaiting_move(self, payload: dict[str, Any]) -> None:
         actor = payload["actor"]
         subject = payload["subject"]
+        self._game_resumed.set()
         self.emit_awaiting_move(actor, subject)
 
     def _on_salvo(self, payload: dict[str, Any]) -> None:
@@ -204,13 +249,28 @@ class MultiplayerStrategy(GameStrategy):
         winner = payload["winner"]
         self._winner = winner
         summary = models.GameSummary.from_raw(payload["summary"])
+        # The game could end while the connection was lost.
+        self._game_resumed.set()
         self.emit_game_ended(winner, summary)
         self._clear_handlers()
 
     def _on_game_cancelled(self, payload: dict[str, Any]) -> None:
         reason = payload["reason"]
+        # Nothing to resume, the game screen is closed by the handler.
+        self._game_resumed.set()
         self._ee.emit("game_cancelled", reason=reason)
 
+    def _on_game_state(self, payload: dict[str, Any]) -> None:
+        # Events sent while the connection was lost are missed,
+        # the server sends the whole state of the game instead.
+        fleets_ready = payload["fleets_ready"]
+        salvos = [models.Salvo.from_raw(salvo) for salvo in payload["salvos"]]
+        self._fleets_ready = len(fleets_ready)
+        self.emit_game_state(payload["ships"], fleets_ready, salvos)
+
+    def _on_connection_lost(self) -> None:
+        self._game_resumed.clear()
+
     def _on_start_game(self, payload: dict[str, Any]) -> None:
         enemy_nickname = payload["enemy"]
         firing_order = payload["firing_order"]
@@ -232,13 +292,15 @@ class MultiplayerStrategy(GameStrategy):
 
 
 class SingleplayerStrategy(GameStrategy):
-    def __init__(self, game: domain.Game):
+    def __init__(self, game: domain.Game, targeting: ai.Targeting = ai.Targeting.HUNT):
         super().__init__()
         self._game = game
         self._enable_move_delay = not is_debug()
         self._human_player = game.player_a
         self._bot_player = game.player_b
-        self._target_caller = ai.TargetCaller(self._human_player.board)
+        self._target_caller = ai.make_target_caller(
+            targeting, self._human_player.board, game.roster, game.no_adjacent_ships
+        )
         self._autoplacer = ai.Autoplacer(
             self._bot_player.board, self._game.roster, self._game.no_adjacent_ships
         )
@@ -319,6 +381,10 @@ class SingleplayerStrategy(GameStrategy):
     def cancel(self) -> None:
         pass
 
+    async def resumed(self) -> None:
+        # The game is played locally, the connection doesn't matter.
+        pass
+
     def _call_bot_target(self) -> Collection[str]:
         if self._game.salvo_mode:
             count = self._bot_player.ships_alive
@@ -329,10 +395,11 @@ class SingleplayerStrategy(GameStrategy):
         return position
 
     def _spawn_bot_fleet(self) -> None:
-        for item in self._game.roster:
-            coordinates = self._autoplacer.place(item.type)
+        fleet = self._autoplacer.place_fleet()
+
+        for ship_id, coordinates in fleet.items():
             # Do not send fleet_ready message yet, the screen might be not ready
             # to display a message.
             self._game.add_ship(
-                self._bot_player, [coor.to_human() for coor in coordinates], item.id
+                self._bot_player, [coor.to_human() for coor in coordinates], ship_id
             )
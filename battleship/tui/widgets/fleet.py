@@ -69,6 +69,10 @@ class Ship(Static):
 
         self.render_ship()
 
+    def set_damage(self, damage: int) -> None:
+        self._damage = min(damage, self._hp)
+        self.render_ship()
+
     def render_ship(self) -> None:
         self.tooltip = self.type_display
         self.update(self._factory(self.hp, self._damage, self.destroyed))
@@ -156,5 +160,14 @@ class Fleet(Widget):
         if ship.destroyed:
             self.ships_alive -= 1
 
+    def set_damage(self, damage: dict[str, int]) -> None:
+        """
+        Sets damage of every ship, e.g. to restore the fleet after reconnect.
+        """
+        for ship_id, ship in self._ships.items():
+            ship.set_damage(damage.get(ship_id, 0))
+
+        self.ships_alive = sum(not ship.destroyed for ship in self._ships.values())
+
     def update_title(self) -> None:
         self.border_title = f"[{self.ships_alive}/{self.ships_total}] {self._title}"
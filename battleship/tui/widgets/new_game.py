@@ -7,7 +7,7 @@ from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Button, Checkbox, Input, RadioButton, RadioSet
 
-from battleship.engine import domain
+from battleship.engine import ai, domain
 
 
 class NewGame(Widget):
@@ -19,6 +19,7 @@ class NewGame(Widget):
             firing_order: domain.FiringOrder,
             salvo_mode: bool,
             no_adjacent_ships: bool,
+            targeting: ai.Targeting,
         ) -> None:
             super().__init__()
             self.name = name
@@ -26,15 +27,20 @@ class NewGame(Widget):
             self.firing_order = firing_order
             self.salvo_mode = salvo_mode
             self.no_adjacent_ships = no_adjacent_ships
+            self.targeting = targeting
 
-    def __init__(self, *args: Any, with_name: bool = False, **kwargs: Any) -> None:
+    def __init__(
+        self, *args: Any, with_name: bool = False, with_targeting: bool = False, **kwargs: Any
+    ) -> None:
         super().__init__(*args, **kwargs)
         self._with_name = with_name
+        self._with_targeting = with_targeting
         self.game_name = ""
         self.roster = "classic"
         self.firing_order = domain.FiringOrder.ALTERNATELY
         self.salvo_mode = False
         self.no_adjacent_ships = False
+        self.targeting = ai.Targeting.HUNT
 
     def compose(self) -> ComposeResult:
         if self._with_name:
@@ -52,6 +58,13 @@ class NewGame(Widget):
 
         yield Checkbox("Salvo mode", name="salvo_mode", id="salvo_mode")
         yield Checkbox("No adjacent ships", name="no_adjacent_ships", id="no_adjacent_ships")
+
+        if self._with_targeting:
+            with RadioSet(id="targeting", classes="options-panel") as rs:
+                rs.border_title = "Computer"
+                yield RadioButton("Hunt and target", name="hunt", value=True)
+                yield RadioButton("Probability density", name="density")
+
         yield Button("Play", variant="success")
 
     @on(Mount)
@@ -84,6 +97,10 @@ class NewGame(Widget):
     def update_no_adjacent_ships(self, event: Checkbox.Changed) -> None:
         self.no_adjacent_ships = event.value
 
+    @on(RadioSet.Changed, "#targeting")
+    def update_targeting(self, event: RadioSet.Changed) -> None:
+        self.targeting = ai.Targeting(str(event.pressed.name))
+
     @on(Button.Pressed)
     def emit_play_pressed(self) -> None:
         with self.prevent(Button.Pressed):
@@ -97,5 +114,6 @@ class NewGame(Widget):
                 self.firing_order,
                 self.salvo_mode,
                 self.no_adjacent_ships,
+                self.targeting,
             )
         )
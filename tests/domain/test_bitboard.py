@@ -0,0 +1,145 @@
+import random
+
+import pytest
+
+from battleship.engine import ai, domain, errors
+
+
+def test_bitboard_places_ship():
+    board = domain.BitBoard()
+    ship = domain.Ship("id", type="ship", hp=3)
+    a3, a4, a5 = domain.position_to_coordinates(["A3", "A4", "A5"])
+
+    board.place_ship([a3, a4, a5], ship=ship)
+
+    assert ship in board.ships
+    assert ship.cells == [a3, a4, a5]
+    assert board.get_cell(a3).ship is ship
+    assert board.get_cell(a4).ship is ship
+    assert board.get_cell(a5).ship is ship
+    assert board.get_cell(domain.Coordinate.from_human("A6")).ship is None
+
+
+@pytest.mark.parametrize("coord", ["A11", "B0", "V5"])
+def test_bitboard_returns_none_if_cell_not_found(coord):
+    board = domain.BitBoard()
+
+    assert board.get_cell(domain.Coordinate.from_human(coord)) is None
+
+
+def test_bitboard_raises_exc_if_cell_taken():
+    board = domain.BitBoard()
+    board.place_ship(domain.position_to_coordinates(["A1", "A2"]), domain.Ship("1", "ship", 2))
+
+    with pytest.raises(errors.CellTaken):
+        board.place_ship(domain.position_to_coordinates(["A2", "B2"]), domain.Ship("2", "ship", 2))
+
+    # A failed placement leaves the board untouched.
+    assert len(board.ships) == 1
+    assert board.get_cell(domain.Coordinate.from_human("B2")).ship is None
+
+
+def test_bitboard_raises_exc_if_cell_out_of_range():
+    board = domain.BitBoard(size=5)
+
+    with pytest.raises(errors.CellOutOfRange):
+        board.place_ship(domain.position_to_coordinates(["E5", "E6"]), domain.Ship("1", "ship", 2))
+
+    with pytest.raises(errors.CellOutOfRange):
+        board.hit_cell(domain.Coordinate.from_human("F1"))
+
+
+def test_bitboard_shooting():
+    board = domain.BitBoard()
+    ship = domain.Ship("id", type="ship", hp=2)
+    board.place_ship(domain.position_to_coordinates(["J9", "J10"]), ship=ship)
+
+    assert board.hit_cell(domain.Coordinate.from_human("J9")) is ship
+    assert ship.hp == 1
+    assert board.hit_cell(domain.Coordinate.from_human("J8")) is None
+    assert ship.hp == 1
+    assert board.get_cell(domain.Coordinate.from_human("J8")).is_shot
+
+    with pytest.raises(errors.CellAlreadyShot):
+        board.hit_cell(domain.Coordinate.from_human("J9"))
+
+
+def test_bitboard_repeated_shot_error_matches_board():
+    coordinate = domain.Coordinate.from_human("B2")
+    board, bitboard = domain.Board(), domain.BitBoard()
+    board.hit_cell(coordinate)
+    bitboard.hit_cell(coordinate)
+
+    with pytest.raises(errors.CellAlreadyShot) as board_error:
+        board.hit_cell(coordinate)
+
+    with pytest.raises(errors.CellAlreadyShot) as bitboard_error:
+        bitboard.hit_cell(coordinate)
+
+    assert str(bitboard_error.value) == str(board_error.value)
+
+
+def test_bitboard_cell_view_reflects_board_state():
+    board = domain.BitBoard()
+    ship = domain.Ship("id", type="ship", hp=1)
+    cell = board.get_cell(domain.Coordinate.from_human("C3"))
+
+    cell.set_ship(ship)
+    cell.hit()
+
+    assert board.ships == [ship]
+    assert cell.ship is ship
+    assert cell.is_shot
+    assert ship.destroyed
+
+    with pytest.raises(errors.CellTaken):
+        cell.set_ship(domain.Ship("other", type="ship", hp=1))
+
+
+def test_bitboard_finds_ships_in_adjacent_cells():
+    board = domain.BitBoard()
+    board.place_ship(
+        domain.position_to_coordinates(["A1", "A2", "A3"]), domain.Ship(id="1", hp=3, type="ship")
+    )
+
+    assert board.has_adjacent_ship(domain.Coordinate.from_human("B1"))
+    assert board.has_adjacent_ship(domain.Coordinate.from_human("A4"))
+    assert board.has_adjacent_ship(domain.Coordinate.from_human("B4"))
+    assert not board.has_adjacent_ship(domain.Coordinate.from_human("C2"))
+    assert not board.has_adjacent_ship(domain.Coordinate.from_human("A5"))
+
+
+def test_bitboard_matches_board():
+    random.seed(42)
+    board, bitboard = domain.Board(), domain.BitBoard()
+    positions = [["B2", "B3", "B4"], ["D5", "E5", "F5", "G5"], ["J1", "J2"]]
+
+    for i, position in enumerate(positions):
+        for b in (board, bitboard):
+            b.place_ship(
+                domain.position_to_coordinates(position), domain.Ship(str(i), "ship", len(position))
+            )
+
+    for cell in random.sample(board.cells, k=50):
+        board.hit_cell(cell.coordinate)
+        bitboard.hit_cell(cell.coordinate)
+
+    def state(cells):
+        return [(c.coordinate, c.ship, c.is_shot) for c in cells]
+
+    assert state(board.cells) == state(bitboard.cells)
+    assert [ship.hp for ship in board.ships] == [ship.hp for ship in bitboard.ships]
+
+
+def test_target_caller_works_with_bitboard():
+    board = domain.BitBoard()
+    ship = domain.Ship("id", "ship", 4)
+    board.place_ship(domain.position_to_coordinates(["B2", "B3", "B4", "B5"]), ship)
+    shot = domain.Shot(domain.Coordinate.from_human("B3"), hit=True, ship=ship)
+    board.hit_cell(shot.coordinate)
+    caller = ai.TargetCaller(board)
+
+    caller.provide_feedback([shot])
+
+    assert caller.call_out(count=4) == ["B2", "B4", "C3", "A3"]
+    assert "B3" not in caller.call_out(count=96)
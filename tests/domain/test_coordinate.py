@@ -1,4 +1,9 @@
+import pickle
+
+import pytest
+
 from battleship.engine.domain import Coordinate
+from battleship.engine.errors import IncorrectCoordinate
 
 
 def test_from_human():
@@ -22,3 +27,71 @@ def test_adjacent_coordinates():
     coor = Coordinate(0, 0)
 
     assert [coor.up(), coor.right(), coor.down(), coor.left()] == expected
+
+
+def test_coordinates_are_interned():
+    coor = Coordinate.from_human("C7")
+
+    assert coor is Coordinate(2, 6)
+    assert coor.up() is Coordinate.from_human("C6")
+    assert Coordinate(0, 0).left() is Coordinate(-1, 0)
+
+
+def test_coordinates_outside_of_table_are_equal():
+    coor = Coordinate.from_human("A99")
+
+    assert coor == Coordinate(0, 98)
+    assert coor.to_human() == "A99"
+
+
+def test_coordinate_is_hashable():
+    coordinates = {Coordinate(1, 1), Coordinate.from_human("B2"), Coordinate(100, 100)}
+
+    assert coordinates == {Coordinate(1, 1), Coordinate(100, 100)}
+
+
+def test_coordinate_is_immutable():
+    coor = Coordinate(0, 0)
+
+    with pytest.raises(AttributeError):
+        coor.x = 1  # type: ignore[misc]
+
+
+def test_coordinate_equals_human_readable_string():
+    assert Coordinate(1, 9) == "B10"
+    assert Coordinate(1, 9) != "B9"
+
+
+def test_equal_coordinates_have_equal_hashes():
+    assert hash(Coordinate(1, 9)) == hash(Coordinate.from_human("B10"))
+    assert hash(Coordinate(1, 9)) == hash("B10")
+    assert Coordinate(20, 20) in {Coordinate(20, 20)}
+    assert "B10" in {Coordinate(1, 9)}
+    assert Coordinate(1, 9) in {"B10"}
+
+
+def test_coordinate_is_not_equal_to_other_types():
+    assert Coordinate(0, 0) != (0, 0)
+    assert Coordinate(0, 0) != None  # noqa: E711
+    assert Coordinate(0, 0) != 0
+
+
+def test_coordinate_is_stored_with_other_types():
+    values = {Coordinate(0, 0): "coordinate", (0, 0): "tuple", None: "none", "B2": "string"}
+
+    assert values[Coordinate(0, 0)] == "coordinate"
+    assert values[(0, 0)] == "tuple"
+    assert values[None] == "none"
+    assert values[Coordinate(1, 1)] == "string"
+    assert len({Coordinate(0, 0), (0, 0), None, "A1"}) == 3
+
+
+def test_coordinate_survives_pickling():
+    coor = Coordinate.from_human("J10")
+
+    assert pickle.loads(pickle.dumps(coor)) is coor
+
+
+def test_incorrect_coordinate_is_not_parsed():
+    with pytest.raises(IncorrectCoordinate):
+        Coordinate.from_human("Z")
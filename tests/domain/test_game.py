@@ -376,3 +376,87 @@ def test_game_emits_game_ended_when_player_wins(game, roster):
     game.turn(game.fire(["A3"]))
 
     assert events == [domain.GameEnded(game.winner)]
+
+
+def test_game_dispatches_sync_events_in_order(roster):
+    [item] = roster
+    game = domain.Game(
+        domain.Player("player_a"), domain.Player("player_b"), roster, sync_events=True
+    )
+    events = []
+    game.on(domain.ShipSpawned, events.append)
+    game.on(domain.NextMove, events.append)
+    game.on(domain.GameEnded, events.append)
+    game.on(domain.GameEnded, lambda event: events.append("second handler"))
+
+    game.add_ship(game.player_a, ["A2", "A3"], item.id)
+    game.add_ship(game.player_b, ["B2", "B3"], item.id)
+    actor, subject = game.actor, game.subject
+    target = "B2" if actor is game.player_a else "A2"
+    game.turn(game.fire([target]))
+    game.turn(game.fire(["J10"]))
+    game.turn(game.fire([target[0] + "3"]))
+
+    assert events == [
+        domain.ShipSpawned(game.player_a, item.id, ["A2", "A3"], fleet_ready=True),
+        domain.ShipSpawned(game.player_b, item.id, ["B2", "B3"], fleet_ready=True),
+        domain.NextMove(actor, subject),
+        domain.NextMove(subject, actor),
+        domain.NextMove(actor, subject),
+        domain.GameEnded(actor),
+        "second handler",
+    ]
+
+
+def test_game_sync_events_reject_coroutine_handlers(roster):
+    game = domain.Game(
+        domain.Player("player_a"), domain.Player("player_b"), roster, sync_events=True
+    )
+
+    async def handler(event):
+        pass
+
+    with pytest.raises(TypeError):
+        game.on(domain.NextMove, handler)
+
+
+@pytest.mark.parametrize("sync_events", [False, True])
+def test_game_turn_returns_game_state(roster, sync_events):
+    [item] = roster
+    game = domain.Game(
+        domain.Player("player_a"), domain.Player("player_b"), roster, sync_events=sync_events
+    )
+    game.add_ship(game.player_a, ["A2", "A3"], item.id)
+    game.add_ship(game.player_b, ["A2", "A3"], item.id)
+    actor = game.actor
+
+    assert game.turn(game.fire(["A2"])) == domain.GameState.BATTLE
+    assert game.actor is not actor
+    assert game.turn(game.fire(["J10"])) == domain.GameState.BATTLE
+    assert game.turn(game.fire(["A3"])) == domain.GameState.END
+    assert game.winner is actor
+
+
+@pytest.mark.parametrize("listen", [False, True])
+def test_game_builds_events_only_for_listeners(roster, monkeypatch, listen):
+    [item] = roster
+    built = []
+
+    class NextMove(domain.NextMove):
+        def __init__(self, *args, **kwargs):
+            built.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(domain, "NextMove", NextMove)
+    game = domain.Game(
+        domain.Player("player_a"), domain.Player("player_b"), roster, sync_events=True
+    )
+
+    if listen:
+        game.on(NextMove, lambda event: None)
+
+    game.add_ship(game.player_a, ["A2", "A3"], item.id)
+    game.add_ship(game.player_b, ["A2", "A3"], item.id)
+    game.turn(game.fire(["A2"]))
+
+    assert len(built) == (2 if listen else 0)
@@ -0,0 +1,47 @@
+import pytest
+
+from battleship.engine import domain
+from battleship.engine.geometry import get_geometry
+
+
+def mask_of(board, position):
+    return board.get_mask(domain.position_to_coordinates(position))
+
+
+@pytest.mark.parametrize(
+    "cell,neighbours",
+    [
+        ("A1", ["B1", "A2", "B2"]),
+        ("J10", ["I9", "J9", "I10"]),
+        ("E5", ["D4", "E4", "F4", "D5", "F5", "D6", "E6", "F6"]),
+        ("J5", ["I4", "J4", "I5", "I6", "J6"]),
+    ],
+)
+def test_geometry_neighbours(cell, neighbours):
+    board = domain.Board()
+    [index] = [i for i, c in enumerate(board.cells) if c.coordinate == cell]
+
+    assert board.geometry.neighbours[index] == mask_of(board, neighbours)
+
+
+def test_geometry_halo_of_ship():
+    board = domain.Board(size=5)
+    halo = board.geometry.halo(mask_of(board, ["E2", "E3"]))
+
+    assert halo == mask_of(board, ["D1", "E1", "D2", "E2", "D3", "E3", "D4", "E4"])
+
+
+def test_geometry_is_cached_per_size():
+    assert get_geometry(10) is get_geometry(10)
+    assert get_geometry(10) is not get_geometry(8)
+
+
+@pytest.mark.parametrize("board_type", [domain.Board, domain.BitBoard])
+def test_board_can_place_ship(board_type):
+    board = board_type()
+    board.place_ship(domain.position_to_coordinates(["C3", "C4"]), domain.Ship("1", "ship", 2))
+
+    assert board.can_place_ship(mask_of(board, ["D3", "D4"]))
+    assert not board.can_place_ship(mask_of(board, ["C4", "C5"]))
+    assert not board.can_place_ship(mask_of(board, ["D5", "D6"]), no_adjacent_ships=True)
+    assert board.can_place_ship(mask_of(board, ["C6", "C7"]), no_adjacent_ships=True)
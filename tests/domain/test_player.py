@@ -35,3 +35,23 @@ def test_player_can_count_ships_by_type():
     player.add_ship(domain.position_to_coordinates(["A2", "A3"]), domain.Ship("id", "ship", 2))
 
     assert player.count_ships(ship_type="ship") == 1
+
+
+def test_player_tracks_fleet_counters():
+    player = domain.Player("player", domain.BitBoard())
+    player.add_ship(domain.position_to_coordinates(["A2", "A3"]), domain.Ship("1", "ship", 2))
+    player.add_ship(domain.position_to_coordinates(["C2"]), domain.Ship("2", "boat", 1))
+
+    assert (player.ships_alive, player.hp) == (2, 3)
+    assert player.count_ships("ship") == player.count_ships("boat") == 1
+
+    player.attack(domain.Coordinate.from_human("A2"))
+    player.attack(domain.Coordinate.from_human("B2"))
+
+    assert (player.ships_alive, player.hp) == (2, 2)
+
+    player.attack(domain.Coordinate.from_human("C2"))
+
+    assert (player.ships_alive, player.hp) == (1, 1)
+    # Destroyed ships still count by type.
+    assert player.count_ships("boat") == 1
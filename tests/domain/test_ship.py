@@ -31,3 +31,28 @@ def test_ship_with_no_hp_is_destroyed():
     ship.damage()
 
     assert ship.destroyed
+
+
+def test_ship_damage_updates_board_counters():
+    board = domain.Board()
+    ship = domain.Ship(id="id", type="ship", hp=2)
+    board.place_ship(domain.position_to_coordinates(["A1", "A2"]), ship)
+
+    ship.damage()
+    ship.damage()
+    ship.damage()
+
+    assert ship.board is board
+    assert (board.ships_alive, board.hp) == (0, 0)
+
+
+def test_ship_can_take_several_hits_at_once():
+    ship = domain.Ship(id="id", type="ship", hp=3)
+
+    ship.damage(2)
+
+    assert ship.hp == 1
+
+    ship.damage(5)
+
+    assert ship.destroyed
@@ -0,0 +1,153 @@
+import random
+
+import pytest
+
+from battleship.engine import ai, domain, errors, rosters
+from battleship.engine.api import create_game
+
+
+def make_game(board_type=domain.BitBoard, **options):
+    random.seed(42)
+    roster = rosters.get_roster("classic")
+    game = create_game("player_a", "player_b", roster, "alternately", False, False, board_type)
+
+    for key, value in options.items():
+        setattr(game, key, value)
+
+    for player in (game.player_a, game.player_b):
+        fleet = ai.Autoplacer(player.board, roster, game.no_adjacent_ships).place_fleet()
+
+        for ship_id, position in fleet.items():
+            game.add_ship(player, [c.to_human() for c in position], ship_id)
+
+    return game
+
+
+def play_moves(game, moves):
+    callers = {
+        game.player_a: ai.TargetCaller(game.player_b.board),
+        game.player_b: ai.TargetCaller(game.player_a.board),
+    }
+
+    for _ in range(moves):
+        if game.state == domain.GameState.END:
+            break
+
+        caller = callers[game.actor]
+        salvo = game.fire(caller.call_out())
+        caller.provide_feedback(salvo)
+        game.turn(salvo)
+
+
+def state(game):
+    def board_state(board):
+        return (
+            type(board),
+            board.get_shots(),
+            [(s.id, s.type, s.hp, s.cells) for s in board.ships],
+            (board.ships_alive, board.hp, board.ship_counts),
+            [(c.coordinate, c.ship and c.ship.id, c.is_shot) for c in board.cells],
+        )
+
+    return (
+        game.roster,
+        game.firing_order,
+        game.salvo_mode,
+        game.no_adjacent_ships,
+        game.state,
+        game.actor.name,
+        game.subject.name,
+        game.winner and game.winner.name,
+        game._can_make_turn,
+        board_state(game.player_a.board),
+        board_state(game.player_b.board),
+    )
+
+
+@pytest.mark.parametrize("board_type", [domain.Board, domain.BitBoard])
+@pytest.mark.parametrize("moves", [0, 15, 400])
+def test_snapshot_round_trips(board_type, moves):
+    game = make_game(board_type)
+    play_moves(game, moves)
+
+    restored = domain.Game.restore(game.snapshot())
+
+    assert state(restored) == state(game)
+    assert restored.snapshot() == game.snapshot()
+
+
+def test_snapshot_keeps_options_and_pending_turn():
+    game = make_game(
+        salvo_mode=True, no_adjacent_ships=True, firing_order=domain.FiringOrder.UNTIL_MISS
+    )
+    salvo = game.fire(["A1", "A2", "A3", "A4", "A5"])
+
+    restored = domain.Game.restore(game.snapshot())
+
+    assert state(restored) == state(game)
+    # The turn can be finished on the restored game.
+    restored.turn(domain.Salvo(restored.actor, restored.subject, salvo.shots))
+
+
+def test_snapshot_is_compact():
+    game = make_game()
+    play_moves(game, 50)
+
+    # Header, roster, two 13-byte shot masks and 17 two-byte ship cells per fleet.
+    assert len(game.snapshot()) < 256
+
+
+def test_restored_game_continues():
+    game = make_game()
+    play_moves(game, 20)
+    restored = domain.Game.restore(game.snapshot(), sync_events=True)
+    events = []
+    restored.on(domain.GameEnded, events.append)
+
+    play_moves(restored, 400)
+
+    assert restored.state == domain.GameState.END
+    assert events == [domain.GameEnded(restored.winner)]
+    # The original game is untouched.
+    assert game.state == domain.GameState.BATTLE
+
+
+@pytest.mark.parametrize(
+    "blob",
+    [b"", b"XYZ\x01", make_game().snapshot()[:-1], make_game().snapshot() + b"\x00"],
+)
+def test_restore_rejects_invalid_snapshot(blob):
+    with pytest.raises(errors.InvalidSnapshot):
+        domain.Game.restore(blob)
+
+
+def test_restore_rejects_unknown_version():
+    blob = bytearray(make_game().snapshot())
+    blob[3] = domain.SNAPSHOT_VERSION + 1
+
+    with pytest.raises(errors.InvalidSnapshot, match="version"):
+        domain.Game.restore(bytes(blob))
+
+
+@pytest.mark.parametrize("board_type", [domain.Board, domain.BitBoard])
+def test_clone_is_independent(board_type):
+    game = make_game(board_type)
+    play_moves(game, 30)
+    snapshot = game.snapshot()
+
+    clone = game.clone()
+
+    assert state(clone) == state(game)
+    play_moves(clone, 400)
+    assert clone.state == domain.GameState.END
+    assert game.snapshot() == snapshot
+
+
+def test_game_first_move():
+    player_a, player_b = domain.Player("a"), domain.Player("b")
+    roster = rosters.get_roster("classic")
+
+    assert domain.Game(player_a, player_b, roster, first_move=player_b).actor is player_b
+
+    with pytest.raises(ValueError):
+        domain.Game(player_a, player_b, roster, first_move=domain.Player("c"))
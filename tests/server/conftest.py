@@ -0,0 +1,50 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from battleship.server.bus import InMemoryMessageBus
+from battleship.server.repositories import StatisticsRepository
+from battleship.shared.models import Client, GameSummary
+
+
+class Statistics(StatisticsRepository):
+    def __init__(self) -> None:
+        self.saved: list[tuple[Client, GameSummary]] = []
+        self.fail = False
+        self.delay = 0.0
+
+    async def create(self, user_id):
+        raise NotImplementedError
+
+    async def get(self, user_id):
+        raise NotImplementedError
+
+    async def save(self, client, game_summary):
+        await self.save_many([(client, game_summary)])
+        return True
+
+    async def save_many(self, summaries):
+        await asyncio.sleep(self.delay)
+
+        if self.fail:
+            raise ConnectionError("Statistics are unreachable.")
+
+        self.saved.extend(summaries)
+
+
+@pytest.fixture
+def statistics():
+    return Statistics()
+
+
+@pytest.fixture
+def message_bus():
+    return InMemoryMessageBus()
+
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.FakeAsyncRedis()
+    yield client
+    await client.aclose()
@@ -0,0 +1,202 @@
+import asyncio
+import json
+
+import pytest
+from blacksheep import Request
+
+from battleship.server.cache import CachedEntry, LobbyCache
+from battleship.server.repositories.clients import InMemoryClientRepository
+from battleship.server.repositories.sessions import InMemorySessionRepository
+from battleship.server.routes import cached_response
+from battleship.shared.events import Message, NotificationEvent, Subscription
+from battleship.shared.models import SessionCreate
+
+SESSION = SessionCreate(
+    name="Game",
+    roster="test",
+    firing_order="alternately",
+    salvo_mode=False,
+    no_adjacent_ships=False,
+)
+
+
+@pytest.fixture
+def sessions(message_bus):
+    return InMemorySessionRepository(message_bus)
+
+
+@pytest.fixture
+def clients(message_bus):
+    return InMemoryClientRepository(message_bus)
+
+
+@pytest.fixture
+def lobby_cache(sessions, clients, message_bus):
+    lobby_cache = LobbyCache(sessions, clients)
+    message_bus.subscribe("entities.session", lobby_cache.handle_session_event)
+    message_bus.subscribe("entities.client", lobby_cache.handle_client_event)
+    message_bus.subscribe("notifications", lobby_cache.handle_notification_event)
+    return lobby_cache
+
+
+class Builder:
+    def __init__(self) -> None:
+        self.builds = 0
+        self.started = asyncio.Event()
+        self.finish = asyncio.Event()
+        self.finish.set()
+
+    async def __call__(self) -> bytes:
+        self.builds += 1
+        self.started.set()
+        await self.finish.wait()
+        return str(self.builds).encode()
+
+
+async def handle_events() -> None:
+    # Let the message bus run handlers of emitted events.
+    await asyncio.sleep(0.01)
+
+
+def make_notification(subscription: Subscription) -> Message[NotificationEvent]:
+    return Message(event=NotificationEvent(subscription=subscription, payload={}))
+
+
+async def test_cached_entry_is_built_once():
+    build = Builder()
+    entry = CachedEntry(build, max_age=30)
+
+    first = await entry.get()
+    second = await entry.get()
+
+    assert first is second
+    assert build.builds == 1
+
+
+async def test_cached_entry_is_built_once_for_concurrent_requests():
+    build = Builder()
+    build.finish.clear()
+    entry = CachedEntry(build, max_age=30)
+
+    requests = [asyncio.create_task(entry.get()) for _ in range(3)]
+    await build.started.wait()
+    build.finish.set()
+    responses = await asyncio.gather(*requests)
+
+    assert len({id(response) for response in responses}) == 1
+    assert build.builds == 1
+
+
+async def test_cached_entry_changes_etag_after_invalidation():
+    entry = CachedEntry(Builder(), max_age=30)
+    first = await entry.get()
+
+    entry.invalidate()
+    second = await entry.get()
+
+    assert first.body != second.body
+    assert first.etag != second.etag
+
+
+async def test_cached_entry_is_rebuilt_after_max_age():
+    build = Builder()
+    entry = CachedEntry(build, max_age=0)
+
+    await entry.get()
+    await entry.get()
+
+    assert build.builds == 2
+
+
+async def test_cached_entry_drops_build_raced_with_invalidation():
+    build = Builder()
+    build.finish.clear()
+    entry = CachedEntry(build, max_age=30)
+
+    request = asyncio.create_task(entry.get())
+    await build.started.wait()
+    entry.invalidate()
+    build.finish.set()
+    stale = await request
+
+    assert (await entry.get()) is not stale
+    assert build.builds == 2
+
+
+async def test_cached_entry_is_rebuilt_after_failed_build():
+    calls = 0
+
+    async def build() -> bytes:
+        nonlocal calls
+        calls += 1
+
+        if calls == 1:
+            raise ConnectionError
+
+        return b"[]"
+
+    entry = CachedEntry(build, max_age=30)
+
+    with pytest.raises(ConnectionError):
+        await entry.get()
+
+    assert (await entry.get()).body == b"[]"
+
+
+async def test_lobby_cache_invalidated_by_session_event(lobby_cache, sessions):
+    empty = await lobby_cache.sessions.get()
+    players = await lobby_cache.players.get()
+
+    session = await sessions.add("host_id", SESSION)
+    await handle_events()
+    updated = await lobby_cache.sessions.get()
+
+    assert json.loads(empty.body) == []
+    assert [s["id"] for s in json.loads(updated.body)] == [session.id]
+    assert updated.etag != empty.etag
+    assert (await lobby_cache.players.get()) is not players
+
+
+async def test_lobby_cache_invalidated_by_client_event(lobby_cache, clients):
+    sessions = await lobby_cache.sessions.get()
+    players = await lobby_cache.players.get()
+
+    await clients.add("client_id", "client", guest=False, version="1")
+    await handle_events()
+    updated = await lobby_cache.players.get()
+
+    assert json.loads(players.body) == dict(total=0, ingame=0)
+    assert json.loads(updated.body) == dict(total=1, ingame=0)
+    assert (await lobby_cache.sessions.get()) is sessions
+
+
+@pytest.mark.parametrize(
+    "subscription,invalidated",
+    [(Subscription.SESSIONS_UPDATE, "sessions"), (Subscription.PLAYERS_UPDATE, "players")],
+)
+async def test_lobby_cache_invalidated_by_notification(
+    lobby_cache, message_bus, subscription, invalidated
+):
+    cached = {
+        "sessions": await lobby_cache.sessions.get(),
+        "players": await lobby_cache.players.get(),
+    }
+
+    await message_bus.emit("notifications", make_notification(subscription))
+    await handle_events()
+
+    for name, response in cached.items():
+        kept = (await getattr(lobby_cache, name).get()) is response
+        assert kept is (name != invalidated)
+
+
+async def test_cached_response_is_not_sent_again_if_etag_matches(lobby_cache):
+    cached = await lobby_cache.sessions.get()
+    fresh = Request("GET", b"/sessions", [])
+    revalidated = Request("GET", b"/sessions", [(b"If-None-Match", cached.etag)])
+    stale = Request("GET", b"/sessions", [(b"If-None-Match", b'"stale"')])
+
+    assert cached_response(fresh, cached).status == 200
+    assert cached_response(revalidated, cached).status == 304
+    assert cached_response(stale, cached).status == 200
+    assert cached_response(fresh, cached).get_first_header(b"ETag") == cached.etag
@@ -0,0 +1,186 @@
+import asyncio
+
+import pytest
+
+from battleship.server.game import Game, GameManager
+from battleship.server.placement import LocalPlacement
+from battleship.server.repositories.clients import InMemoryClientRepository
+from battleship.server.repositories.games import InMemoryGameRepository
+from battleship.server.repositories.sessions import InMemorySessionRepository
+from battleship.server.summaries import SummaryWriter
+from battleship.shared import models
+from battleship.shared.events import GameEvent, ServerGameEvent
+from battleship.shared.models import Client, Session, SessionCreate
+
+HOST = Client(id="host_id", nickname="host", guest=False, version="1")
+GUEST = Client(id="guest_id", nickname="guest", guest=False, version="1")
+SESSION = Session(
+    id="session",
+    name="Game",
+    roster="test",
+    firing_order="alternately",
+    salvo_mode=False,
+    no_adjacent_ships=False,
+    host_id=HOST.id,
+    guest_id=GUEST.id,
+)
+
+
+@pytest.fixture
+def placement():
+    return LocalPlacement()
+
+
+@pytest.fixture
+def received(message_bus):
+    messages: dict[str, list[GameEvent]] = {HOST.id: [], GUEST.id: []}
+
+    for client_id, events in messages.items():
+        message_bus.subscribe(
+            f"clients.out.{client_id}",
+            lambda message, events=events: events.append(message.unwrap()),
+        )
+
+    return messages
+
+
+@pytest.fixture
+async def game(message_bus):
+    game = Game(HOST, GUEST, SESSION, message_bus)
+    yield game
+    await game.cleanup()
+
+
+@pytest.fixture
+async def game_manager(placement, statistics, message_bus, tmp_path):
+    manager = GameManager(
+        InMemorySessionRepository(message_bus),
+        InMemoryClientRepository(message_bus),
+        SummaryWriter(statistics, tmp_path / "statistics.jsonl"),
+        InMemoryGameRepository(),
+        message_bus,
+        placement,
+    )
+    manager.SUPERVISE_INTERVAL = 0.01
+    yield manager
+    await manager.close()
+
+
+async def test_game_manager_keeps_supervising_after_error(game_manager, placement, monkeypatch):
+    renew = placement.renew
+    renewals = 0
+    failures = 0
+
+    async def refresh() -> None:
+        nonlocal failures
+
+        if not failures:
+            failures += 1
+            raise ConnectionError("Redis is unreachable.")
+
+    async def count_renewals(session_ids):
+        nonlocal renewals
+        renewals += 1
+        return await renew(session_ids)
+
+    monkeypatch.setattr(placement, "refresh", refresh)
+    monkeypatch.setattr(placement, "renew", count_renewals)
+
+    await game_manager.start()
+    await asyncio.sleep(0.1)
+
+    assert failures == 1
+    assert renewals > 1
+
+
+def start_battle(game: Game) -> tuple[str, str]:
+    game.add_ship("host", ["A1", "A2"], "0")
+    game.add_ship("guest", ["A1", "A2"], "0")
+    # The first move is random.
+    return game.game.actor.name, game.game.subject.name
+
+
+def win_battle(game: Game) -> str:
+    winner, _ = start_battle(game)
+    game.fire(["A1"])
+    game.fire(["J10"])
+    game.fire(["A2"])
+    return winner
+
+
+async def test_game_resync_sends_state_and_move(game, received):
+    first, second = start_battle(game)
+    game.fire(["A1"])  # First player hits.
+    game.fire(["J10"])  # Second player misses.
+    await asyncio.sleep(0.01)
+    received[GUEST.id].clear()
+    received[HOST.id].clear()
+
+    game.resync(GUEST.id)
+    await asyncio.sleep(0.01)
+
+    state, move = received[GUEST.id]
+    assert state.type == ServerGameEvent.GAME_STATE
+    assert state.payload["ships"] == {"0": ["A1", "A2"]}
+    assert state.payload["fleets_ready"] == ["host", "guest"]
+    salvos = {
+        salvo.subject.name: salvo for salvo in map(models.Salvo.from_raw, state.payload["salvos"])
+    }
+    assert salvos[second].actor.name == first
+    assert [(shot.coordinate, shot.hit) for shot in salvos[second].shots] == [("A1", True)]
+    assert salvos[second].shots[0].ship.id == "0"
+    assert not salvos[second].shots[0].ship.destroyed
+    assert salvos[first].actor.name == second
+    assert [(shot.coordinate, shot.hit) for shot in salvos[first].shots] == [("J10", False)]
+    assert move.type == ServerGameEvent.AWAITING_MOVE
+    assert move.payload == dict(actor=first, subject=second)
+    assert not received[HOST.id]
+
+
+async def test_game_resync_while_arranging_fleet(game, received):
+    game.add_ship("host", ["A1", "A2"], "0")
+    await asyncio.sleep(0.01)
+    received[HOST.id].clear()
+
+    game.resync(HOST.id)
+    await asyncio.sleep(0.01)
+
+    (state,) = received[HOST.id]
+    assert state.type == ServerGameEvent.GAME_STATE
+    assert state.payload["ships"] == {"0": ["A1", "A2"]}
+    assert state.payload["fleets_ready"] == ["host"]
+
+
+async def test_game_resync_sends_result_of_ended_game(game, received):
+    winner = win_battle(game)
+    await asyncio.sleep(0.01)
+    received[GUEST.id].clear()
+
+    game.resync(GUEST.id)
+    await asyncio.sleep(0.01)
+
+    state, result = received[GUEST.id]
+    assert state.type == ServerGameEvent.GAME_STATE
+    assert result.type == ServerGameEvent.GAME_ENDED
+    assert result.payload["winner"] == winner
+
+
+async def test_game_manager_sends_result_missed_while_disconnected(
+    game_manager, message_bus, received
+):
+    data = SessionCreate(**SESSION.model_dump(include=set(SessionCreate.model_fields)))
+    session = await game_manager._sessions.add(HOST.id, data)
+    game = Game(HOST, GUEST, session, message_bus)
+    game_manager._run(game)
+    await asyncio.sleep(0.01)
+    await game_manager.client_disconnected(session.id, GUEST.id)
+    winner = win_battle(game)
+    await asyncio.sleep(0.01)
+    received[GUEST.id].clear()
+
+    await game_manager.resume_client(GUEST.id)
+    await asyncio.sleep(0.01)
+
+    (result,) = received[GUEST.id]
+    assert result.type == ServerGameEvent.GAME_ENDED
+    assert result.payload["winner"] == winner
@@ -0,0 +1,93 @@
+import pytest
+
+from battleship.server.repositories.sessions import RedisSessionRepository
+from battleship.shared.models import SessionCreate
+
+SESSION = SessionCreate(
+    name="Game",
+    roster="test",
+    firing_order="alternately",
+    salvo_mode=False,
+    no_adjacent_ships=False,
+)
+
+
+@pytest.fixture
+def sessions(redis_client, message_bus):
+    return RedisSessionRepository(redis_client, message_bus)
+
+
+async def get_index(redis_client, key):
+    return {member.decode() for member in await redis_client.smembers(key)}
+
+
+async def test_reindex_keeps_session_added_meanwhile(sessions, redis_client, monkeypatch):
+    session = await sessions.add("host_id", SESSION)
+    get_many = sessions._get_many
+    added = []
+
+    async def get_and_add(keys):
+        found = await get_many(keys)
+        monkeypatch.undo()
+        added.append(await sessions.add("other_host_id", SESSION))
+        return found
+
+    monkeypatch.setattr(sessions, "_get_many", get_and_add)
+
+    assert await sessions.reindex() == 1
+    assert await get_index(redis_client, sessions.index_key) == {session.id, added[0].id}
+    assert {s.id for s in await sessions.list_open()} == {session.id, added[0].id}
+    assert (await sessions.get_for_client("other_host_id")).id == added[0].id
+
+
+async def test_reindex_adds_missing_sessions(sessions, redis_client):
+    open_session = await sessions.add("host_id", SESSION)
+    started_session = await sessions.add("other_host_id", SESSION)
+    await sessions.update(started_session.id, guest_id="guest_id", started=True)
+    await redis_client.delete(sessions.index_key, sessions.started_key, sessions.clients_key)
+
+    assert await sessions.reindex() == 2
+    assert await get_index(redis_client, sessions.index_key) == {
+        open_session.id,
+        started_session.id,
+    }
+    assert await get_index(redis_client, sessions.started_key) == {started_session.id}
+    assert (await sessions.get_for_client("host_id")).id == open_session.id
+    assert (await sessions.get_for_client("guest_id")).id == started_session.id
+
+
+async def test_reindex_drops_deleted_sessions(sessions, redis_client):
+    session = await sessions.add("host_id", SESSION)
+    await sessions.update(session.id, started=True)
+    await redis_client.delete(sessions.get_key(session.id))
+
+    assert await sessions.reindex() == 0
+    assert await get_index(redis_client, sessions.index_key) == set()
+    assert await get_index(redis_client, sessions.started_key) == set()
+
+
+async def test_reindex_keeps_client_of_another_session(sessions, redis_client):
+    old_session = await sessions.add("host_id", SESSION)
+    new_session = await sessions.add("host_id", SESSION)
+    await redis_client.srem(sessions.index_key, old_session.id)
+
+    await sessions.reindex()
+
+    assert (await sessions.get_for_client("host_id")).id == new_session.id
+
+
+async def test_reindex_skips_session_deleted_meanwhile(sessions, redis_client, monkeypatch):
+    session = await sessions.add("host_id", SESSION)
+    get_many = sessions._get_many
+
+    async def get_and_delete(keys):
+        found = await get_many(keys)
+        await sessions.delete(session.id)
+        return found
+
+    monkeypatch.setattr(sessions, "_get_many", get_and_delete)
+
+    await sessions.reindex()
+
+    assert await get_index(redis_client, sessions.index_key) == set()
+    assert await sessions.get_for_client("host_id") is None
@@ -0,0 +1,173 @@
+import json
+
+import pytest
+
+from battleship.server.repositories.leaderboard import RedisLeaderboardRepository
+from battleship.server.repositories.statistics import (
+    RedisStatisticsRepository,
+    StatisticsNotFound,
+)
+from battleship.shared.models import Client, GameSummary, LeaderboardCategory
+
+ALICE = Client(id="alice_id", nickname="alice", guest=False, version="1")
+BOB = Client(id="bob_id", nickname="bob", guest=False, version="1")
+
+
+@pytest.fixture
+def statistics(redis_client):
+    return RedisStatisticsRepository(redis_client)
+
+
+@pytest.fixture
+def leaderboard(redis_client, monkeypatch):
+    monkeypatch.setattr(RedisLeaderboardRepository, "min_games", 2)
+    return RedisLeaderboardRepository(redis_client)
+
+
+def make_summary(winner: Client, duration: int, shots: dict[str, int], hits: dict[str, int]):
+    return GameSummary(winner=winner.id, duration=duration, shots=shots, hits=hits)
+
+
+async def play(statistics, winner: Client, loser: Client, duration: int = 60) -> None:
+    summary = make_summary(
+        winner,
+        duration,
+        shots={winner.id: 20, loser.id: 30},
+        hits={winner.id: 10, loser.id: 6},
+    )
+    await statistics.save_many([(winner, summary), (loser, summary)])
+
+
+async def test_statistics_not_found(statistics):
+    with pytest.raises(StatisticsNotFound):
+        await statistics.get(ALICE.id)
+
+
+async def test_statistics_created_empty(statistics):
+    await statistics.create(ALICE.id)
+
+    player = await statistics.get(ALICE.id)
+
+    assert player.games_played == 0
+    assert player.accuracy == 0
+
+
+async def test_statistics_count_games(statistics, leaderboard):
+    await play(statistics, ALICE, BOB, duration=90)
+    await play(statistics, ALICE, BOB, duration=60)
+    await play(statistics, BOB, ALICE, duration=30)
+
+    alice = await statistics.get(ALICE.id)
+    bob = await statistics.get(BOB.id)
+
+    assert (alice.games_played, alice.games_won, alice.shots, alice.hits) == (3, 2, 70, 26)
+    assert (alice.total_duration, alice.quickest_win) == (180, 60)
+    assert (bob.games_played, bob.games_won, bob.shots, bob.hits) == (3, 1, 80, 22)
+    assert bob.quickest_win == 30
+
+
+async def test_statistics_saved_one_by_one(statistics):
+    summary = make_summary(ALICE, 60, shots={ALICE.id: 4}, hits={ALICE.id: 1})
+
+    assert await statistics.save(ALICE, summary)
+
+    alice = await statistics.get(ALICE.id)
+    assert (alice.games_played, alice.games_won, alice.shots, alice.hits) == (1, 1, 4, 1)
+
+
+async def test_legacy_statistics_are_read(statistics, redis_client):
+    legacy = dict(user_id=ALICE.id, games_played=5, games_won=2, shots=50, hits=20)
+    await redis_client.set(statistics.get_key(ALICE.id), json.dumps(legacy))
+
+    alice = await statistics.get(ALICE.id)
+
+    assert (alice.games_played, alice.games_won, alice.shots, alice.hits) == (5, 2, 50, 20)
+
+
+async def test_legacy_statistics_are_converted_on_save(statistics, redis_client):
+    legacy = dict(
+        user_id=ALICE.id,
+        games_played=5,
+        games_won=2,
+        shots=50,
+        hits=20,
+        total_duration=500,
+        quickest_win=80,
+    )
+    await redis_client.set(statistics.get_key(ALICE.id), json.dumps(legacy))
+
+    await play(statistics, ALICE, BOB, duration=70)
+
+    alice = await statistics.get(ALICE.id)
+    assert await redis_client.type(statistics.get_key(ALICE.id)) == b"hash"
+    assert (alice.games_played, alice.games_won, alice.shots, alice.hits) == (6, 3, 70, 30)
+    assert (alice.total_duration, alice.quickest_win) == (570, 70)
+
+
+async def test_legacy_statistics_without_some_fields_are_converted(statistics, redis_client):
+    legacy = dict(user_id=ALICE.id, games_played=1, games_won=1, shots=10, hits=5)
+    await redis_client.set(statistics.get_key(ALICE.id), json.dumps(legacy))
+
+    await play(statistics, BOB, ALICE, duration=70)
+
+    alice = await statistics.get(ALICE.id)
+    assert (alice.games_played, alice.games_won, alice.total_duration) == (2, 1, 70)
+    assert alice.quickest_win == 0
+
+
+async def test_leaderboard_ranks_players(statistics, leaderboard):
+    await play(statistics, ALICE, BOB, duration=90)
+    await play(statistics, ALICE, BOB, duration=60)
+    await play(statistics, BOB, ALICE, duration=30)
+
+    wins = await leaderboard.get_page(LeaderboardCategory.WINS, offset=0, limit=10)
+    quickest = await leaderboard.get_page(LeaderboardCategory.QUICKEST_WIN, offset=0, limit=10)
+    accuracy = await leaderboard.get_page(LeaderboardCategory.ACCURACY, offset=0, limit=10)
+
+    assert [(e.rank, e.nickname, e.score) for e in wins.entries] == [
+        (1, "alice", 2),
+        (2, "bob", 1),
+    ]
+    assert [(e.nickname, e.score) for e in quickest.entries] == [("bob", 30), ("alice", 60)]
+    assert [e.nickname for e in accuracy.entries] == ["alice", "bob"]
+    assert wins.total == 2
+
+
+async def test_leaderboard_ranks_ratios_after_min_games(statistics, leaderboard):
+    await play(statistics, ALICE, BOB)
+
+    assert await leaderboard.get_entry(LeaderboardCategory.WIN_RATIO, ALICE.id) is None
+    assert await leaderboard.get_entry(LeaderboardCategory.ACCURACY, ALICE.id) is None
+
+    await play(statistics, BOB, ALICE)
+    page = await leaderboard.get_page(LeaderboardCategory.WIN_RATIO, offset=0, limit=10)
+
+    assert sorted((e.nickname, e.score) for e in page.entries) == [("alice", 0.5), ("bob", 0.5)]
+
+
+async def test_leaderboard_doesnt_rank_players_without_wins_by_quickest_win(
+    statistics, leaderboard
+):
+    await play(statistics, ALICE, BOB)
+
+    assert await leaderboard.get_entry(LeaderboardCategory.QUICKEST_WIN, BOB.id) is None
+    assert (await leaderboard.get_entry(LeaderboardCategory.WINS, BOB.id)).score == 0
+
+
+async def test_leaderboard_shows_last_nickname(statistics, leaderboard):
+    await play(statistics, ALICE, BOB)
+    renamed = Client(id=ALICE.id, nickname="alice_v2", guest=False, version="1")
+    await play(statistics, renamed, BOB)
+
+    entry = await leaderboard.get_entry(LeaderboardCategory.WINS, ALICE.id)
+
+    assert (entry.nickname, entry.score) == ("alice_v2", 2)
+
+
+async def test_leaderboard_page_is_offset(statistics, leaderboard):
+    await play(statistics, ALICE, BOB)
+
+    page = await leaderboard.get_page(LeaderboardCategory.WINS, offset=1, limit=10)
+
+    assert [(e.rank, e.nickname) for e in page.entries] == [(2, "bob")]
+    assert page.total == 2
@@ -0,0 +1,187 @@
+import asyncio
+import fcntl
+import json
+
+import pytest
+
+from battleship.engine import domain
+from battleship.server.summaries import SummaryWriter
+from battleship.shared.models import Client, GameSummary
+
+
+@pytest.fixture
+def writer(statistics, tmp_path):
+    return SummaryWriter(statistics, tmp_path / "statistics.jsonl", flush_interval=0.01)
+
+
+def make_entry(duration: int) -> tuple[Client, GameSummary]:
+    client = Client(id="player", nickname="Player", guest=False, version="1")
+    return client, GameSummary(duration=duration, winner="player")
+
+
+async def test_summary_writer_close_waits_for_save_in_progress(writer, statistics):
+    statistics.delay = 0.05
+    await writer.start()
+    writer.add(*make_entry(1))
+    await asyncio.sleep(0.02)  # The save is in progress.
+
+    await writer.close()
+
+    assert [summary.duration for _, summary in statistics.saved] == [1]
+
+
+async def test_summary_writer_keeps_batch_if_save_is_cancelled(writer, statistics):
+    statistics.delay = 1
+    writer.add(*make_entry(1))
+    flush = asyncio.create_task(writer.flush())
+    await asyncio.sleep(0.01)
+
+    flush.cancel()
+    await asyncio.gather(flush, return_exceptions=True)
+    statistics.delay = 0
+    await writer.flush()
+
+    assert [summary.duration for _, summary in statistics.saved] == [1]
+
+
+def read_spill(path):
+    return [json.loads(line)["summary"]["duration"] for line in path.read_text().splitlines()]
+
+
+def get_durations(statistics):
+    return sorted(summary.duration for _, summary in statistics.saved)
+
+
+async def test_summary_writer_spills_batch_it_cannot_save(writer, statistics, tmp_path):
+    statistics.fail = True
+    writer.add(*make_entry(1))
+    writer.add(*make_entry(2))
+
+    await writer.flush()
+
+    assert statistics.saved == []
+    assert read_spill(tmp_path / "statistics.jsonl") == [1, 2]
+
+
+async def test_summary_writer_replays_spill_after_save(writer, statistics, tmp_path):
+    statistics.fail = True
+    writer.add(*make_entry(1))
+    await writer.flush()
+
+    statistics.fail = False
+    writer.add(*make_entry(2))
+    await writer.flush()
+
+    assert get_durations(statistics) == [1, 2]
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_summary_writer_replays_spill_on_start(writer, statistics, tmp_path):
+    statistics.fail = True
+    writer.add(*make_entry(1))
+    await writer.flush()
+    statistics.fail = False
+    other_writer = SummaryWriter(statistics, tmp_path / "statistics.jsonl")
+
+    await other_writer.start()
+    await other_writer.close()
+
+    assert get_durations(statistics) == [1]
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_summary_writer_replays_claimed_spill_left_by_failed_replay(
+    writer, statistics, tmp_path
+):
+    statistics.fail = True
+    writer.add(*make_entry(1))
+    await writer.flush()
+
+    await writer.replay()
+    [claimed] = tmp_path.iterdir()
+    writer.add(*make_entry(2))
+    await writer.flush()
+    statistics.fail = False
+    await writer.replay()
+
+    assert claimed.name.startswith("statistics.jsonl.")
+    assert get_durations(statistics) == [1, 2]
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_summary_writer_skips_spill_being_replayed(writer, statistics, tmp_path):
+    claimed = tmp_path / "statistics.jsonl.other"
+    claimed.write_text(json.dumps(dict(client=make_entry(1)[0].to_dict(), summary={})) + "\n")
+
+    with claimed.open() as file:
+        # Locked by a replay of another process.
+        fcntl.flock(file, fcntl.LOCK_EX)
+        await writer.replay()
+
+        assert statistics.saved == []
+
+    await writer.replay()
+
+    assert len(statistics.saved) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_summary_writer_doesnt_write_to_claimed_spill(writer, tmp_path):
+    spill = tmp_path / "statistics.jsonl"
+    spill.touch()
+
+    with spill.open() as file:
+        # A replay has locked the spill and is about to claim it.
+        fcntl.flock(file, fcntl.LOCK_EX)
+        write = asyncio.create_task(asyncio.to_thread(writer._write_spill, [make_entry(1)]))
+        await asyncio.sleep(0.05)
+        claimed = spill.rename(tmp_path / "statistics.jsonl.claimed")
+
+    await write
+
+    assert claimed.read_text() == ""
+    assert read_spill(spill) == [1]
+
+
+async def test_summary_writers_replay_shared_spill_once(statistics, tmp_path):
+    writers = [SummaryWriter(statistics, tmp_path / "statistics.jsonl") for _ in range(3)]
+    statistics.fail = True
+
+    for duration, writer in enumerate(writers):
+        writer.add(*make_entry(duration))
+        await writer.flush()
+
+    statistics.fail = False
+    statistics.delay = 0.01
+    await asyncio.gather(*(writer.replay() for writer in writers))
+
+    assert get_durations(statistics) == [0, 1, 2]
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_summary_writer_skips_malformed_spilled_summary(writer, statistics, tmp_path):
+    client, summary = make_entry(1)
+    entry = json.dumps(dict(client=client.to_dict(), summary=summary.to_dict()))
+    (tmp_path / "statistics.jsonl").write_text(f"{entry}\n{entry[:10]}\n")
+
+    await writer.replay()
+
+    assert get_durations(statistics) == [1]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_game_summary_counts_hp_left_of_winner():
+    winner = domain.Player("player")
+    winner.add_ship(domain.position_to_coordinates(["A1", "A2", "A3"]), domain.Ship("1", "ship", 3))
+    winner.add_ship(domain.position_to_coordinates(["C1", "C2"]), domain.Ship("2", "ship", 2))
+    winner.attack(domain.Coordinate.from_human("A1"))
+    winner.attack(domain.Coordinate.from_human("C1"))
+    winner.attack(domain.Coordinate.from_human("C2"))
+    summary = GameSummary()
+
+    summary.finalize(winner, start=10, end=70)
+
+    assert summary.winner == "player"
+    assert summary.duration == 60
+    assert summary.ships_left == 1
+    assert summary.hp_left == 2
@@ -0,0 +1,187 @@
+import asyncio
+
+import pytest
+
+from battleship.server.notifications import NotificationHub
+from battleship.server.websocket import CLOSE_OVERFLOW, Connection, SendQueue
+from battleship.shared import wire
+from battleship.shared.events import (
+    GameEvent,
+    Message,
+    NotificationEvent,
+    ServerGameEvent,
+    Subscription,
+)
+
+
+class WebSocket:
+    client_ip = "127.0.0.1"
+
+    def __init__(self) -> None:
+        self.sent: list[str | bytes] = []
+        self.closed: tuple[int, str] | None = None
+        # Set to let the client receive messages, a slow client keeps it unset.
+        self.reading = asyncio.Event()
+        self.reading.set()
+
+    async def send_text(self, text):
+        await self.reading.wait()
+        self.sent.append(text)
+
+    async def send_bytes(self, data):
+        await self.reading.wait()
+        self.sent.append(data)
+
+    async def close(self, code, reason):
+        self.closed = code, reason
+
+
+def make_move(actor: str) -> Message[GameEvent]:
+    payload = dict(actor=actor, subject="enemy")
+    return Message(event=GameEvent(type=ServerGameEvent.AWAITING_MOVE, payload=payload))
+
+
+def make_players_update(count: int) -> Message[NotificationEvent]:
+    payload = dict(type="online", count=count)
+    return Message(
+        event=NotificationEvent(subscription=Subscription.PLAYERS_UPDATE, payload=payload)
+    )
+
+
+def get_actors(websocket: WebSocket) -> list[str]:
+    return [Message.from_raw(text).unwrap().payload["actor"] for text in websocket.sent]
+
+
+@pytest.fixture
+def websocket():
+    return WebSocket()
+
+
+@pytest.fixture
+async def connect(websocket, message_bus):
+    connections = []
+
+    def connect(**kwargs):
+        connection = Connection(
+            "client_id", "client", websocket, message_bus, NotificationHub(), **kwargs
+        )
+        connection.__enter__()
+        connections.append(connection)
+        return connection
+
+    yield connect
+
+    for connection in connections:
+        connection.__exit__(None, None, None)
+
+
+def test_send_queue_replaces_superseded_message():
+    queue = SendQueue(maxsize=2)
+
+    assert not queue.put(make_players_update(1))
+    assert not queue.put(make_move("first"))
+    assert queue.put(make_players_update(2))
+    assert len(queue) == 2
+
+
+async def test_send_queue_keeps_order_of_superseded_message():
+    queue = SendQueue(maxsize=2)
+    queue.put(make_players_update(1))
+    queue.put(make_move("first"))
+    queue.put(make_players_update(2))
+
+    first, _ = await queue.get()
+    second, _ = await queue.get()
+
+    assert first.unwrap().payload["count"] == 2
+    assert second.unwrap().payload["actor"] == "first"
+
+
+async def test_send_queue_takes_new_message_of_sent_kind():
+    queue = SendQueue(maxsize=2)
+    queue.put(make_players_update(1))
+    await queue.get()
+
+    assert not queue.put(make_players_update(2))
+    assert len(queue) == 1
+
+
+def test_send_queue_raises_error_if_full():
+    queue = SendQueue(maxsize=1)
+    queue.put(make_move("first"))
+
+    with pytest.raises(asyncio.QueueFull):
+        queue.put(make_move("second"))
+
+
+async def test_connection_sends_messages_in_order(connect, websocket):
+    connection = connect()
+
+    for actor in ["first", "second", "third"]:
+        await connection.send_event(make_move(actor))
+
+    await asyncio.sleep(0)
+
+    assert get_actors(websocket) == ["first", "second", "third"]
+
+
+async def test_connection_sends_binary_frames(connect, websocket):
+    connection = connect(binary=True)
+    message = make_move("first")
+
+    await connection.send_event(message)
+    await asyncio.sleep(0)
+
+    assert websocket.sent == [wire.encode(message)]
+
+
+async def test_connection_disconnects_slow_client(connect, websocket):
+    websocket.reading.clear()
+    connection = connect(queue_size=2)
+
+    # The first message is taken by the writer, two more fill the queue up.
+    for actor in ["first", "second", "third", "fourth"]:
+        await connection.send_event(make_move(actor))
+        await asyncio.sleep(0)
+
+    await asyncio.sleep(0)
+
+    assert websocket.closed == (CLOSE_OVERFLOW, "Send queue overflow")
+    assert len(connection._queue) == 0
+
+    websocket.reading.set()
+    await connection.send_event(make_move("fifth"))
+    await asyncio.sleep(0)
+
+    assert websocket.sent == []
+
+
+async def test_connection_drops_oldest_messages_of_slow_client(connect, websocket):
+    websocket.reading.clear()
+    connection = connect(queue_size=2, overflow="drop_oldest")
+
+    for actor in ["first", "second", "third", "fourth", "fifth"]:
+        await connection.send_event(make_move(actor))
+        await asyncio.sleep(0)
+
+    websocket.reading.set()
+    await asyncio.sleep(0.01)
+
+    assert websocket.closed is None
+    assert get_actors(websocket) == ["first", "fourth", "fifth"]
+
+
+async def test_connection_stops_sending_if_client_is_gone(connect, websocket, monkeypatch):
+    connection = connect()
+
+    async def send_text(text):
+        raise ConnectionResetError
+
+    monkeypatch.setattr(websocket, "send_text", send_text)
+
+    await connection.send_event(make_move("first"))
+    await asyncio.sleep(0)
+    await connection.send_event(make_move("second"))
+
+    assert connection._writer_task.done()
+    assert len(connection._queue) == 0
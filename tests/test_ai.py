@@ -3,7 +3,7 @@ import random
 
 import pytest
 
-from battleship.engine import ai, domain, errors, rosters
+from battleship.engine import ai, domain, errors, geometry, rosters
 
 
 def test_target_caller_calls_correct_amount_of_targets():
@@ -46,7 +46,7 @@ def test_target_caller_targets_adjacent_cells_after_hit_until_all_tried():
     assert caller.call_out() == ["B2"]
     assert [t.coordinate.to_human() for t in caller.next_targets] == ["B4", "C3", "A3"]
     # When all next targets are called out, caller starts mixing in random cells.
-    assert caller.call_out(count=4) == ["B4", "C3", "A3", "C9"]
+    assert caller.call_out(count=4) == ["B4", "C3", "A3", "F9"]
 
 
 @pytest.mark.parametrize("ship", [*rosters.get_roster("classic")])
@@ -101,3 +101,304 @@ def test_autoplacer_respects_no_ships_touch_rule():
     # Autoplacer can't place another ship on the board without violating the rule.
     with pytest.raises(errors.CannotPlaceShip):
         autoplacer.place(ship_type="ship")
+
+
+@pytest.mark.parametrize(
+    "roster,adjacent_ships", [*itertools.product(rosters.get_rosters().values(), (True, False))]
+)
+def test_autoplacer_places_the_whole_fleet_at_once(roster, adjacent_ships):
+    board = domain.Board()
+    autoplacer = ai.Autoplacer(board, roster, no_adjacent_ships=adjacent_ships)
+
+    fleet = autoplacer.place_fleet()
+
+    assert list(fleet) == [item.id for item in roster]
+
+    for item in roster:
+        board.place_ship(fleet[item.id], domain.Ship(*item), no_adjacent_ships=adjacent_ships)
+
+
+def test_autoplacer_backtracks_on_crowded_board():
+    # Two 3-cell ships fit a 3x3 board without touching only on opposite edges.
+    roster = rosters.Roster(
+        name="crowded",
+        items=[rosters.RosterItem("1", "ship", 3), rosters.RosterItem("2", "ship", 3)],
+    )
+
+    for seed in range(20):
+        random.seed(seed)
+        board = domain.Board(size=3)
+        autoplacer = ai.Autoplacer(board, roster, no_adjacent_ships=True)
+
+        fleet = autoplacer.place_fleet()
+
+        for item in roster:
+            board.place_ship(fleet[item.id], domain.Ship(*item), no_adjacent_ships=True)
+
+
+def test_autoplacer_cannot_place_impossible_fleet():
+    board = domain.Board(size=4)
+    autoplacer = ai.Autoplacer(board, rosters.get_roster("classic"), no_adjacent_ships=False)
+
+    with pytest.raises(errors.CannotPlaceShip):
+        autoplacer.place_fleet()
+
+
+def test_autoplacer_draws_only_legal_placements():
+    board = domain.Board(size=3)
+    board.place_ship(
+        domain.position_to_coordinates(["A1", "B1", "C1"]), domain.Ship("1", "ship", 3)
+    )
+    roster = rosters.Roster(name="test", items=[rosters.RosterItem(id="1", type="ship", hp=3)])
+    autoplacer = ai.Autoplacer(board, roster, no_adjacent_ships=True)
+
+    assert [c.to_human() for c in autoplacer.place("ship")] == ["A3", "B3", "C3"]
+
+
+def _play(caller, board, *, count=1):
+    calls = 0
+
+    while any(not ship.destroyed for ship in board.ships):
+        shots = []
+
+        for target in caller.call_out(count=count):
+            coordinate = domain.Coordinate.from_human(target)
+            ship = board.hit_cell(coordinate)
+            shots.append(domain.Shot(coordinate, hit=ship is not None, ship=ship))
+
+        caller.provide_feedback(shots)
+        calls += 1
+
+    return calls
+
+
+def _random_board(roster, no_adjacent_ships=False):
+    board = domain.BitBoard()
+    fleet = ai.Autoplacer(board, roster, no_adjacent_ships).place_fleet()
+
+    for item in roster:
+        board.place_ship(fleet[item.id], domain.Ship(*item), no_adjacent_ships=no_adjacent_ships)
+
+    return board
+
+
+def test_density_caller_prefers_center_of_empty_board():
+    board = domain.BitBoard()
+    caller = ai.DensityTargetCaller(board, rosters.get_roster("classic"))
+
+    # Corners are covered by the fewest placements.
+    assert caller.density[0] < caller.density[44]
+    assert caller.call_out()[0] in {"E5", "F5", "E6", "F6"}
+
+
+def test_density_caller_targets_around_hit():
+    board = domain.BitBoard()
+    ship = domain.Ship("id", "ship", 4)
+    board.place_ship(domain.position_to_coordinates(["E4", "E5", "E6", "E7"]), ship)
+    coordinate = domain.Coordinate.from_human("E5")
+    board.hit_cell(coordinate)
+    caller = ai.DensityTargetCaller(board, rosters.get_roster("classic"))
+
+    caller.provide_feedback([domain.Shot(coordinate, hit=True, ship=ship)])
+
+    assert caller.call_out()[0] in {"E4", "E6", "D5", "F5"}
+
+
+def test_density_caller_forgets_placements_after_miss_and_sinking():
+    board = domain.BitBoard(size=3)
+    roster = rosters.Roster(name="test", items=[rosters.RosterItem("1", "ship", 2)])
+    ship = domain.Ship("1", "ship", 2)
+    board.place_ship(domain.position_to_coordinates(["A1", "B1"]), ship)
+    caller = ai.DensityTargetCaller(board, roster)
+    shots = []
+
+    for target in ["A1", "B1", "C3"]:
+        coordinate = domain.Coordinate.from_human(target)
+        hit = board.hit_cell(coordinate)
+        shots.append(domain.Shot(coordinate, hit=hit is not None, ship=hit))
+
+    caller.provide_feedback(shots)
+
+    assert caller.density == [0] * 9
+    assert not caller.hits
+
+
+@pytest.mark.parametrize("roster", [*rosters.get_rosters().values()])
+def test_density_caller_never_repeats_targets(roster):
+    random.seed(42)
+    board = _random_board(roster)
+    caller = ai.DensityTargetCaller(board, roster)
+
+    # BitBoard raises CellAlreadyShot on a repeated target.
+    assert _play(caller, board, count=3) <= 100
+
+
+def test_density_caller_beats_hunt_caller():
+    random.seed(42)
+    roster = rosters.get_roster("classic")
+    hunt, density = 0, 0
+
+    for _ in range(20):
+        board = _random_board(roster)
+        hunt += _play(ai.TargetCaller(board), board)
+        board = _random_board(roster)
+        density += _play(ai.DensityTargetCaller(board, roster), board)
+
+    assert density < hunt
+
+
+def _count_placements(caller, blocked):
+    # Density recounted from scratch: every placement of every ship afloat
+    # that doesn't cross a blocked cell counts once per covered cell.
+    size = caller.board.size
+    density = [0] * (size * size)
+
+    for hp, remaining in caller.remaining.items():
+        for placement in geometry.get_placement_index(size, hp).placements:
+            if not placement.mask & blocked:
+                for i in placement.cells:
+                    density[i] += remaining
+
+    return density
+
+
+@pytest.mark.parametrize("roster_name", ["classic", "russian"])
+@pytest.mark.parametrize("no_adjacent_ships", [False, True])
+def test_density_caller_keeps_density_up_to_date(roster_name, no_adjacent_ships):
+    random.seed(42)
+    roster = rosters.get_roster(roster_name)
+    board = _random_board(roster, no_adjacent_ships)
+    caller = ai.DensityTargetCaller(board, roster, no_adjacent_ships)
+    halo = caller.geometry.halo
+    blocked = 0
+
+    while any(not ship.destroyed for ship in board.ships):
+        [target] = caller.call_out()
+        coordinate = domain.Coordinate.from_human(target)
+        ship = board.hit_cell(coordinate)
+        caller.provide_feedback([domain.Shot(coordinate, hit=ship is not None, ship=ship)])
+
+        if ship is None:
+            blocked |= board.get_mask([coordinate])
+        elif ship.destroyed:
+            mask = board.get_mask(ship.cells)
+            blocked |= halo(mask) if no_adjacent_ships else mask
+
+        assert caller.density == _count_placements(caller, blocked)
+
+
+def test_density_caller_keeps_track_of_sunk_ships():
+    board = domain.BitBoard()
+    roster = rosters.Roster(
+        name="test",
+        items=[rosters.RosterItem("1", "ship", 2), rosters.RosterItem("2", "ship", 2)],
+    )
+    ship = domain.Ship("1", "ship", 2)
+    board.place_ship(domain.position_to_coordinates(["E5", "E6"]), ship)
+    caller = ai.DensityTargetCaller(board, roster, no_adjacent_ships=True)
+    shots = []
+
+    for target in ["E5", "E6"]:
+        coordinate = domain.Coordinate.from_human(target)
+        board.hit_cell(coordinate)
+        shots.append(domain.Shot(coordinate, hit=True, ship=ship))
+
+    # Both shots report the same sunk ship, it's only counted once.
+    caller.provide_feedback(shots)
+
+    halo = caller.geometry.halo(board.get_mask(ship.cells))
+    assert caller.remaining[2] == 1
+    assert not caller.hits
+    assert caller.shot & board.get_mask(ship.cells) == board.get_mask(ship.cells)
+    assert caller.density == _count_placements(caller, halo)
+    assert all(caller.density[i] == 0 for i in range(100) if halo >> i & 1)
+    assert not set(caller.call_out(count=10)) & {"D4", "E5", "F6", "E7"}
+
+
+def test_density_caller_ignores_ship_sunk_beyond_roster():
+    board = domain.BitBoard()
+    roster = rosters.Roster(name="test", items=[rosters.RosterItem("1", "ship", 2)])
+    caller = ai.DensityTargetCaller(board, roster)
+
+    for position in (["A1", "A2"], ["J9", "J10"]):
+        ship = domain.Ship("1", "ship", 2)
+        board.place_ship(domain.position_to_coordinates(position), ship)
+        shots = []
+
+        for coordinate in ship.cells:
+            board.hit_cell(coordinate)
+            shots.append(domain.Shot(coordinate, hit=True, ship=ship))
+
+        caller.provide_feedback(shots)
+
+    assert caller.remaining[2] == 0
+    assert caller.density == [0] * 100
+
+
+def test_make_target_caller():
+    board = domain.Board()
+    roster = rosters.get_roster("classic")
+
+    assert type(ai.make_target_caller(ai.Targeting.HUNT, board, roster, False)) is ai.TargetCaller
+    assert isinstance(
+        ai.make_target_caller(ai.Targeting.DENSITY, board, roster, False), ai.DensityTargetCaller
+    )
+
+
+def test_density_caller_salvo_surrounds_hit():
+    board = domain.BitBoard()
+    ship = domain.Ship("id", "ship", 4)
+    board.place_ship(domain.position_to_coordinates(["E4", "E5", "E6", "E7"]), ship)
+    coordinate = domain.Coordinate.from_human("E5")
+    board.hit_cell(coordinate)
+    caller = ai.DensityTargetCaller(board, rosters.get_roster("classic"))
+
+    caller.provide_feedback([domain.Shot(coordinate, hit=True, ship=ship)])
+
+    assert set(caller.call_out(count=4)) == {"E4", "E6", "D5", "F5"}
+
+
+def test_density_caller_salvo_spreads_over_placements():
+    board = domain.BitBoard(size=4)
+    roster = rosters.Roster(name="test", items=[rosters.RosterItem("1", "ship", 4)])
+    caller = ai.DensityTargetCaller(board, roster)
+
+    # Every row and column holds one placement, two shots on a diagonal
+    # rule out four of them, two shots in one row only three.
+    first, second = (domain.Coordinate.from_human(t) for t in caller.call_out(count=2))
+
+    assert first.x != second.x and first.y != second.y
+
+
+def test_density_caller_salvo_is_bounded_by_unshot_cells():
+    board = domain.BitBoard(size=2)
+    roster = rosters.Roster(name="test", items=[rosters.RosterItem("1", "ship", 2)])
+    caller = ai.DensityTargetCaller(board, roster)
+
+    assert sorted(caller.call_out(count=10)) == ["A1", "A2", "B1", "B2"]
+
+
+def test_density_caller_shortens_salvo_games():
+    random.seed(42)
+    roster = rosters.get_roster("classic")
+    hunt, density = 0, 0
+
+    for _ in range(10):
+        board = _random_board(roster)
+        hunt += _play(ai.TargetCaller(board), board, count=5)
+        board = _random_board(roster)
+        density += _play(ai.DensityTargetCaller(board, roster), board, count=5)
+
+    assert density < hunt
+
+
+def test_target_caller_doesnt_repeat_targets_in_salvo():
+    board = domain.Board(size=2)
+    ship = domain.Ship("id", "ship", 2)
+    board.place_ship(domain.position_to_coordinates(["A1", "A2"]), ship)
+    board.hit_cell(domain.Coordinate.from_human("A1"))
+    caller = ai.TargetCaller(board)
+
+    caller.provide_feedback([domain.Shot(domain.Coordinate.from_human("A1"), hit=True, ship=ship)])
+
+    assert sorted(caller.call_out(count=3)) == ["A2", "B1", "B2"]
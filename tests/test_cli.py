@@ -0,0 +1,30 @@
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from battleship.cli import tournament
+
+
+@pytest.fixture
+def tournament_app():
+    app = typer.Typer()
+    app.command()(tournament.tournament)
+    return app
+
+
+def test_tournament_ignores_repeated_bots(tournament_app):
+    result = CliRunner().invoke(
+        tournament_app,
+        ["--bot", "hunt", "--bot", "density", "--bot", "hunt", "--games", "2", "--workers", "1"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("hunt") == 1
+    assert result.output.count("density") == 1
+
+
+def test_tournament_needs_two_different_bots(tournament_app):
+    result = CliRunner().invoke(tournament_app, ["--bot", "hunt", "--bot", "hunt"])
+
+    assert result.exit_code == 1
+    assert "at least two different bots" in result.output
@@ -0,0 +1,53 @@
+import pydantic
+import pytest
+
+from battleship.shared.events import (
+    ClientGameEvent,
+    GameEvent,
+    Message,
+    ServerGameEvent,
+    _validate_game_event_type,
+)
+
+
+@pytest.mark.parametrize("type_", [*ClientGameEvent, *ServerGameEvent])
+def test_known_game_event_type_is_accepted(type_):
+    assert _validate_game_event_type(type_) is type_
+
+
+@pytest.mark.parametrize(
+    "type_", [type_ for type_ in ClientGameEvent if type_ not in set(ServerGameEvent)]
+)
+def test_client_game_event_type_is_parsed(type_):
+    assert _validate_game_event_type(type_.value) is type_
+
+
+@pytest.mark.parametrize("type_", [*ServerGameEvent])
+def test_server_game_event_type_is_parsed(type_):
+    assert _validate_game_event_type(type_.value) is type_
+
+
+def test_server_game_event_type_wins_if_both_have_it():
+    assert _validate_game_event_type("cancel_game") is ServerGameEvent.CANCEL_GAME
+
+
+@pytest.mark.parametrize("value", ["unknown", "", "FIRE", 1, None, ["fire"]])
+def test_unknown_game_event_type_is_rejected(value):
+    with pytest.raises(ValueError, match="Unknown game event type"):
+        _validate_game_event_type(value)
+
+
+def test_game_event_with_unknown_type_is_not_parsed():
+    raw = '{"event": {"message_type": "game_event", "type": "unknown", "payload": {}}}'
+
+    with pytest.raises(pydantic.ValidationError, match="Unknown game event type"):
+        Message.from_raw(raw)
+
+
+def test_game_event_with_known_type_is_parsed():
+    raw = '{"event": {"message_type": "game_event", "type": "fire", "payload": {}}}'
+
+    event = Message.from_raw(raw).unwrap()
+
+    assert isinstance(event, GameEvent)
+    assert event.type is ClientGameEvent.FIRE
@@ -0,0 +1,126 @@
+from functools import partial
+
+import pytest
+
+from battleship.engine import ai, domain, simulation
+
+HUNTER = simulation.Contender("hunter")
+DENSITY = simulation.Contender(
+    "density", caller=partial(ai.make_target_caller, ai.Targeting.DENSITY)
+)
+
+
+@pytest.mark.parametrize("rules", simulation.Rules.all(), ids=str)
+def test_play_finishes_game(rules):
+    result = simulation.play(HUNTER, DENSITY, rules, seed=1)
+
+    assert result.winner in ("hunter", "density")
+    assert result.rules == rules
+    assert result.turns > 0
+    assert 0 < result.hits[result.winner] <= result.shots[result.winner]
+
+
+def test_play_is_reproducible():
+    rules = simulation.Rules(salvo_mode=True)
+
+    first = simulation.play(HUNTER, DENSITY, rules, seed=7)
+    second = simulation.play(HUNTER, DENSITY, rules, seed=7)
+
+    assert dataclasses_equal(first, second)
+
+
+def test_play_works_with_regular_board():
+    result = simulation.play(HUNTER, DENSITY, seed=3, board_type=domain.Board)
+
+    assert result.winner in ("hunter", "density")
+
+
+def test_play_requires_distinct_names():
+    with pytest.raises(ValueError):
+        simulation.play(HUNTER, HUNTER)
+
+
+def test_play_uses_custom_placer():
+    placed = []
+
+    def recording_placer(board, roster, no_adjacent_ships):
+        fleet = simulation.autoplace(board, roster, no_adjacent_ships)
+        placed.append(len(fleet))
+        return fleet
+
+    simulation.play(
+        simulation.Contender("a", placer=recording_placer),
+        simulation.Contender("b", placer=recording_placer),
+        simulation.Rules(roster="russian"),
+    )
+
+    assert placed == [10, 10]
+
+
+def test_simulate_reports_stats():
+    rules = [simulation.Rules(), simulation.Rules(firing_order=domain.FiringOrder.UNTIL_MISS)]
+
+    report = simulation.simulate(HUNTER, DENSITY, rules, games=10, seed=100)
+
+    assert report.games == 20
+    assert [r.seed for r in report.results] == [*range(100, 110)] * 2
+    assert report.wins("hunter") + report.wins("density") == 20
+    assert report.win_rate("density") > 0.5
+    assert report.games_per_second > 0
+    assert 17 <= report.mean_shots_to_win("density") <= 100
+
+
+def dataclasses_equal(a, b):
+    return {**a.__dict__, "duration": 0} == {**b.__dict__, "duration": 0}
+
+
+def test_score_intervals():
+    score = simulation.Score()
+
+    for shots, winner in [(40, "a"), (50, "a"), (60, "a"), (0, "b")]:
+        score.add(
+            simulation.GameResult(0, simulation.Rules(), winner, "a", 1, {"a": shots}, {}, 0), "a"
+        )
+
+    assert (score.games, score.wins) == (4, 3)
+    assert score.win_rate == 0.75
+    assert score.mean_shots_to_win == 50
+    low, high = score.win_rate_interval
+    assert 0 < low < 0.75 < high < 1
+    low, high = score.mean_shots_to_win_interval
+    assert low == pytest.approx(50 - 1.96 * 10 / 3**0.5)
+    assert high == pytest.approx(50 + 1.96 * 10 / 3**0.5)
+
+
+def test_empty_score():
+    score = simulation.Score()
+
+    assert score.win_rate == 0
+    assert score.win_rate_interval == (0, 1)
+    assert score.mean_shots_to_win_interval == (0, 0)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_tournament_merges_shards(workers):
+    contenders = [HUNTER, DENSITY, simulation.Contender("hunter2")]
+
+    report = simulation.run_tournament(contenders, games=10, seed=5, workers=workers, shard_size=3)
+
+    assert report.games == 30
+    assert set(report.scores) == {
+        (a.name, b.name) for a in contenders for b in contenders if a is not b
+    }
+
+    # Sharded results add up to the same games played in one go.
+    single = simulation.simulate(HUNTER, DENSITY, games=10, seed=5)
+    assert report.scores[("density", "hunter")].wins == single.wins("density")
+    assert report.scores[("hunter", "density")].wins == single.wins("hunter")
+
+    standings = report.standings()
+    assert list(standings)[0] == "density"
+    assert standings["density"].games == 20
+
+
+def test_tournament_requires_distinct_names():
+    with pytest.raises(ValueError):
+        simulation.run_tournament([HUNTER, HUNTER])
@@ -1,8 +1,14 @@
+import asyncio
 import functools
+from functools import partial
 
 import pytest
 
-from battleship.tui import BattleshipApp, Config, di
+from battleship.client import Client, ConnectionEvent
+from battleship.shared import models
+from battleship.shared.events import ServerGameEvent
+from battleship.tui import BattleshipApp, Config, di, screens, strategies
+from battleship.tui.di import container
 
 TERMINAL_SIZE = (120, 35)
 RELATIVE_APP_PATH = "../battleship/tui/app.py"
@@ -66,3 +72,158 @@ def test_singleplayer_game_screen_snapshot(snap_compare_sized):
 @pytest.mark.snap
 def test_main_screen_snapshot(snap_compare_sized):
     assert snap_compare_sized()
+
+
+START_GAME_PAYLOAD = dict(
+    enemy="enemy",
+    firing_order="alternately",
+    salvo_mode=False,
+    no_adjacent_ships=False,
+    roster=dict(name="test", items=[dict(id="1", type="ship", hp=2)]),
+)
+
+
+@pytest.fixture
+def strategy():
+    strategy = strategies.MultiplayerStrategy("player", container.resolve(Client))
+    yield strategy
+    # The client outlives the test, its listeners must not.
+    strategy._clear_handlers()
+
+
+async def _start_multiplayer_battle(app, pilot, strategy):
+    client = container.resolve(Client)
+    client._emitter.emit_future(ServerGameEvent.START_GAME, START_GAME_PAYLOAD)
+    await strategy.started()
+    await app.push_screen(screens.Game(strategy=strategy))
+
+    for player in ("player", "enemy"):
+        client._emitter.emit_future(ServerGameEvent.FLEET_READY, dict(player=player))
+
+    client._emitter.emit_future(
+        ServerGameEvent.AWAITING_MOVE, dict(actor="player", subject="enemy")
+    )
+    await pilot.pause()
+    return client, app.screen
+
+
+async def _reconnect(client, pilot):
+    client._emitter.emit_future(ConnectionEvent.CONNECTION_LOST)
+    await pilot.pause()
+    client._emitter.emit_future(ConnectionEvent.CONNECTION_ESTABLISHED)
+    await pilot.pause()
+
+
+async def test_multiplayer_game_continues_after_reconnect(monkeypatch, strategy):
+    cancelled = []
+    app = BattleshipApp()
+
+    async with app.run_test() as pilot:
+        client, game_screen = await _start_multiplayer_battle(app, pilot, strategy)
+        monkeypatch.setattr(client, "cancel_game", partial(_record, cancelled))
+
+        await _reconnect(client, pilot)
+        # The server tells whose move it is after a reconnect.
+        client._emitter.emit_future(
+            ServerGameEvent.AWAITING_MOVE, dict(actor="enemy", subject="player")
+        )
+        await pilot.pause()
+
+        assert app.screen is game_screen
+        assert game_screen.player_board.player_attacks is False
+
+        client._emitter.emit_future(
+            ServerGameEvent.AWAITING_MOVE, dict(actor="player", subject="enemy")
+        )
+        await pilot.pause()
+
+        assert app.screen is game_screen
+        assert game_screen.player_board.player_attacks is True
+        assert not cancelled
+
+
+async def test_multiplayer_game_is_cancelled_if_not_resumed(monkeypatch, strategy):
+    cancelled = []
+    monkeypatch.setattr(strategies.MultiplayerStrategy, "RESUME_TIMEOUT", 0.1)
+    app = BattleshipApp()
+
+    async with app.run_test() as pilot:
+        client, game_screen = await _start_multiplayer_battle(app, pilot, strategy)
+        monkeypatch.setattr(client, "cancel_game", partial(_record, cancelled))
+
+        await _reconnect(client, pilot)
+        await asyncio.sleep(0.2)
+        await pilot.pause()
+
+        assert app.screen is not game_screen
+        assert cancelled
+
+
+def _make_salvo(actor, subject, shots):
+    return models.Salvo(
+        actor=models.Player(name=actor, ships_alive=1),
+        subject=models.Player(name=subject, ships_alive=1),
+        shots=shots,
+    ).to_json()
+
+
+async def test_multiplayer_game_state_is_restored_after_reconnect(monkeypatch, strategy):
+    cancelled = []
+    app = BattleshipApp()
+
+    async with app.run_test() as pilot:
+        client, game_screen = await _start_multiplayer_battle(app, pilot, strategy)
+        monkeypatch.setattr(client, "cancel_game", partial(_record, cancelled))
+
+        await _reconnect(client, pilot)
+        # Both players fired while the connection was lost.
+        ship = models.Ship(id="1", type="ship", destroyed=False, cells=["A1", "A2"])
+        state = dict(
+            ships={"1": ["A1", "A2"]},
+            fleets_ready=["player", "enemy"],
+            salvos=[
+                _make_salvo(
+                    "player", "enemy", [models.Shot(coordinate="B2", hit=False, ship=None)]
+                ),
+                _make_salvo("enemy", "player", [models.Shot(coordinate="A1", hit=True, ship=ship)]),
+            ],
+        )
+        client._emitter.emit_future(ServerGameEvent.GAME_STATE, state)
+        client._emitter.emit_future(
+            ServerGameEvent.AWAITING_MOVE, dict(actor="player", subject="enemy")
+        )
+        await pilot.pause()
+
+        assert app.screen is game_screen
+        assert game_screen.player_fleet._ships["1"].hp == 1
+        assert game_screen.player_fleet.ships_alive == 1
+        assert game_screen.enemy_fleet._ships["1"].hp == 2
+        assert game_screen.players_ready == 2
+        assert game_screen.player_board.player_attacks is True
+        assert not cancelled
+
+
+async def test_multiplayer_game_ended_while_disconnected(monkeypatch, strategy):
+    cancelled = []
+    monkeypatch.setattr(strategies.MultiplayerStrategy, "RESUME_TIMEOUT", 0.1)
+    app = BattleshipApp()
+
+    async with app.run_test() as pilot:
+        client, game_screen = await _start_multiplayer_battle(app, pilot, strategy)
+        monkeypatch.setattr(client, "cancel_game", partial(_record, cancelled))
+
+        await _reconnect(client, pilot)
+        client._emitter.emit_future(
+            ServerGameEvent.GAME_ENDED,
+            dict(winner="enemy", summary=models.GameSummary(winner="enemy").to_json()),
+        )
+        await asyncio.sleep(0.2)
+        await pilot.pause()
+
+        assert app.screen is game_screen
+        assert game_screen.game_ended
+        assert not cancelled
+
+
+async def _record(calls):
+    calls.append(True)
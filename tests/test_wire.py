@@ -0,0 +1,162 @@
+import pytest
+
+from battleship.shared import models, wire
+from battleship.shared.events import (
+    ClientGameEvent,
+    EntityEvent,
+    GameEvent,
+    Message,
+    ServerGameEvent,
+)
+
+
+def make_salvo() -> str:
+    salvo = models.Salvo(
+        actor=models.Player(name="Player", ships_alive=5),
+        subject=models.Player(name="Игрок", ships_alive=4),
+        shots=[
+            models.Shot(coordinate="A1", hit=False, ship=None),
+            models.Shot(
+                coordinate="J10",
+                hit=True,
+                ship=models.Ship(id="2", type="destroyer", destroyed=True, cells=["J9", "J10"]),
+            ),
+            models.Shot(
+                coordinate="C3",
+                hit=True,
+                ship=models.Ship(id="1", type="carrier", destroyed=False, cells=["C3"]),
+            ),
+        ],
+    )
+    return salvo.to_json()
+
+
+@pytest.mark.parametrize(
+    "type_,payload",
+    [
+        (ClientGameEvent.FIRE, dict(position=["A1", "J10"])),
+        (ClientGameEvent.SPAWN_SHIP, dict(ship_id="1", position=["B2", "B3", "B4"])),
+        (ServerGameEvent.AWAITING_MOVE, dict(actor="Player", subject="Игрок")),
+        (ServerGameEvent.SHIP_SPAWNED, dict(player="Player", ship_id="3", position=["E5"])),
+    ],
+)
+def test_game_event_round_trip(type_, payload):
+    message = Message(event=GameEvent(type=type_, payload=payload))
+
+    frame = wire.encode(message)
+
+    assert frame[0] == wire.KIND_GAME_EVENT
+    assert wire.decode(frame) == message
+
+
+def test_salvo_round_trip():
+    salvo = make_salvo()
+    message = Message(event=GameEvent(type=ServerGameEvent.SALVO, payload=dict(salvo=salvo)))
+
+    frame = wire.encode(message)
+    decoded = wire.decode(frame)
+
+    assert frame[0] == wire.KIND_GAME_EVENT
+    assert decoded.unwrap().type == ServerGameEvent.SALVO
+    assert models.Salvo.from_raw(decoded.unwrap().payload["salvo"]) == models.Salvo.from_raw(salvo)
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        # Not packed at all.
+        GameEvent(type=ServerGameEvent.START_GAME, payload=dict(enemy="Enemy")),
+        EntityEvent(entity="session", entity_id="1", action="add", payload=dict(name="Game")),
+        # Packed type, but the payload doesn't fit the layout.
+        GameEvent(type=ClientGameEvent.FIRE, payload=dict(position=["A1"], extra=1)),
+        GameEvent(type=ClientGameEvent.FIRE, payload=dict(position=["Z99"])),
+        GameEvent(type=ServerGameEvent.AWAITING_MOVE, payload=dict(actor="a" * 256, subject="b")),
+        GameEvent(type=ClientGameEvent.FIRE, payload=dict(position=["A1"]), session_id="1"),
+    ],
+)
+def test_json_frame_round_trip(event):
+    message = Message(event=event)
+
+    frame = wire.encode(message)
+
+    assert frame[0] == wire.KIND_JSON
+    assert frame[1:] == message.to_json().encode()
+    assert wire.decode(frame) == message
+
+
+def test_message_is_encoded_once():
+    message = Message(event=GameEvent(type=ClientGameEvent.FIRE, payload=dict(position=["A1"])))
+
+    assert wire.encode(message) is wire.encode(message)
+
+
+@pytest.mark.parametrize(
+    "type_,payload",
+    [
+        (ClientGameEvent.FIRE, dict(position=["A1", "J10"])),
+        (ServerGameEvent.AWAITING_MOVE, dict(actor="Player", subject="Игрок")),
+        (ServerGameEvent.SALVO, dict(salvo=make_salvo())),
+    ],
+)
+def test_truncated_frame_is_rejected(type_, payload):
+    frame = wire.encode(Message(event=GameEvent(type=type_, payload=payload)))
+
+    for end in range(len(frame)):
+        with pytest.raises(wire.WireError):
+            wire.decode(frame[:end])
+
+
+def test_frame_of_unknown_kind_is_rejected():
+    frame = wire.encode(
+        Message(event=GameEvent(type=ClientGameEvent.FIRE, payload=dict(position=["A1"])))
+    )
+
+    with pytest.raises(wire.WireError, match="Unknown frame kind"):
+        wire.decode(bytes([255]) + frame[1:])
+
+
+def test_frame_of_unknown_event_type_is_rejected():
+    frame = wire.encode(
+        Message(event=GameEvent(type=ClientGameEvent.FIRE, payload=dict(position=["A1"])))
+    )
+
+    with pytest.raises(wire.WireError):
+        wire.decode(frame[:1] + bytes([255]) + frame[2:])
+
+
+def test_frame_with_trailing_bytes_is_rejected():
+    frame = wire.encode(
+        Message(event=GameEvent(type=ClientGameEvent.FIRE, payload=dict(position=["A1"])))
+    )
+
+    with pytest.raises(wire.WireError, match="Trailing bytes"):
+        wire.decode(frame + b"\x00")
+
+
+def test_frame_with_string_out_of_frame_is_rejected():
+    payload = dict(actor="Player", subject="Enemy")
+    frame = wire.encode(
+        Message(event=GameEvent(type=ServerGameEvent.AWAITING_MOVE, payload=payload))
+    )
+    # Length of the first string points past the end of the frame.
+    corrupted = frame[:2] + bytes([len(frame)]) + frame[3:]
+
+    with pytest.raises(wire.WireError, match="out of frame"):
+        wire.decode(corrupted)
+
+
+def test_frame_with_invalid_utf8_is_rejected():
+    payload = dict(actor="Player", subject="Enemy")
+    frame = wire.encode(
+        Message(event=GameEvent(type=ServerGameEvent.AWAITING_MOVE, payload=payload))
+    )
+    corrupted = frame[:3] + b"\xff" + frame[4:]
+
+    with pytest.raises(wire.WireError):
+        wire.decode(corrupted)
+
+
+@pytest.mark.parametrize("data", [b"{", b'{"event": {"message_type": "unknown"}}', b"\xff"])
+def test_corrupted_json_frame_is_rejected(data):
+    with pytest.raises(ValueError):
+        wire.decode(bytes([wire.KIND_JSON]) + data)
@@ -0,0 +1,83 @@
+"""
+Compares encoding and decoding of websocket messages with the message
+models as they were before game event types got a dedicated validator.
+"""
+
+import argparse
+import timeit
+from functools import partial
+from typing import Any, Literal
+
+from pydantic import Field
+from rich.console import Console
+from rich.table import Table
+
+from battleship.shared.events import (
+    ClientDisconnectedEvent,
+    ClientGameEvent,
+    EntityEvent,
+    GameEvent,
+    Message,
+    NotificationEvent,
+    ServerGameEvent,
+)
+from battleship.shared.models import BaseModel
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--number", default=20000, type=int)
+
+
+class LegacyGameEvent(BaseModel):
+    message_type: Literal["game_event"] = "game_event"
+    type: ServerGameEvent | ClientGameEvent
+    session_id: str | None = None
+    payload: dict[str, Any] = {}
+
+
+class LegacyMessage(BaseModel):
+    event: NotificationEvent | LegacyGameEvent | EntityEvent | ClientDisconnectedEvent = Field(
+        ..., discriminator="message_type"
+    )
+
+
+SALVO = (
+    '{"actor":{"name":"alice","ships_alive":5},"subject":{"name":"bob","ships_alive":4},'
+    '"shots":[{"coordinate":"C7","hit":true,"ship":{"id":"2","type":"battleship","hp":3,'
+    '"destroyed":false}}]}'
+)
+
+EVENTS = {
+    "fire": GameEvent(type=ClientGameEvent.FIRE, payload=dict(position=["C7"])),
+    "salvo": GameEvent(type=ServerGameEvent.SALVO, payload=dict(salvo=SALVO)),
+    "awaiting_move": GameEvent(
+        type=ServerGameEvent.AWAITING_MOVE, payload=dict(actor="alice", subject="bob")
+    ),
+}
+
+
+def measure(number: int) -> Table:
+    table = Table(title="Microseconds per message")
+    table.add_column("Event")
+
+    for column in ("Decode, legacy", "Decode", "Encode, legacy", "Encode"):
+        table.add_column(column, justify="right")
+
+    for name, event in EVENTS.items():
+        message = Message(event=event)
+        frame = message.to_json()
+        legacy = LegacyMessage.from_raw(frame)
+        timings = [
+            timeit.timeit(partial(LegacyMessage.from_raw, frame), number=number),
+            timeit.timeit(partial(Message.from_raw, frame), number=number),
+            timeit.timeit(legacy.model_dump_json, number=number),
+            # Bypass the cache of the encoded frame.
+            timeit.timeit(message.model_dump_json, number=number),
+        ]
+        table.add_row(name, *(f"{timing / number * 1e6:.2f}" for timing in timings))
+
+    return table
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    Console().print(measure(args.number))
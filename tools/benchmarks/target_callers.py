@@ -0,0 +1,76 @@
+"""
+Times every turn of games played by the density target caller, so the
+worst turn can be checked against the time the AI is allowed to think.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from battleship.engine import ai, domain, rosters
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--games", default=10, type=int)
+parser.add_argument("--seed", default=42, type=int)
+
+
+def random_board(roster: rosters.Roster, no_adjacent_ships: bool) -> domain.BitBoard:
+    board = domain.BitBoard()
+    fleet = ai.Autoplacer(board, roster, no_adjacent_ships).place_fleet()
+
+    for item in roster:
+        board.place_ship(fleet[item.id], domain.Ship(*item), no_adjacent_ships=no_adjacent_ships)
+
+    return board
+
+
+def time_turns(roster: rosters.Roster, no_adjacent_ships: bool) -> list[float]:
+    board = random_board(roster, no_adjacent_ships)
+    caller = ai.DensityTargetCaller(board, roster, no_adjacent_ships)
+    turns = []
+
+    while any(not ship.destroyed for ship in board.ships):
+        start = time.perf_counter()
+        [target] = caller.call_out()
+        elapsed = time.perf_counter() - start
+
+        coordinate = domain.Coordinate.from_human(target)
+        ship = board.hit_cell(coordinate)
+        shot = domain.Shot(coordinate, hit=ship is not None, ship=ship)
+
+        start = time.perf_counter()
+        caller.provide_feedback([shot])
+        turns.append(elapsed + time.perf_counter() - start)
+
+    return turns
+
+
+def measure(games: int, seed: int) -> Table:
+    table = Table(title="Milliseconds per turn")
+    table.add_column("Roster")
+    table.add_column("No adjacent ships")
+
+    for column in ("Median", "Worst"):
+        table.add_column(column, justify="right")
+
+    for name, roster in rosters.get_rosters().items():
+        for no_adjacent_ships in (False, True):
+            random.seed(seed)
+            turns = [turn for _ in range(games) for turn in time_turns(roster, no_adjacent_ships)]
+            timings = [statistics.median(turns), max(turns)]
+            table.add_row(
+                name,
+                str(no_adjacent_ships),
+                *(f"{timing * 1e3:.3f}" for timing in timings),
+            )
+
+    return table
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    Console().print(measure(args.games, args.seed))